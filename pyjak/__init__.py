@@ -1,8 +1,51 @@
+from types import ModuleType as _ModuleType
 from pyjak.convert import (
-    BinaryError, BinarySizeMismatch,
+    BinaryError, BinarySizeMismatch, ChecksumMismatch,
     parse_int8, parse_uint8, parse_int16, parse_uint16, parse_int32,
     parse_uint32, parse_int64, parse_uint64, parse_float32, parse_float64,
     parse_bool, dump_int8, dump_uint8, dump_int16, dump_uint16, dump_int32,
     dump_uint32, dump_int64, dump_uint64, dump_float32, dump_float64,
-    dump_bool)
+    dump_bool, parse_int8_array, parse_uint8_array, parse_bool_array,
+    dump_int8_array, dump_uint8_array, dump_bool_array)
 from pyjak.order import ByteOrder
+from pyjak.datatype import DataType
+from pyjak.spec import parse, dump, sizeof
+
+# Everything else is imported on first use, so that "import pyjak" stays
+# cheap for short-lived processes that only convert single values.
+_LAZY_MODULES = {
+    "pyjak.bulk": (
+        "byteswap", "to_order", "parse_array", "dump_array", "check_range",
+        "OverflowMode", "RangeReport"),
+    "pyjak.gather": ("GatherWriter",),
+    "pyjak.layout": (
+        "Layout", "Padding", "Conditional", "CountedArray", "PrefixedString"),
+    "pyjak.columns": ("encode_columns",),
+    "pyjak.delta": ("SequenceEncoding", "encode_sequence", "decode_sequence"),
+    "pyjak.container": ("save_array", "load_array"),
+    "pyjak.stream": ("Compression", "BinaryReader", "BinaryWriter"),
+    "pyjak.checksum": ("Checksum",),
+    "pyjak.ring": ("SharedRing",),
+}
+_LAZY = {
+    name: module for module, names in _LAZY_MODULES.items() for name in names}
+
+__all__ = [
+    name for name, value in globals().items()
+    if not name.startswith("_") and not isinstance(value, _ModuleType)]
+__all__ += list(_LAZY)
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(
+            "module 'pyjak' has no attribute '{0}'".format(name))
+    from importlib import import_module
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
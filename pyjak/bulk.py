@@ -0,0 +1,432 @@
+import array
+import math
+from collections import namedtuple
+from enum import Enum
+from pyjak.convert import (
+    BinaryError, BinarySizeMismatch, _DUMP_FUNCS, _byte_view, _sequence)
+from pyjak.datatype import (
+    DataType, _BOUNDS, _INTEGER_TYPES, _RANGES, _TYPECODES, _data_type)
+from pyjak.order import ByteOrder, _byte_order
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class OverflowMode(Enum):
+    """
+    Enumeration of the ways values out of the range of a data type are
+    handled when dumping whole sequences.
+    """
+    # Out of range values raise BinarySizeMismatch.
+    RAISE = "raise"
+
+    # Out of range values are clipped to the nearest value the data type can
+    # hold. Infinities are kept as they are.
+    SATURATE = "saturate"
+
+    # Out of range integers wrap around, keeping their lowest bits. Only
+    # supported by the integer types.
+    WRAP = "wrap"
+
+
+class RangeReport(namedtuple(
+        "RangeReport", ["first_index", "count", "minimum", "maximum"])):
+    """
+    The result of check_range.
+    Args:
+        first_index: The index of the first value out of range, or None if
+            every value fits.
+        count: The number of values out of range.
+        minimum: The smallest value, or None if there are no values.
+        maximum: The largest value, or None if there are no values.
+    """
+    __slots__ = ()
+
+
+def byteswap(buffer, _type, inplace=True):
+    """
+    Swaps the byte order of every element in a given byte array.
+    Args:
+        buffer: The byte array holding the elements. Can be any object
+            supporting the buffer protocol, such as a bytearray, memoryview
+            or mmap.
+        _type: The DataType of the elements in the byte array.
+        inplace: If True, the elements are swapped in the byte array itself.
+            Otherwise a swapped copy is returned and the byte array is left
+            untouched.
+    Raises:
+        TypeError: If buffer is not bytes-like, if _type is not a DataType or
+            if inplace is True and buffer is read-only.
+        BinarySizeMismatch: If length of byte array is not a multiple of the
+            size of _type.
+    Returns:
+        buffer if inplace is True, otherwise a new bytearray holding the
+        swapped elements.
+    """
+    _type = _data_type(_type)
+    with _byte_view(buffer) as view:
+        _check_length(view, _type)
+        if not inplace:
+            swapped = bytearray(view)
+            with memoryview(swapped) as swapped_view:
+                _swap_view(swapped_view, _type.size)
+            return swapped
+        if view.readonly:
+            raise TypeError(
+                "Expected object of writable bytes-like type, not '{0}'."
+                .format(type(buffer).__name__))
+        _swap_view(view, _type.size)
+    return buffer
+
+
+def to_order(buffer, _type, from_order, to_order, inplace=True):
+    """
+    Converts every element in a given byte array from one byte order to
+    another. Nothing is swapped if both byte orders are equal.
+    Args:
+        buffer: The byte array holding the elements. Can be any object
+            supporting the buffer protocol, such as a bytearray, memoryview
+            or mmap.
+        _type: The DataType of the elements in the byte array.
+        from_order: The current byte order of the elements. Defaults to
+            native order.
+        to_order: The wanted byte order of the elements. Defaults to native
+            order.
+        inplace: If True, the elements are converted in the byte array itself.
+            Otherwise a converted copy is returned and the byte array is left
+            untouched.
+    Raises:
+        TypeError: If buffer is not bytes-like, if _type is not a DataType, if
+            either order is not a ByteOrder or if inplace is True and buffer
+            is read-only.
+        BinarySizeMismatch: If length of byte array is not a multiple of the
+            size of _type.
+    Returns:
+        buffer if inplace is True, otherwise a new bytearray holding the
+        converted elements.
+    """
+    if _byte_order(from_order) != _byte_order(to_order):
+        return byteswap(buffer, _type, inplace)
+    _type = _data_type(_type)
+    with _byte_view(buffer) as view:
+        _check_length(view, _type)
+        if not inplace:
+            return bytearray(view)
+    return buffer
+
+
+def parse_array(_bytes, _type, order=None):
+    """
+    Parses a given byte array as consecutive values of a given data type.
+    Args:
+        _bytes: The byte array to be parsed.
+        _type: The DataType of the values.
+        order: The byte order of the byte array. Defaults to native order.
+    Raises:
+        TypeError: If byte array is not bytes-like or _type is not a
+            DataType.
+        BinarySizeMismatch: If length of byte array is not a multiple of the
+            size of _type.
+    Returns:
+        A list of the values that were parsed.
+    """
+    _type = _data_type(_type)
+    order = _byte_order(order)
+    with _byte_view(_bytes) as view:
+        _check_length(view, _type)
+        if _type == DataType.BOOL:
+            return list(map(bool, view))
+        values = array.array(_TYPECODES[_type])
+        values.frombytes(view)
+    if order != ByteOrder.NATIVE and _type.size > 1:
+        values.byteswap()
+    return values.tolist()
+
+
+def dump_array(values, _type, order=None, overflow=OverflowMode.RAISE):
+    """
+    Serializes a given sequence of values as consecutive values of a given
+    data type. Accepts lists, array.array objects and NumPy arrays.
+    Args:
+        values: The values to be serialized.
+        _type: The DataType of the values.
+        order: The byte order of the returned byte array. Defaults to native
+            order.
+        overflow: The OverflowMode deciding what happens to values out of the
+            range of _type. Defaults to RAISE.
+    Raises:
+        TypeError: If any value is of the wrong type, _type is not a DataType
+            or overflow is not an OverflowMode.
+        ValueError: If overflow is WRAP and _type is not an integer type.
+        BinarySizeMismatch: If any value is too small or too big to be held
+            by _type, and overflow is RAISE.
+        BinaryError: If an unexpected conversion error occurs.
+    Returns:
+        A byte array containing the serialized values.
+    """
+    _type = _data_type(_type)
+    if not isinstance(overflow, OverflowMode):
+        raise TypeError(
+            "Expected object of OverflowMode type, not '{0}'."
+            .format(type(overflow).__name__))
+    if overflow == OverflowMode.WRAP and _type not in _INTEGER_TYPES:
+        raise ValueError(
+            "Overflow mode WRAP is not supported by {0}.".format(_type))
+    return _pack_values(
+        values, _type, _byte_order(order), "value at index {0}".format,
+        overflow)
+
+
+def check_range(values, _type):
+    """
+    Checks whether every value of a given sequence fits a given data type,
+    without serializing anything. Infinities and NaN fit the floating point
+    types. Values that are not integers, such as floats, never fit the
+    integer types, and values that are not bools never fit the bool type, as
+    dump_array rejects them. Values are compared to the
+    bounds of the data type in bulk, using NumPy for NumPy arrays and
+    array.array objects when it is installed.
+    Args:
+        values: The values to be checked. Accepts lists, array.array objects
+            and NumPy arrays.
+        _type: The DataType to check the values against.
+    Raises:
+        TypeError: If any value is not a number, or _type is not a DataType.
+    Returns:
+        A RangeReport of the values. NaN is left out of its minimum and
+        maximum.
+    """
+    _type = _data_type(_type)
+    if numpy is not None:
+        if (isinstance(values, array.array) and
+                values.typecode in _NUMERIC_TYPECODES):
+            values = numpy.frombuffer(values, values.typecode)
+        if isinstance(values, numpy.ndarray):
+            return _check_ndarray(values, _type)
+    values = _sequence(values)
+    if not values:
+        return RangeReport(None, 0, None, None)
+    low, high = _RANGES[_type]
+    integral = _type in _INTEGER_TYPES
+    try:
+        minimum = min(values)
+        maximum = max(values)
+        if minimum != minimum or maximum != maximum:
+            # min and max only return NaN when it comes first.
+            numbers = [value for value in values if value == value]
+            minimum = min(numbers, default=None)
+            maximum = max(numbers, default=None)
+        if _type == DataType.BOOL:
+            invalid = [
+                index for index, value in enumerate(values)
+                if type(value) not in _BOOL_TYPES]
+        elif (minimum is not None and low <= minimum and maximum <= high and
+                (not integral or all(map(_is_integer, set(map(
+                    type, values)))))):
+            return RangeReport(None, 0, minimum, maximum)
+        else:
+            kept = _INFINITIES if not integral else ()
+            invalid = [
+                index for index, value in enumerate(values)
+                if (value < low or value > high) and value not in kept or
+                integral and not _is_integer(value)]
+    except TypeError:
+        _raise_not_number(values)
+    if not invalid:
+        return RangeReport(None, 0, minimum, maximum)
+    return RangeReport(invalid[0], len(invalid), minimum, maximum)
+
+
+def _check_ndarray(values, _type):
+    kind = values.dtype.kind
+    if kind not in "biuf":
+        raise TypeError(
+            "Expected array of number-like type, not '{0}'."
+            .format(values.dtype))
+    values = values.ravel()
+    if values.size == 0:
+        return RangeReport(None, 0, None, None)
+    numbers = values[~numpy.isnan(values)] if kind == "f" else values
+    minimum = numbers.min().item() if numbers.size else None
+    maximum = numbers.max().item() if numbers.size else None
+    low, high = _RANGES[_type]
+    if (kind == "f" and _type in _INTEGER_TYPES or
+            kind != "b" and _type == DataType.BOOL):
+        return RangeReport(0, values.size, minimum, maximum)
+    if minimum is None or (low <= minimum and maximum <= high):
+        return RangeReport(None, 0, minimum, maximum)
+    with numpy.errstate(invalid="ignore"):
+        invalid = (values < low) | (values > high)
+    if kind == "f" and _type not in _INTEGER_TYPES:
+        invalid &= ~numpy.isinf(values)
+    count = int(invalid.sum())
+    if count == 0:
+        return RangeReport(None, 0, minimum, maximum)
+    return RangeReport(int(invalid.argmax()), count, minimum, maximum)
+
+
+def _is_integer(value):
+    # Holds for int, bool and NumPy integers, which dump_array accepts for the
+    # integer types, as well as for their types.
+    return hasattr(value, "__index__")
+
+
+def _raise_not_number(values):
+    for index, value in enumerate(values):
+        try:
+            value < 0
+        except TypeError:
+            raise TypeError(
+                "Could not check value at index {0}: Expected object of "
+                "number-like type, not '{1}'."
+                .format(index, type(value).__name__))
+    raise TypeError("Could not compare values.")
+
+
+def _pack_values(values, _type, order, describe,
+                 overflow=OverflowMode.RAISE):
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return _pack_ndarray(values, _type, order, describe, overflow)
+    values = _sequence(values)
+    if _type == DataType.BOOL:
+        if not set(map(type, values)) <= _BOOL_TYPES:
+            _raise_invalid(values, _type, order, describe)
+        return bytes(values)
+    try:
+        packed = array.array(_TYPECODES[_type], values)
+    except (TypeError, OverflowError) as e:
+        if overflow == OverflowMode.RAISE or isinstance(e, TypeError):
+            _raise_invalid(values, _type, order, describe, e)
+        values = _fit_values(values, _type, overflow)
+        try:
+            packed = array.array(_TYPECODES[_type], values)
+        except (TypeError, OverflowError) as e:
+            _raise_invalid(values, _type, order, describe, e)
+    # Unlike struct, array silently turns too big float32 values into inf.
+    if _type == DataType.FLOAT32 and (
+            math.inf in packed or -math.inf in packed):
+        if overflow == OverflowMode.SATURATE:
+            packed = array.array(
+                _TYPECODES[_type], _fit_values(values, _type, overflow))
+        else:
+            _find_invalid(values, _type, order, describe)
+    if order != ByteOrder.NATIVE and _type.size > 1:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _pack_ndarray(values, _type, order, describe, overflow):
+    dtype = _numpy_dtype(_type, order)
+    kind = values.dtype.kind
+    if kind not in "biuf":
+        # Arrays of objects, as pandas often produces, hold Python values.
+        return _pack_values(
+            values.ravel().tolist(), _type, order, describe, overflow)
+    if _type == DataType.BOOL:
+        if kind != "b":
+            _raise_invalid(values.tolist(), _type, order, describe)
+    elif _type in _BOUNDS:
+        if kind not in "biu":
+            _raise_invalid(values.tolist(), _type, order, describe)
+        low, high = _BOUNDS[_type]
+        if values.size and (values.min() < low or values.max() > high):
+            if overflow == OverflowMode.RAISE:
+                _raise_invalid(values.tolist(), _type, order, describe)
+            if overflow == OverflowMode.SATURATE:
+                info = numpy.iinfo(values.dtype)
+                values = numpy.clip(
+                    values, max(low, info.min), min(high, info.max))
+            # Otherwise the integer cast below wraps values around.
+    with numpy.errstate(over="ignore"):
+        packed = values.astype(dtype)
+        if _type == DataType.FLOAT32 and numpy.isinf(packed).any():
+            if overflow == OverflowMode.SATURATE:
+                low, high = _RANGES[_type]
+                packed = numpy.where(
+                    numpy.isinf(values), values,
+                    numpy.clip(values, low, high)).astype(dtype)
+            else:
+                _find_invalid(values.tolist(), _type, order, describe)
+    return packed.tobytes()
+
+
+def _fit_values(values, _type, overflow):
+    low, high = _RANGES[_type]
+    kinds = _FITTED_TYPES if _type == DataType.FLOAT32 else _INT_TYPES
+    fitted = list(values)
+    for index, value in enumerate(fitted):
+        if (type(value) in kinds and (value < low or value > high) and
+                value not in _INFINITIES):
+            if overflow == OverflowMode.SATURATE:
+                fitted[index] = low if value < low else high
+            else:
+                fitted[index] = ((value - low) & (high - low)) + low
+    return fitted
+
+
+def _raise_invalid(values, _type, order, describe, error=None):
+    _find_invalid(values, _type, order, describe)
+    # Every value was accepted by the dump functions, so the first value the
+    # bulk conversion rejects on its own is reported.
+    if _type in _TYPECODES:
+        for index, value in enumerate(values):
+            try:
+                array.array(_TYPECODES[_type], [value])
+            except (TypeError, OverflowError) as e:
+                raise BinaryError("Could not dump {0}: {1}".format(
+                    describe(index), e)) from e
+    raise BinaryError("Could not dump values from {0}.".format(
+        describe(0))) from error
+
+
+def _find_invalid(values, _type, order, describe):
+    dump_func = _DUMP_FUNCS[_type]
+    for index, value in enumerate(values):
+        try:
+            if _type.size == 1:
+                dump_func(value)
+            else:
+                dump_func(value, order)
+        except (TypeError, BinaryError) as e:
+            raise type(e)("Could not dump {0}: {1}".format(
+                describe(index), e)) from e
+
+
+def _numpy_dtype(_type, order):
+    prefix = "<" if order == ByteOrder.LITTLE else ">"
+    return numpy.dtype(prefix + _type.format)
+
+
+def _check_length(view, _type):
+    if len(view) % _type.size != 0:
+        raise BinarySizeMismatch(
+            "Length of byte array is {0}, expected a multiple of {1}."
+            .format(len(view), _type.size))
+
+
+def _swap_view(view, size):
+    if size == 1 or len(view) == 0:
+        return
+    if numpy is not None:
+        numpy.frombuffer(view, numpy.dtype("u{0}".format(size))).byteswap(
+            inplace=True)
+        return
+    values = array.array(_SWAP_TYPECODES[size])
+    values.frombytes(view)
+    values.byteswap()
+    with memoryview(values) as values_view:
+        view[:] = values_view.cast("B")
+
+
+_BOOL_TYPES = frozenset((bool,))
+_INT_TYPES = frozenset((int,))
+_FITTED_TYPES = frozenset((int, float))
+_INFINITIES = (math.inf, -math.inf)
+_NUMERIC_TYPECODES = frozenset("bBhHiIlLqQfd")
+
+_SWAP_TYPECODES = {}
+for _typecode in "BHILQ":
+    _SWAP_TYPECODES.setdefault(array.array(_typecode).itemsize, _typecode)
+del _typecode
@@ -0,0 +1,33 @@
+import zlib
+from enum import Enum
+
+
+class Checksum(Enum):
+    """
+    Enumeration of the checksums that can be computed while reading and
+    writing.
+    """
+    # Represents a CRC-32 checksum, as computed by zlib.crc32.
+    CRC32 = "crc32"
+
+    # Represents an Adler-32 checksum, as computed by zlib.adler32.
+    ADLER32 = "adler32"
+
+
+def _checksum(checksum):
+    if not isinstance(checksum, Checksum):
+        raise TypeError(
+            "Expected object of Checksum type, not '{0}'."
+            .format(type(checksum).__name__))
+    return _FUNCS[checksum], _INITIAL_VALUES[checksum]
+
+
+_FUNCS = {
+    Checksum.CRC32: zlib.crc32,
+    Checksum.ADLER32: zlib.adler32,
+}
+
+_INITIAL_VALUES = {
+    Checksum.CRC32: 0,
+    Checksum.ADLER32: 1,
+}
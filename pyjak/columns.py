@@ -0,0 +1,89 @@
+from pyjak.bulk import _pack_values, numpy
+from pyjak.convert import BinarySizeMismatch
+from pyjak.datatype import DataType
+from pyjak.layout import Padding
+from pyjak.order import _byte_order
+
+
+def encode_columns(columns, layout, order=None):
+    """
+    Serializes columns of values as consecutive records of a given layout.
+    The exact size of the output is computed up front and every column is
+    written into a single preallocated byte array.
+    Args:
+        columns: A mapping of field names to columns, or a sequence of columns
+            in the order of the named fields of the layout. Columns can be
+            lists, array.array objects or NumPy arrays.
+        layout: The Layout of the records. Must only consist of DataType and
+            Padding fields.
+        order: The byte order of the returned byte array. Defaults to native
+            order.
+    Raises:
+        ValueError: If the layout holds other fields than DataType and
+            Padding, or the number of columns does not match the layout.
+        KeyError: If a column is missing from the mapping.
+        TypeError: If any value is of the wrong type.
+        BinarySizeMismatch: If the columns differ in length, or any value is
+            too small or too big to be held by its field. The message names
+            the field and row.
+        BinaryError: If an unexpected conversion error occurs.
+    Returns:
+        A bytearray containing the serialized records.
+    """
+    order = _byte_order(order)
+    fields = _column_fields(layout)
+    if hasattr(columns, "keys"):
+        columns = [columns[name] for name, _, _ in fields]
+    elif len(columns) != len(fields):
+        raise ValueError(
+            "Expected {0} columns, got {1}.".format(len(fields), len(columns)))
+    rows = len(columns[0]) if columns else 0
+    for (name, _, _), column in zip(fields, columns):
+        if len(column) != rows:
+            raise BinarySizeMismatch(
+                "Column '{0}' has {1} rows, expected {2}."
+                .format(name, len(column), rows))
+    record_size = layout.size
+    output = bytearray(rows * record_size)
+    records = None
+    if numpy is not None and rows:
+        records = numpy.frombuffer(output, _record_dtype(fields, record_size))
+    for (name, _type, offset), column in zip(fields, columns):
+        packed = _pack_values(
+            column, _type, order,
+            lambda row, name=name: "field '{0}' in row {1}".format(name, row))
+        if records is not None:
+            records[name] = numpy.frombuffer(packed, records.dtype[name])
+        elif record_size == _type.size:
+            output[:] = packed
+        else:
+            # Each byte lane of the column is copied with one strided slice.
+            for lane in range(_type.size):
+                output[offset + lane::record_size] = packed[
+                    lane::_type.size]
+    return output
+
+
+def _column_fields(layout):
+    fields = []
+    offset = 0
+    for name, element in layout.fields:
+        if isinstance(element, DataType):
+            fields.append((name, element, offset))
+        elif not isinstance(element, Padding):
+            raise ValueError(
+                "Expected layout of DataType and Padding fields only, not "
+                "{0!r}.".format(element))
+        offset += element.size
+    return fields
+
+
+def _record_dtype(fields, record_size):
+    # Byte order is already applied by _pack_values, so fields are copied as
+    # raw bytes of the right width.
+    return numpy.dtype({
+        "names": [name for name, _, _ in fields],
+        "formats": ["V{0}".format(_type.size) for _, _type, _ in fields],
+        "offsets": [offset for _, _, offset in fields],
+        "itemsize": record_size,
+    })
@@ -0,0 +1,151 @@
+import mmap as _mmap
+import os
+from pyjak.bulk import dump_array, to_order
+from pyjak.convert import BinaryError, BinarySizeMismatch
+from pyjak.datatype import DataType, _data_type
+from pyjak.layout import Layout, Padding
+from pyjak.order import ByteOrder, _byte_order
+
+
+def save_array(path, values, _type, order=None, alignment=64):
+    """
+    Saves a given sequence of values to a pyjak array file.
+    The file starts with a header holding the magic number, format version,
+    data type, byte order, alignment and number of values, all in little
+    endian order. The values follow as raw binary data, starting at the
+    first multiple of the alignment.
+    Args:
+        path: The path of the file to be written.
+        values: The values to be saved. Accepts lists, array.array objects and
+            NumPy arrays.
+        _type: The DataType of the values.
+        order: The byte order of the values in the file. Defaults to native
+            order.
+        alignment: The alignment in bytes of the values in the file. Must be
+            a power of two. Defaults to 64.
+    Raises:
+        TypeError: If any value is of the wrong type, or _type is not a
+            DataType.
+        ValueError: If alignment is not a power of two.
+        BinarySizeMismatch: If any value is too small or too big to be held
+            by _type.
+        BinaryError: If an unexpected conversion error occurs.
+    """
+    _type = _data_type(_type)
+    order = _byte_order(order)
+    if not _is_power_of_two(alignment):
+        raise ValueError(
+            "Alignment must be a power of two, not {0!r}.".format(alignment))
+    payload = dump_array(values, _type, order)
+    header = _HEADER_LAYOUT.dump({
+        "magic": _MAGIC,
+        "version": _VERSION,
+        "type": _TYPE_CODES[_type],
+        "order": order.value,
+        "alignment": alignment,
+        "count": len(payload) // _type.size,
+    }, ByteOrder.LITTLE)
+    with open(path, "wb") as file:
+        file.write(header)
+        file.write(bytes(_payload_offset(alignment) - len(header)))
+        file.write(payload)
+
+
+def load_array(path, mmap=True):
+    """
+    Loads the values of a pyjak array file.
+    Args:
+        path: The path of the file to be read.
+        mmap: If True, the file is memory mapped and the values are not
+            copied. Otherwise the values are read into memory.
+    Raises:
+        BinaryError: If the file is not a valid pyjak array file.
+        BinarySizeMismatch: If the size of the file does not match its
+            header.
+    Returns:
+        A read-only memoryview of the values, cast to the struct format of
+        their data type. Values stored in a byte order other than the native
+        one are converted, which requires a copy.
+    """
+    with open(path, "rb") as file:
+        header = _parse_header(file.read(_HEADER_LAYOUT.size))
+        _type = _TYPES[header["type"]]
+        start = _payload_offset(header["alignment"])
+        end = start + header["count"] * _type.size
+        file_size = os.fstat(file.fileno()).st_size
+        if file_size != end:
+            raise BinarySizeMismatch(
+                "Size of file is {0}, expected {1}.".format(file_size, end))
+        if mmap:
+            mapped = _mmap.mmap(file.fileno(), 0, access=_mmap.ACCESS_READ)
+            with memoryview(mapped) as view:
+                payload = view[start:end]
+        else:
+            file.seek(start)
+            payload = memoryview(file.read(end - start))
+    order = ByteOrder(header["order"])
+    if order != ByteOrder.NATIVE:
+        payload = memoryview(to_order(
+            payload, _type, order, ByteOrder.NATIVE,
+            inplace=False)).toreadonly()
+    return payload.cast(_type.format)
+
+
+def _parse_header(_bytes):
+    if len(_bytes) < _HEADER_LAYOUT.size:
+        raise BinaryError("File is too small to be a pyjak array file.")
+    header = _HEADER_LAYOUT.parse(_bytes, ByteOrder.LITTLE)
+    if header["magic"] != _MAGIC:
+        raise BinaryError("File is not a pyjak array file.")
+    if header["version"] != _VERSION:
+        raise BinaryError(
+            "Unsupported array file version {0}.".format(header["version"]))
+    if header["type"] not in _TYPES:
+        raise BinaryError(
+            "Unknown data type code {0}.".format(header["type"]))
+    if header["order"] not in (ByteOrder.LITTLE.value, ByteOrder.BIG.value):
+        raise BinaryError(
+            "Unknown byte order code {0}.".format(header["order"]))
+    if not _is_power_of_two(header["alignment"]):
+        raise BinaryError(
+            "Invalid alignment {0}.".format(header["alignment"]))
+    return header
+
+
+def _payload_offset(alignment):
+    return -(-_HEADER_LAYOUT.size // alignment) * alignment
+
+
+def _is_power_of_two(value):
+    return isinstance(value, int) and value > 0 and value & (value - 1) == 0
+
+
+# "PJAK" when stored in little endian order.
+_MAGIC = 0x4b414a50
+_VERSION = 1
+
+_HEADER_LAYOUT = Layout([
+    ("magic", DataType.UINT32),
+    ("version", DataType.UINT8),
+    ("type", DataType.UINT8),
+    ("order", DataType.UINT8),
+    (None, Padding(1)),
+    ("alignment", DataType.UINT32),
+    ("count", DataType.UINT64),
+])
+
+# Codes identifying the data types in the header. Never change existing codes.
+_TYPE_CODES = {
+    DataType.INT8: 1,
+    DataType.UINT8: 2,
+    DataType.INT16: 3,
+    DataType.UINT16: 4,
+    DataType.INT32: 5,
+    DataType.UINT32: 6,
+    DataType.INT64: 7,
+    DataType.UINT64: 8,
+    DataType.FLOAT32: 9,
+    DataType.FLOAT64: 10,
+    DataType.BOOL: 11,
+}
+_TYPES = {code: _type for _type, code in _TYPE_CODES.items()}
@@ -1,6 +1,7 @@
+import array
 import struct
-import re
-from pyjak.order import ByteOrder
+from pyjak.datatype import DataType
+from pyjak.order import ByteOrder, _byte_order
 
 
 class BinaryError(Exception):
@@ -18,6 +19,14 @@ class BinarySizeMismatch(BinaryError):
     pass
 
 
+class ChecksumMismatch(BinaryError):
+    """
+    Raised when a checksum read from binary data does not match the checksum
+    computed over the data.
+    """
+    pass
+
+
 def parse_int8(_bytes):
     """
     Parses a given byte array as a signed 1 byte integer.
@@ -30,6 +39,8 @@ def parse_int8(_bytes):
     Returns:
         The integer that was parsed.
     """
+    if type(_bytes) in _BYTES_TYPES and len(_bytes) == 1:
+        return _INT8_TABLE[_bytes[0]]
     return _parse_from_format(_INT8_FORMAT, _bytes)
 
 
@@ -45,6 +56,8 @@ def parse_uint8(_bytes):
     Returns:
         The integer that was parsed.
     """
+    if type(_bytes) in _BYTES_TYPES and len(_bytes) == 1:
+        return _bytes[0]
     return _parse_from_format(_UINT8_FORMAT, _bytes)
 
 
@@ -55,7 +68,8 @@ def parse_int16(_bytes, order=None):
         _bytes: The byte array to be parsed.
         order: The byte order of the byte array. Defaults to native order.
     Raises:
-        TypeError: If byte array is not of type 'bytes' or 'bytearray'.
+        TypeError: If byte array is not of type 'bytes' or 'bytearray', or
+            order is not a ByteOrder.
         BinarySizeMismatch: If length of byte array is not equal to 2.
         BinaryError: If an unexpected conversion error occurs.
     Returns:
@@ -71,7 +85,8 @@ def parse_uint16(_bytes, order=None):
         _bytes: The byte array to be parsed.
         order: The byte order of the byte array. Defaults to native order.
     Raises:
-        TypeError: If byte array is not of type 'bytes' or 'bytearray'.
+        TypeError: If byte array is not of type 'bytes' or 'bytearray', or
+            order is not a ByteOrder.
         BinarySizeMismatch: If length of byte array is not equal to 2.
         BinaryError: If an unexpected conversion error occurs.
     Returns:
@@ -87,7 +102,8 @@ def parse_int32(_bytes, order=None):
         _bytes: The byte array to be parsed.
         order: The byte order of the byte array. Defaults to native order.
     Raises:
-        TypeError: If byte array is not of type 'bytes' or 'bytearray'.
+        TypeError: If byte array is not of type 'bytes' or 'bytearray', or
+            order is not a ByteOrder.
         BinarySizeMismatch: If length of byte array is not equal to 4.
         BinaryError: If an unexpected conversion error occurs.
     Returns:
@@ -103,7 +119,8 @@ def parse_uint32(_bytes, order=None):
         _bytes: The byte array to be parsed.
         order: The byte order of the byte array. Defaults to native order.
     Raises:
-        TypeError: If byte array is not of type 'bytes' or 'bytearray'.
+        TypeError: If byte array is not of type 'bytes' or 'bytearray', or
+            order is not a ByteOrder.
         BinarySizeMismatch: If length of byte array is not equal to 4.
         BinaryError: If an unexpected conversion error occurs.
     Returns:
@@ -119,7 +136,8 @@ def parse_int64(_bytes, order=None):
         _bytes: The byte array to be parsed.
         order: The byte order of the byte array. Defaults to native order.
     Raises:
-        TypeError: If byte array is not of type 'bytes' or 'bytearray'.
+        TypeError: If byte array is not of type 'bytes' or 'bytearray', or
+            order is not a ByteOrder.
         BinarySizeMismatch: If length of byte array is not equal to 8.
         BinaryError: If an unexpected conversion error occurs.
     Returns:
@@ -135,7 +153,8 @@ def parse_uint64(_bytes, order=None):
         _bytes: The byte array to be parsed.
         order: The byte order of the byte array. Defaults to native order.
     Raises:
-        TypeError: If byte array is not of type 'bytes' or 'bytearray'.
+        TypeError: If byte array is not of type 'bytes' or 'bytearray', or
+            order is not a ByteOrder.
         BinarySizeMismatch: If length of byte array is not equal to 8.
         BinaryError: If an unexpected conversion error occurs.
     Returns:
@@ -151,7 +170,8 @@ def parse_float32(_bytes, order=None):
         _bytes: The byte array to be parsed.
         order: The byte order of the byte array. Defaults to native order.
     Raises:
-        TypeError: If byte array is not of type 'bytes' or 'bytearray'.
+        TypeError: If byte array is not of type 'bytes' or 'bytearray', or
+            order is not a ByteOrder.
         BinarySizeMismatch: If length of byte array is not equal to 4.
         BinaryError: If an unexpected conversion error occurs.
     Returns:
@@ -167,7 +187,8 @@ def parse_float64(_bytes, order=None):
         _bytes: The byte array to be parsed.
         order: The byte order of the byte array. Defaults to native order.
     Raises:
-        TypeError: If byte array is not of type 'bytes' or 'bytearray'.
+        TypeError: If byte array is not of type 'bytes' or 'bytearray', or
+            order is not a ByteOrder.
         BinarySizeMismatch: If length of byte array is not equal to 8.
         BinaryError: If an unexpected conversion error occurs.
     Returns:
@@ -190,6 +211,8 @@ def parse_bool(_bytes):
         False if the parsed uint8 equals 0.
         True otherwise.
     """
+    if type(_bytes) in _BYTES_TYPES and len(_bytes) == 1:
+        return _BOOL_TABLE[_bytes[0]]
     return parse_uint8(_bytes) != 0
 
 
@@ -206,6 +229,8 @@ def dump_int8(_int):
     Returns:
         A byte array containing the serialized integer.
     """
+    if type(_int) is int and -128 <= _int <= 127:
+        return _BYTE_TABLE[_int & 0xFF]
     return _dump_from_format(_INT8_FORMAT, _int)
 
 
@@ -222,6 +247,8 @@ def dump_uint8(_int):
     Returns:
         A byte array containing the serialized integer.
     """
+    if type(_int) is int and 0 <= _int <= 255:
+        return _BYTE_TABLE[_int]
     return _dump_from_format(_UINT8_FORMAT, _int)
 
 
@@ -232,7 +259,8 @@ def dump_int16(_int, order=None):
         _int: The integer to be serialized.
         order: The byte order of the returned byte array. Defaults to native.
     Raises:
-        TypeError: If integer is not of type 'int'.
+        TypeError: If integer is not of type 'int', or order is not a
+            ByteOrder.
         BinarySizeMismatch: If value is too small or too big to be held by
             a signed 2 byte integer.
         BinaryError: If an unexpected conversion error occurs.
@@ -249,7 +277,8 @@ def dump_uint16(_int, order=None):
         _int: The integer to be serialized.
         order: The byte order of the returned byte array. Defaults to native.
     Raises:
-        TypeError: If integer is not of type 'int'.
+        TypeError: If integer is not of type 'int', or order is not a
+            ByteOrder.
         BinarySizeMismatch: If value is too small or too big to be held by
             an unsigned 2 byte integer.
         BinaryError: If an unexpected conversion error occurs.
@@ -266,7 +295,8 @@ def dump_int32(_int, order=None):
         _int: The integer to be serialized.
         order: The byte order of the returned byte array. Defaults to native.
     Raises:
-        TypeError: If integer is not of type 'int'.
+        TypeError: If integer is not of type 'int', or order is not a
+            ByteOrder.
         BinarySizeMismatch: If value is too small or too big to be held by
             a signed 4 byte integer.
         BinaryError: If an unexpected conversion error occurs.
@@ -283,7 +313,8 @@ def dump_uint32(_int, order=None):
         _int: The integer to be serialized.
         order: The byte order of the returned byte array. Defaults to native.
     Raises:
-        TypeError: If integer is not of type 'int'.
+        TypeError: If integer is not of type 'int', or order is not a
+            ByteOrder.
         BinarySizeMismatch: If value is too small or too big to be held by
             an unsigned 4 byte integer.
         BinaryError: If an unexpected conversion error occurs.
@@ -300,7 +331,8 @@ def dump_int64(_int, order=None):
         _int: The integer to be serialized.
         order: The byte order of the returned byte array. Defaults to native.
     Raises:
-        TypeError: If integer is not of type 'int'.
+        TypeError: If integer is not of type 'int', or order is not a
+            ByteOrder.
         BinarySizeMismatch: If value is too small or too big to be held by
             a signed 8 byte integer.
         BinaryError: If an unexpected conversion error occurs.
@@ -317,7 +349,8 @@ def dump_uint64(_int, order=None):
         _int: The integer to be serialized.
         order: The byte order of the returned byte array. Defaults to native.
     Raises:
-        TypeError: If integer is not of type 'int'.
+        TypeError: If integer is not of type 'int', or order is not a
+            ByteOrder.
         BinarySizeMismatch: If value is too small or too big to be held by
             an unsigned 8 byte integer.
         BinaryError: If an unexpected conversion error occurs.
@@ -334,7 +367,8 @@ def dump_float32(_float, order=None):
         _float: The integer to be serialized.
         order: The byte order of the returned byte array. Defaults to native.
     Raises:
-        TypeError: If _float is not of type 'float'.
+        TypeError: If _float is not of type 'float', or order is not a
+            ByteOrder.
         BinarySizeMismatch: If value is too small or too big to be held by
             a 4 byte float.
         BinaryError: If an unexpected conversion error occurs.
@@ -351,7 +385,8 @@ def dump_float64(_float, order=None):
         _float: The integer to be serialized.
         order: The byte order of the returned byte array. Defaults to native.
     Raises:
-        TypeError: If _float is not of type 'float'.
+        TypeError: If _float is not of type 'float', or order is not a
+            ByteOrder.
         BinarySizeMismatch: If value is too small or too big to be held by
             an 8 byte float.
         BinaryError: If an unexpected conversion error occurs.
@@ -373,11 +408,116 @@ def dump_bool(_bool):
     Returns:
         A byte array containing the serialized bool.
     """
-    if not isinstance(_bool, bool):
-        raise TypeError(
-            "Expected object of bool-like type, not '{0}'."
-            .format(type(_bool).__name__))
-    return dump_uint8(int(_bool))
+    if _bool is True:
+        return _BYTE_TABLE[1]
+    if _bool is False:
+        return _BYTE_TABLE[0]
+    raise TypeError(
+        "Expected object of bool-like type, not '{0}'."
+        .format(type(_bool).__name__))
+
+
+def parse_int8_array(_bytes):
+    """
+    Parses every byte of a given byte array as a signed 1 byte integer.
+    Args:
+        _bytes: The byte array to be parsed.
+    Raises:
+        TypeError: If byte array is not bytes-like.
+    Returns:
+        A list of the integers that were parsed.
+    """
+    with _byte_view(_bytes) as view:
+        return view.cast("b").tolist()
+
+
+def parse_uint8_array(_bytes):
+    """
+    Parses every byte of a given byte array as an unsigned 1 byte integer.
+    Args:
+        _bytes: The byte array to be parsed.
+    Raises:
+        TypeError: If byte array is not bytes-like.
+    Returns:
+        A list of the integers that were parsed.
+    """
+    with _byte_view(_bytes) as view:
+        return view.tolist()
+
+
+def parse_bool_array(_bytes):
+    """
+    Parses every byte of a given byte array as a bool, using the same rules
+    as parse_bool.
+    Args:
+        _bytes: The byte array to be parsed.
+    Raises:
+        TypeError: If byte array is not bytes-like.
+    Returns:
+        A list of the bools that were parsed.
+    """
+    with _byte_view(_bytes) as view:
+        normalized = view.tobytes().translate(_BOOL_TRANSLATION)
+    with memoryview(normalized) as view:
+        return view.cast("?").tolist()
+
+
+def dump_int8_array(_ints):
+    """
+    Serializes a given sequence of integers as signed 1 byte integers.
+    Args:
+        _ints: The integers to be serialized.
+    Raises:
+        TypeError: If any integer is not of type 'int'.
+        BinarySizeMismatch: If any value is too small or too big to be held
+            by a signed 1 byte integer.
+        BinaryError: If an unexpected conversion error occurs.
+    Returns:
+        A byte array containing the serialized integers.
+    """
+    _ints = _sequence(_ints)
+    try:
+        return array.array(_INT8_FORMAT, _ints).tobytes()
+    except (TypeError, OverflowError):
+        return b"".join(map(dump_int8, _ints))
+
+
+def dump_uint8_array(_ints):
+    """
+    Serializes a given sequence of integers as unsigned 1 byte integers.
+    Args:
+        _ints: The integers to be serialized.
+    Raises:
+        TypeError: If any integer is not of type 'int'.
+        BinarySizeMismatch: If any value is too small or too big to be held
+            by an unsigned 1 byte integer.
+        BinaryError: If an unexpected conversion error occurs.
+    Returns:
+        A byte array containing the serialized integers.
+    """
+    _ints = _sequence(_ints)
+    try:
+        return array.array(_UINT8_FORMAT, _ints).tobytes()
+    except (TypeError, OverflowError):
+        return b"".join(map(dump_uint8, _ints))
+
+
+def dump_bool_array(_bools):
+    """
+    Serializes a given sequence of bools as unsigned 1 byte integers, using
+    the same rules as dump_bool.
+    Args:
+        _bools: The bools to be serialized.
+    Raises:
+        TypeError: If any bool is not of type 'bool'.
+        BinaryError: If an unexpected conversion error occurs.
+    Returns:
+        A byte array containing the serialized bools.
+    """
+    _bools = _sequence(_bools)
+    if not set(map(type, _bools)) <= _BOOL_TYPES:
+        return b"".join(map(dump_bool, _bools))
+    return bytes(_bools)
 
 
 _INT8_FORMAT = "b"
@@ -395,12 +535,37 @@ _UINT64_FORMAT = "Q"
 _FLOAT32_FORMAT = "f"
 _FLOAT64_FORMAT = "d"
 
+_BYTES_TYPES = (bytes, bytearray)
+_BOOL_TYPES = frozenset((bool,))
+
+# Lookup tables for the single byte types, indexed by unsigned byte value.
+_BYTE_TABLE = tuple(bytes((_value,)) for _value in range(256))
+_INT8_TABLE = tuple(range(128)) + tuple(range(-128, 0))
+_BOOL_TABLE = (False,) + (True,) * 255
+_BOOL_TRANSLATION = bytes(_BOOL_TABLE)
+
 _STRUCT_ARG_OOR1 = "argument out of range"
-_STRUCT_ARG_OOR2 = re.compile(
-    "<= number <=")
+_STRUCT_ARG_OOR2 = "<= number <="
 _STRUCT_ARG_TOO_LARGE = "int too large to convert"
-_STRUCT_TYPE_MISMATCH_REGEX = re.compile(
-    "required argument is not (an|a) (integer|float)")
+_STRUCT_TYPE_MISMATCH_PREFIXES = (
+    "required argument is not an integer",
+    "required argument is not a float")
+
+
+def _byte_view(_bytes):
+    try:
+        view = memoryview(_bytes)
+    except TypeError:
+        raise TypeError(
+            "Expected object of bytes-like type, not '{0}'."
+            .format(type(_bytes).__name__))
+    return view.cast("B")
+
+
+def _sequence(values):
+    if isinstance(values, (list, tuple, array.array)):
+        return values
+    return list(values)
 
 
 def _parse_from_format(_format, _bytes, order=None):
@@ -430,12 +595,12 @@ def _dump_from_format(_format, value, order=None):
     except struct.error as e:
         msg = str(e)
         # Hack to check if error was caused by a type mismatch.
-        if _STRUCT_TYPE_MISMATCH_REGEX.match(msg):
+        if msg.startswith(_STRUCT_TYPE_MISMATCH_PREFIXES):
             raise TypeError(
                 "Expected object of number-like type, not '{0}'."
                 .format(type(value).__name__))
         # Hack to check if error was caused by argument out of bounds.
-        elif (msg == _STRUCT_ARG_OOR1 or _STRUCT_ARG_OOR2.search(msg) or
+        elif (msg == _STRUCT_ARG_OOR1 or _STRUCT_ARG_OOR2 in msg or
                 msg == _STRUCT_ARG_TOO_LARGE):
             raise _mismatch(fixed_format, value)
         else:
@@ -448,8 +613,12 @@ def _dump_from_format(_format, value, order=None):
 def _format_with_order(_format, order=None):
     if order is None:
         order = ByteOrder.NATIVE
-    order_char = "<" if order == ByteOrder.LITTLE else ">"
-    return order_char + _format
+    if order is ByteOrder.LITTLE:
+        return "<" + _format
+    if order is ByteOrder.BIG:
+        return ">" + _format
+    # Raises the error for anything but a ByteOrder.
+    return _format_with_order(_format, _byte_order(order))
 
 
 def _mismatch(_format, value):
@@ -457,3 +626,32 @@ def _mismatch(_format, value):
     msg = "Number {0} requires a different sign or more than " +\
         "{1} bytes to store."
     return BinarySizeMismatch(msg.format(value, calced_size))
+
+
+_DUMP_FUNCS = {
+    DataType.INT8: dump_int8,
+    DataType.UINT8: dump_uint8,
+    DataType.INT16: dump_int16,
+    DataType.UINT16: dump_uint16,
+    DataType.INT32: dump_int32,
+    DataType.UINT32: dump_uint32,
+    DataType.INT64: dump_int64,
+    DataType.UINT64: dump_uint64,
+    DataType.FLOAT32: dump_float32,
+    DataType.FLOAT64: dump_float64,
+    DataType.BOOL: dump_bool,
+}
+
+_PARSE_FUNCS = {
+    DataType.INT8: parse_int8,
+    DataType.UINT8: parse_uint8,
+    DataType.INT16: parse_int16,
+    DataType.UINT16: parse_uint16,
+    DataType.INT32: parse_int32,
+    DataType.UINT32: parse_uint32,
+    DataType.INT64: parse_int64,
+    DataType.UINT64: parse_uint64,
+    DataType.FLOAT32: parse_float32,
+    DataType.FLOAT64: parse_float64,
+    DataType.BOOL: parse_bool,
+}
@@ -0,0 +1,106 @@
+import array
+import math
+import struct
+from enum import Enum
+
+
+class DataType(Enum):
+    """
+    Enumeration of the binary data types supported by pyjak.
+    """
+    INT8 = "int8"
+    UINT8 = "uint8"
+    INT16 = "int16"
+    UINT16 = "uint16"
+    INT32 = "int32"
+    UINT32 = "uint32"
+    INT64 = "int64"
+    UINT64 = "uint64"
+    FLOAT32 = "float32"
+    FLOAT64 = "float64"
+    BOOL = "bool"
+
+    @property
+    def format(self):
+        """
+        The struct format character of the data type.
+        """
+        return _FORMATS[self]
+
+    @property
+    def size(self):
+        """
+        The number of bytes required to store one value of the data type.
+        """
+        return _SIZES[self]
+
+
+_FORMATS = {
+    DataType.INT8: "b",
+    DataType.UINT8: "B",
+    DataType.INT16: "h",
+    DataType.UINT16: "H",
+    DataType.INT32: "i",
+    DataType.UINT32: "I",
+    DataType.INT64: "q",
+    DataType.UINT64: "Q",
+    DataType.FLOAT32: "f",
+    DataType.FLOAT64: "d",
+    DataType.BOOL: "?",
+}
+
+_SIZES = {
+    _type: struct.calcsize("<" + _format)
+    for _type, _format in _FORMATS.items()
+}
+
+
+def _data_type(_type):
+    if not isinstance(_type, DataType):
+        raise TypeError(
+            "Expected object of DataType type, not '{0}'."
+            .format(type(_type).__name__))
+    return _type
+
+
+_INTEGER_TYPES = frozenset((
+    DataType.INT8, DataType.UINT8, DataType.INT16, DataType.UINT16,
+    DataType.INT32, DataType.UINT32, DataType.INT64, DataType.UINT64))
+
+
+def _integer_bounds(_type):
+    bits = _SIZES[_type] * 8
+    if _FORMATS[_type].islower():
+        return -(1 << (bits - 1)), (1 << (bits - 1)) - 1
+    return 0, (1 << bits) - 1
+
+
+# Inclusive (min, max) bounds of the integer types.
+_BOUNDS = {_type: _integer_bounds(_type) for _type in _INTEGER_TYPES}
+
+# Largest float that does not round to infinity when stored as a float32.
+_FLOAT32_MAX = float(2 ** 128 - 2 ** 103 - 2 ** 75)
+
+# Inclusive (min, max) bounds of the finite values of every data type.
+_RANGES = dict(_BOUNDS)
+_RANGES.update({
+    DataType.FLOAT32: (-_FLOAT32_MAX, _FLOAT32_MAX),
+    DataType.FLOAT64: (-math.inf, math.inf),
+    DataType.BOOL: (0, 1),
+})
+
+
+def _array_typecode(_type):
+    family = "fd" if _type in (DataType.FLOAT32, DataType.FLOAT64) else (
+        "bhilq" if _FORMATS[_type].islower() else "BHILQ")
+    for typecode in family:
+        if array.array(typecode).itemsize == _SIZES[_type]:
+            return typecode
+    return None
+
+
+# Typecodes of the array module matching each data type, where one exists.
+_TYPECODES = {
+    _type: _array_typecode(_type)
+    for _type in DataType if _type != DataType.BOOL
+}
@@ -0,0 +1,228 @@
+import array
+from enum import Enum
+from itertools import accumulate, chain, repeat
+from operator import add, sub
+from pyjak.bulk import _raise_invalid, numpy
+from pyjak.convert import (
+    BinaryError, BinarySizeMismatch, _byte_view, _sequence, dump_int64,
+    dump_uint8, dump_uint32, parse_int64, parse_uint32)
+from pyjak.datatype import DataType, _TYPECODES
+from pyjak.order import _byte_order
+
+
+class SequenceEncoding(Enum):
+    """
+    Enumeration of the encodings of integer sequences.
+    """
+    # Values are stored as bit packed offsets from the smallest value.
+    FRAME_OF_REFERENCE = 1
+
+    # Differences between consecutive values are stored as bit packed
+    # offsets from the smallest difference. Suits counters and timestamps.
+    DELTA = 2
+
+    # Differences between consecutive differences are stored as bit packed
+    # offsets from the smallest one. Suits values sampled at regular
+    # intervals.
+    DELTA_OF_DELTA = 3
+
+
+def encode_sequence(values, encoding=SequenceEncoding.DELTA, order=None):
+    """
+    Serializes a given sequence of signed 8 byte integers in a compact,
+    self-describing form.
+    The header holds the encoding as a uint8, the bit width of the packed
+    residuals as a uint8, the number of values as a uint32, up to two
+    leading values as int64s and the reference residual as an int64. The
+    residuals follow, packed in little endian bit order.
+    Args:
+        values: The integers to be serialized.
+        encoding: The SequenceEncoding to use. Defaults to DELTA.
+        order: The byte order of the header. Defaults to native order.
+    Raises:
+        TypeError: If any value is not of type 'int', or encoding is not a
+            SequenceEncoding.
+        BinarySizeMismatch: If any value is too small or too big to be held
+            by a signed 8 byte integer, or the values are too many to be
+            encoded.
+        BinaryError: If an unexpected conversion error occurs.
+    Returns:
+        A byte array containing the serialized integers.
+    """
+    if not isinstance(encoding, SequenceEncoding):
+        raise TypeError(
+            "Expected object of SequenceEncoding type, not '{0}'."
+            .format(type(encoding).__name__))
+    order = _byte_order(order)
+    values = _sequence(values)
+    try:
+        residuals = array.array(_TYPECODES[DataType.INT64], values).tolist()
+    except (TypeError, OverflowError) as e:
+        _raise_invalid(
+            values, DataType.INT64, order, "value at index {0}".format, e)
+    seeds = []
+    for _ in range(_SEEDS[encoding]):
+        if not residuals:
+            break
+        seeds.append(residuals[0])
+        # Differences wrap around at 64 bits, so that they fit in an int64
+        # however far apart the values are.
+        residuals = _wrap(map(sub, residuals[1:], residuals[:-1]))
+    reference = min(residuals) if residuals else 0
+    width = (max(residuals) - reference).bit_length() if residuals else 0
+    parts = [
+        dump_uint8(encoding.value), dump_uint8(width),
+        dump_uint32(len(values), order)]
+    parts.extend(dump_int64(seed, order) for seed in seeds)
+    parts.append(dump_int64(reference, order))
+    parts.append(_pack_bits(
+        list(map(sub, residuals, repeat(reference))), width))
+    return b"".join(parts)
+
+
+def decode_sequence(_bytes, order=None, max_count=16777216):
+    """
+    Parses a given byte array produced by encode_sequence.
+    Args:
+        _bytes: The byte array to be parsed.
+        order: The byte order of the header. Defaults to native order.
+        max_count: The maximum number of values accepted, as runs of equal
+            residuals take up no space at all. Defaults to 16777216. Pass
+            None to accept any number of values from trusted input.
+    Raises:
+        TypeError: If byte array is not bytes-like.
+        BinarySizeMismatch: If length of byte array does not match its header,
+            or the number of values exceeds max_count.
+        BinaryError: If the header is invalid.
+    Returns:
+        A list of the integers that were parsed.
+    """
+    order = _byte_order(order)
+    with _byte_view(_bytes) as view:
+        if len(view) < _HEADER_SIZE:
+            raise BinarySizeMismatch(
+                "Length of byte array is {0}, expected at least {1}."
+                .format(len(view), _HEADER_SIZE))
+        try:
+            encoding = SequenceEncoding(view[0])
+        except ValueError:
+            raise BinaryError(
+                "Unknown sequence encoding {0}.".format(view[0]))
+        width = view[1]
+        if width > _MAX_WIDTH:
+            raise BinaryError(
+                "Residual bit width {0} exceeds the maximum of {1}."
+                .format(width, _MAX_WIDTH))
+        count = parse_uint32(view[2:_HEADER_SIZE], order)
+        if max_count is not None and count > max_count:
+            raise BinarySizeMismatch(
+                "Length {0} exceeds the maximum of {1}."
+                .format(count, max_count))
+        seed_count = min(_SEEDS[encoding], count)
+        offset = _HEADER_SIZE + 8 * seed_count + 8
+        expected = offset + _packed_size(count - seed_count, width)
+        if len(view) != expected:
+            raise BinarySizeMismatch(
+                "Length of byte array is {0}, expected {1}."
+                .format(len(view), expected))
+        numbers = [
+            parse_int64(view[start:start + 8], order)
+            for start in range(_HEADER_SIZE, offset, 8)]
+        seeds, reference = numbers[:-1], numbers[-1]
+        packed = view[offset:]
+        if numpy is not None:
+            return _integrate_ndarray(
+                seeds, reference, packed, width, count - seed_count)
+        residuals = map(
+            add, _unpack_bits(packed, width, count - seed_count),
+            repeat(reference))
+    for seed in reversed(seeds):
+        residuals = accumulate(chain([seed], residuals))
+    return _wrap(residuals)
+
+
+def _wrap(values):
+    return [((value + _INT64_BIAS) & _UINT64_MASK) - _INT64_BIAS
+            for value in values]
+
+
+def _pack_bits(values, width):
+    # Every group of 8 values fills exactly width bytes.
+    if width == 0:
+        return b""
+    shifts = range(0, 8 * width, width)
+    groups = []
+    for start in range(0, len(values), 8):
+        group = 0
+        for value, shift in zip(values[start:start + 8], shifts):
+            group |= value << shift
+        groups.append(group.to_bytes(width, "little"))
+    return b"".join(groups)
+
+
+def _unpack_bits(packed, width, count):
+    if width == 0:
+        return [0] * count
+    mask = (1 << width) - 1
+    shifts = range(0, 8 * width, width)
+    values = []
+    for start in range(0, len(packed), width):
+        group = int.from_bytes(packed[start:start + width], "little")
+        values.extend([(group >> shift) & mask for shift in shifts])
+    del values[count:]
+    return values
+
+
+def _integrate_ndarray(seeds, reference, packed, width, count):
+    residuals = numpy.zeros(count, numpy.uint64)
+    if width and count:
+        _unpack_ndarray(residuals, packed, width)
+    # Arithmetic wraps around at 64 bits, which gives the right result as
+    # long as the original values fit in an int64.
+    residuals = residuals.view(numpy.int64)
+    residuals += numpy.int64(reference)
+    for seed in reversed(seeds):
+        residuals = numpy.concatenate(
+            (numpy.array([seed], numpy.int64), residuals))
+        numpy.cumsum(residuals, out=residuals)
+    return residuals.tolist()
+
+
+def _unpack_ndarray(residuals, packed, width):
+    # Value i takes bits i * width to (i + 1) * width of the packed words,
+    # which are read from the two words it may span. One spare word lets the
+    # last value be read the same way.
+    words = numpy.zeros((len(packed) + 15) // 8, "<u8")
+    words.view(numpy.uint8)[:len(packed)] = numpy.frombuffer(
+        packed, numpy.uint8)
+    mask = numpy.uint64((1 << width) - 1)
+    # Values are unpacked in blocks to bound the size of temporary arrays.
+    for start in range(0, len(residuals), _BLOCK_SIZE):
+        end = min(start + _BLOCK_SIZE, len(residuals))
+        bits = numpy.arange(start, end, dtype=numpy.uint64)
+        bits *= numpy.uint64(width)
+        index = (bits >> numpy.uint64(6)).astype(numpy.intp)
+        shift = bits & numpy.uint64(63)
+        low = words[index] >> shift
+        # Shifted twice, as shifting a word by 64 bits is undefined.
+        high = (words[index + 1] << (numpy.uint64(63) - shift)) << (
+            numpy.uint64(1))
+        residuals[start:end] = (low | high) & mask
+
+
+def _packed_size(count, width):
+    return (count + 7) // 8 * width
+
+
+_HEADER_SIZE = 6
+_MAX_WIDTH = 64
+_BLOCK_SIZE = 65536
+
+_INT64_BIAS = 1 << 63
+_UINT64_MASK = (1 << 64) - 1
+
+_SEEDS = {
+    SequenceEncoding.FRAME_OF_REFERENCE: 0,
+    SequenceEncoding.DELTA: 1,
+    SequenceEncoding.DELTA_OF_DELTA: 2,
+}
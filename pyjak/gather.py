@@ -0,0 +1,218 @@
+import os
+from pyjak.checksum import Checksum, _checksum
+from pyjak.convert import _byte_view, dump_uint32
+
+
+class GatherWriter:
+    """
+    Collects serialized header fields and references to payload buffers, and
+    writes them out with scatter-gather I/O. Header fields are copied into a
+    small reusable buffer while payloads are never copied.
+    """
+
+    def __init__(self):
+        self._header = bytearray()
+        self._header_start = 0
+        self._segments = []
+        self._size = 0
+        self._checksum_func = None
+        self._checksum_value = 0
+
+    def __len__(self):
+        return self._size
+
+    def write(self, dump_func, value, *args):
+        """
+        Serializes a given value and appends it to the message.
+        Args:
+            dump_func: The pyjak dump function used to serialize the value,
+                for example dump_uint32.
+            value: The value to be serialized.
+            *args: Additional arguments to dump_func, such as the byte order.
+        Raises:
+            Any exception raised by dump_func.
+        """
+        self.write_bytes(dump_func(value, *args))
+
+    def write_bytes(self, _bytes):
+        """
+        Copies a given byte array into the header buffer of the message. Meant
+        for small byte arrays, use write_payload for large ones.
+        Args:
+            _bytes: The byte array to be appended.
+        Raises:
+            TypeError: If byte array is not bytes-like.
+        """
+        with _byte_view(_bytes) as view:
+            self._header += view
+            self._size += len(view)
+            if self._checksum_func is not None:
+                self._checksum_value = self._checksum_func(
+                    view, self._checksum_value)
+
+    def write_payload(self, buffer):
+        """
+        Appends a reference to a given byte array to the message. The byte
+        array is not copied, so it must not be modified until the message has
+        been flushed or cleared.
+        Args:
+            buffer: The byte array to be appended.
+        Raises:
+            TypeError: If buffer is not bytes-like.
+        """
+        view = _byte_view(buffer)
+        if len(view) == 0:
+            view.release()
+            return
+        self._end_header_segment()
+        self._segments.append(view)
+        self._size += len(view)
+        if self._checksum_func is not None:
+            self._checksum_value = self._checksum_func(
+                view, self._checksum_value)
+
+    def begin_checksum(self, checksum=Checksum.CRC32):
+        """
+        Starts computing a checksum over the bytes appended from now on. Each
+        byte array is checksummed as it is appended. Any checksum in progress
+        is discarded.
+        Args:
+            checksum: The Checksum to compute. Defaults to CRC32.
+        Raises:
+            TypeError: If checksum is not a Checksum.
+        """
+        self._checksum_func, self._checksum_value = _checksum(checksum)
+
+    def end_checksum(self):
+        """
+        Stops computing the checksum begun by begin_checksum.
+        Raises:
+            ValueError: If no checksum has been begun.
+        Returns:
+            The checksum of the bytes appended since begin_checksum, as an
+            unsigned 4 byte integer.
+        """
+        if self._checksum_func is None:
+            raise ValueError("No checksum has been begun.")
+        self._checksum_func = None
+        return self._checksum_value
+
+    def write_checksum(self, order=None):
+        """
+        Stops computing the checksum begun by begin_checksum, and appends it
+        to the message as an unsigned 4 byte integer.
+        Args:
+            order: The byte order of the checksum. Defaults to native order.
+        Raises:
+            ValueError: If no checksum has been begun.
+        """
+        self.write_bytes(dump_uint32(self.end_checksum(), order))
+
+    def getvalue(self):
+        """
+        Returns:
+            The message as a single byte array. Mostly useful for debugging,
+            as this copies every payload.
+        """
+        self._end_header_segment()
+        with memoryview(self._header) as header:
+            return b"".join(
+                header[segment[0]:segment[1]]
+                if isinstance(segment, tuple) else segment
+                for segment in self._segments)
+
+    def flush_fd(self, fd):
+        """
+        Writes the message to a given file descriptor using os.writev, and
+        clears the writer. Partial writes are continued until the whole
+        message has been written.
+        Args:
+            fd: The file descriptor to write to.
+        Raises:
+            OSError: If writing fails. The part of the message that was not
+                written is kept in the writer.
+        Returns:
+            The number of bytes written.
+        """
+        writev = getattr(os, "writev", None)
+        if writev is None:
+            return self._flush(lambda buffers: os.write(fd, buffers[0]))
+        return self._flush(lambda buffers: writev(fd, buffers))
+
+    def flush_socket(self, sock):
+        """
+        Sends the message through a given socket using socket.sendmsg, and
+        clears the writer. Partial sends are continued until the whole
+        message has been sent.
+        Args:
+            sock: The socket to send through.
+        Raises:
+            OSError: If sending fails. The part of the message that was not
+                sent is kept in the writer.
+        Returns:
+            The number of bytes sent.
+        """
+        return self._flush(sock.sendmsg)
+
+    def clear(self):
+        """
+        Discards the message and releases all payload references.
+        """
+        for segment in self._segments:
+            if not isinstance(segment, tuple):
+                segment.release()
+        self._segments = []
+        del self._header[:]
+        self._header_start = 0
+        self._size = 0
+
+    def _end_header_segment(self):
+        end = len(self._header)
+        if end > self._header_start:
+            self._segments.append((self._header_start, end))
+            self._header_start = end
+
+    def _flush(self, send):
+        self._end_header_segment()
+        header = memoryview(self._header)
+        buffers = [
+            header[segment[0]:segment[1]]
+            if isinstance(segment, tuple) else segment
+            for segment in self._segments]
+        written = 0
+        index = 0
+        try:
+            while index < len(buffers):
+                sent = send(buffers[index:index + _IOV_MAX])
+                written += sent
+                while index < len(buffers) and sent >= len(buffers[index]):
+                    sent -= len(buffers[index])
+                    index += 1
+                if sent > 0:
+                    buffers[index] = buffers[index][sent:]
+        finally:
+            # Whatever was not written is kept, with header parts copied out
+            # so that the header buffer can be reused.
+            remaining = []
+            for position, buffer in enumerate(buffers):
+                if position >= index:
+                    if buffer.obj is self._header:
+                        remaining.append(memoryview(buffer.tobytes()))
+                    else:
+                        remaining.append(buffer)
+                        continue
+                buffer.release()
+            header.release()
+            self._segments = []
+            self.clear()
+            self._segments = remaining
+            self._size = sum(map(len, remaining))
+        return written
+
+
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024
@@ -0,0 +1,766 @@
+import array
+import codecs
+import linecache
+import struct
+from collections import namedtuple
+from pyjak.convert import (
+    BinaryError, BinarySizeMismatch, _DUMP_FUNCS, _byte_view)
+from pyjak.datatype import DataType, _BOUNDS, _INTEGER_TYPES, _TYPECODES
+from pyjak.order import ByteOrder, _byte_order
+
+
+class Padding(namedtuple("Padding", ["size"])):
+    """
+    A layout element of unused bytes. Padding is skipped when parsing and
+    written as zero bytes when dumping.
+    Args:
+        size: The number of unused bytes.
+    """
+    __slots__ = ()
+
+
+class Conditional(namedtuple("Conditional", ["field", "element"])):
+    """
+    A layout element that is only present if an earlier field of the layout
+    holds a truthy value. Absent elements are parsed as None.
+    Args:
+        field: The name of the earlier field deciding if the element is
+            present.
+        element: The element that may be present.
+    """
+    __slots__ = ()
+
+
+class CountedArray(namedtuple(
+        "CountedArray", ["count_type", "item", "max_count"])):
+    """
+    A layout element holding a variable number of items, preceded by the
+    number of items. Arrays are parsed as lists.
+    Args:
+        count_type: The integer DataType of the item count.
+        item: The DataType or Layout of the items.
+        max_count: The maximum number of items. Defaults to the largest
+            count that count_type can hold. Set a sensible maximum when
+            parsing untrusted input.
+    """
+    __slots__ = ()
+
+    def __new__(cls, count_type, item, max_count=None):
+        return super().__new__(cls, count_type, item, max_count)
+
+
+class PrefixedString(namedtuple(
+        "PrefixedString", ["length_type", "max_length", "encoding"])):
+    """
+    A layout element holding a string, preceded by the number of bytes of the
+    encoded string.
+    Args:
+        length_type: The integer DataType of the length.
+        max_length: The maximum number of bytes of the encoded string.
+            Defaults to the largest length that length_type can hold. Set a
+            sensible maximum when parsing untrusted input.
+        encoding: The encoding of the string. Defaults to UTF-8.
+    """
+    __slots__ = ()
+
+    def __new__(cls, length_type, max_length=None, encoding="utf-8"):
+        return super().__new__(cls, length_type, max_length, encoding)
+
+
+class Layout:
+    """
+    Describes the binary layout of a record as an ordered sequence of named
+    fields. A dedicated Python function is generated for parsing and dumping
+    records of each layout and byte order, so that runs of fixed size fields
+    are converted with a single struct call.
+    Args:
+        fields: A sequence of (name, element) pairs, where each element is a
+            DataType, Padding, Conditional, CountedArray, PrefixedString or
+            a nested Layout. The name of Padding elements may be None.
+    Raises:
+        TypeError: If an element is not of a supported type.
+        ValueError: If a field name is used more than once, a Conditional
+            refers to a field that is not defined before it or is padding,
+            or an element is otherwise invalid.
+    """
+
+    def __init__(self, fields):
+        self._fields = tuple((name, element) for name, element in fields)
+        names = set()
+        # Names of the fields holding values, which conditionals may refer to.
+        values = set()
+        for name, element in self._fields:
+            _check_element(element, values)
+            if name is None and not isinstance(element, Padding):
+                raise ValueError("Only padding fields may be unnamed.")
+            if name in names:
+                raise ValueError(
+                    "Field name '{0}' is used more than once.".format(name))
+            if name is not None:
+                names.add(name)
+                if not isinstance(element, Padding):
+                    values.add(name)
+        self._size = _fixed_size(self)
+        self._codecs = {}
+
+    def __eq__(self, other):
+        if not isinstance(other, Layout):
+            return NotImplemented
+        return self._fields == other._fields
+
+    def __hash__(self):
+        return hash(self._fields)
+
+    def __repr__(self):
+        return "Layout({0!r})".format(list(self._fields))
+
+    @property
+    def fields(self):
+        """
+        The (name, element) pairs of the layout.
+        """
+        return self._fields
+
+    @property
+    def size(self):
+        """
+        The number of bytes of a record, or None if the size depends on the
+        content of the record.
+        """
+        return self._size
+
+    def parse(self, _bytes, order=None):
+        """
+        Parses a given byte array as a single record.
+        Args:
+            _bytes: The byte array to be parsed.
+            order: The byte order of the byte array. Defaults to native order.
+        Raises:
+            TypeError: If byte array is not bytes-like.
+            BinarySizeMismatch: If length of byte array does not match the
+                length of the record.
+            BinaryError: If an unexpected conversion error occurs.
+        Returns:
+            A dict mapping field names to the values that were parsed.
+        """
+        record, end = self.parse_from(_bytes, 0, order)
+        if end != len(_bytes):
+            raise BinarySizeMismatch(
+                "Length of byte array is {0}, expected {1}."
+                .format(len(_bytes), end))
+        return record
+
+    def parse_from(self, buffer, offset=0, order=None):
+        """
+        Parses a single record starting at a given offset of a byte array.
+        Trailing bytes after the record are ignored.
+        Args:
+            buffer: The byte array to be parsed.
+            offset: The offset of the record in the byte array.
+            order: The byte order of the byte array. Defaults to native order.
+        Raises:
+            TypeError: If byte array is not bytes-like.
+            ValueError: If offset is negative.
+            BinarySizeMismatch: If the byte array ends before the record.
+            BinaryError: If an unexpected conversion error occurs.
+        Returns:
+            A tuple of the parsed record and the offset right after it.
+        """
+        if offset < 0:
+            raise _negative_offset(offset)
+        codec = self._codecs.get(order)
+        if codec is None:
+            codec = self._compile(order)
+        try:
+            record, end = codec.decode(buffer, offset)
+        except struct.error as e:
+            raise _too_short(buffer) from e
+        except TypeError as e:
+            _check_bytes_like(buffer)
+            raise BinaryError(
+                "Could not parse bytes {0}.".format(buffer)) from e
+        except UnicodeDecodeError as e:
+            raise BinaryError(
+                "Could not decode string: {0}".format(e)) from e
+        if end > len(buffer):
+            raise _too_short(buffer)
+        return record, end
+
+    def dump(self, record, order=None):
+        """
+        Serializes a given record in binary form.
+        Args:
+            record: A mapping of field names to values.
+            order: The byte order of the returned byte array. Defaults to
+                native order.
+        Raises:
+            KeyError: If a field is missing from the record.
+            TypeError: If a value is of the wrong type.
+            BinarySizeMismatch: If a value is too small or too big to be held
+                by its field.
+            BinaryError: If an unexpected conversion error occurs.
+        Returns:
+            A byte array containing the serialized record.
+        """
+        codec = self._codecs.get(order)
+        if codec is None:
+            codec = self._compile(order)
+        try:
+            return codec.encode(record)
+        except (struct.error, OverflowError, TypeError) as e:
+            _raise_dump_error(self, record, _byte_order(order), e)
+
+    def dump_into(self, record, buffer, offset=0, order=None):
+        """
+        Serializes a given record straight into a byte array, starting at a
+        given offset. Records of layouts holding only DataType and Padding
+        fields are packed in place without creating intermediate bytes.
+        Args:
+            record: A mapping of field names to values.
+            buffer: The writable byte array to serialize the record into.
+            offset: The offset of the record in the byte array.
+            order: The byte order of the record. Defaults to native order.
+        Raises:
+            KeyError: If a field is missing from the record.
+            TypeError: If a value is of the wrong type, or byte array is not
+                writable and bytes-like.
+            ValueError: If offset is negative.
+            BinarySizeMismatch: If a value is too small or too big to be held
+                by its field, or the byte array ends before the record.
+            BinaryError: If an unexpected conversion error occurs.
+        Returns:
+            The offset right after the record.
+        """
+        if offset < 0:
+            raise _negative_offset(offset)
+        codec = self._codecs.get(order)
+        if codec is None:
+            codec = self._compile(order)
+        if codec.encode_into is None:
+            _bytes = self.dump(record, order)
+            with _writable_view(buffer) as view:
+                end = offset + len(_bytes)
+                if end > len(view):
+                    raise _too_short(view)
+                view[offset:end] = _bytes
+            return end
+        try:
+            codec.encode_into(record, buffer, offset)
+        except (struct.error, OverflowError, TypeError) as e:
+            with _writable_view(buffer) as view:
+                if offset + self._size > len(view):
+                    raise _too_short(view) from e
+            _raise_dump_error(self, record, _byte_order(order), e)
+        return offset + self._size
+
+    def source(self, order=None):
+        """
+        Returns the source code of the functions generated for the layout,
+        which is useful for debugging.
+        Args:
+            order: The byte order the functions were generated for. Defaults
+                to native order.
+        """
+        return self._codec(order).source
+
+    def _codec(self, order):
+        codec = self._codecs.get(order)
+        if codec is None:
+            codec = self._compile(order)
+        return codec
+
+    def _compile(self, order):
+        codec = _compile_layout(self, _byte_order(order))
+        self._codecs[order] = codec
+        return codec
+
+
+class _Truncated(BinarySizeMismatch):
+    # Raised when a byte array ends before the end of a record, so streaming
+    # readers can tell truncation from invalid content and read more bytes.
+    pass
+
+
+_Codec = namedtuple(
+    "_Codec", ["decode", "encode", "encode_into", "source"])
+
+
+def _check_element(element, names):
+    if isinstance(element, (DataType, Layout)):
+        return
+    if isinstance(element, Padding):
+        _check_maximum(element.size, "Padding size")
+        return
+    if isinstance(element, Conditional):
+        if element.field not in names:
+            raise ValueError(
+                "Conditional refers to field '{0}', which is not defined "
+                "before it or holds no value.".format(element.field))
+        _check_element(element.element, names)
+        return
+    if isinstance(element, CountedArray):
+        _check_count_type(element.count_type)
+        if not isinstance(element.item, (DataType, Layout)):
+            raise TypeError(
+                "Expected DataType or Layout as array item, not '{0}'."
+                .format(type(element.item).__name__))
+        if element.max_count is not None:
+            _check_maximum(element.max_count, "Maximum count")
+        return
+    if isinstance(element, PrefixedString):
+        _check_count_type(element.length_type)
+        if element.max_length is not None:
+            _check_maximum(element.max_length, "Maximum length")
+        codecs.lookup(element.encoding)
+        return
+    raise TypeError(
+        "Expected layout element, not '{0}'.".format(type(element).__name__))
+
+
+def _check_count_type(count_type):
+    if count_type not in _INTEGER_TYPES:
+        raise ValueError(
+            "Expected integer DataType as count type, not {0!r}."
+            .format(count_type))
+
+
+def _check_maximum(value, description):
+    if not isinstance(value, int) or value < 0:
+        raise ValueError(
+            "{0} must be a non-negative integer, not {1!r}."
+            .format(description, value))
+
+
+def _limit(count_type, maximum):
+    type_maximum = _BOUNDS[count_type][1]
+    if maximum is None:
+        return type_maximum
+    return min(maximum, type_maximum)
+
+
+def _fixed_size(layout):
+    size = 0
+    for _, element in layout.fields:
+        element_size = _element_size(element)
+        if element_size is None:
+            return None
+        size += element_size
+    return size
+
+
+def _element_size(element):
+    if isinstance(element, (DataType, Padding, Layout)):
+        return element.size
+    return None
+
+
+def _element_format(element):
+    if isinstance(element, Padding):
+        return "{0}x".format(element.size)
+    return element.format
+
+
+def _is_flat(fields):
+    return all(
+        isinstance(element, (DataType, Padding)) for _, element in fields)
+
+
+def _needs_view(element):
+    if isinstance(element, Layout):
+        return any(_needs_view(field) for _, field in element.fields)
+    if isinstance(element, Conditional):
+        return _needs_view(element.element)
+    if isinstance(element, CountedArray):
+        return isinstance(element.item, DataType)
+    return isinstance(element, PrefixedString)
+
+
+def _compile_layout(layout, order):
+    generator = _Generator(order)
+    source = generator.decoder(layout) + "\n\n" + generator.encoder(layout)
+    filename = "<pyjak layout {0:#x} {1}>".format(id(layout), order.name)
+    exec(compile(source, filename, "exec"), generator.namespace)
+    # Registering the source lets tracebacks show the generated lines.
+    linecache.cache[filename] = (
+        len(source), None, source.splitlines(True), filename)
+    namespace = generator.namespace
+    return _Codec(
+        namespace["decode"], namespace["encode"], namespace.get("encode_into"),
+        source)
+
+
+class _Generator:
+    def __init__(self, order):
+        self.namespace = {
+            "_array": array.array,
+            "_byte_view": _byte_view,
+            "_check_bool": _check_bool,
+            "_encode_str": str.encode,
+            "_pack": struct.pack,
+            "_struct_error": struct.error,
+            "_parse_limit_error": _parse_limit_error,
+            "_dump_limit_error": _dump_limit_error,
+        }
+        self._order = order
+        self._prefix = "<" if order == ByteOrder.LITTLE else ">"
+        self._structs = {}
+        self._layouts = {}
+        self._temporaries = 0
+
+    def decoder(self, layout):
+        body = []
+        variables = {}
+        values = []
+        run = []
+        const = 0
+        for index, (name, element) in enumerate(layout.fields):
+            variable = "v{0}".format(index)
+            if isinstance(element, (DataType, Padding)):
+                run.append((element, variable))
+            elif _element_size(element) is not None:
+                # Fixed size nested layouts do not interrupt constant offsets.
+                const = self._decode_run(body, run, const)
+                run = []
+                body.append("{0} = {1}(buffer, {2})[0]".format(
+                    variable, self._layout(element)[0],
+                    _offset_expression(const)))
+                const += element.size
+            else:
+                const = self._decode_run(body, run, const)
+                run = []
+                if const:
+                    body.append("offset += {0}".format(const))
+                    const = 0
+                self._decode_element(
+                    body, element, name, variable, variables, "")
+            if name is not None and not isinstance(element, Padding):
+                variables[name] = variable
+                values.append("{0!r}: {1}".format(name, variable))
+        const = self._decode_run(body, run, const)
+        body.append("return {{{0}}}, {1}".format(
+            ", ".join(values), _offset_expression(const)))
+        if not _needs_view(layout):
+            lines = ["def decode(buffer, offset):"]
+            lines.extend("    " + line for line in body)
+        else:
+            lines = [
+                "def decode(buffer, offset):",
+                "    view = _byte_view(buffer)",
+                "    try:"]
+            lines.extend("        " + line for line in body)
+            lines.extend(["    finally:", "        view.release()"])
+        return "\n".join(lines) + "\n"
+
+    def encoder(self, layout):
+        if _is_flat(layout.fields):
+            arguments = self._encode_arguments(layout.fields)
+            name = self._struct(_run_format(layout.fields))
+            return (
+                "def encode(record):\n    return {0}.pack({1})\n\n\n"
+                "def encode_into(record, buffer, offset):\n"
+                "    {0}.pack_into(buffer, offset, {1})\n"
+                .format(name, arguments))
+        lines = [
+            "def encode(record):",
+            "    parts = []",
+            "    append = parts.append"]
+        run = []
+        for name, element in layout.fields:
+            if isinstance(element, (DataType, Padding)):
+                run.append((name, element))
+                continue
+            self._encode_run(lines, run)
+            run = []
+            self._encode_element(
+                lines, element, name, "record[{0!r}]".format(name), "    ")
+        self._encode_run(lines, run)
+        lines.append("    return b''.join(parts)")
+        return "\n".join(lines) + "\n"
+
+    def _decode_run(self, lines, run, const):
+        if not run:
+            return const
+        _format = _run_format([(None, element) for element, _ in run])
+        targets = [
+            variable for element, variable in run
+            if not isinstance(element, Padding)]
+        if targets:
+            lines.append("{0}, = {1}.unpack_from(buffer, {2})".format(
+                ", ".join(targets), self._struct(_format),
+                _offset_expression(const)))
+        return const + struct.calcsize(self._prefix + _format)
+
+    def _decode_element(self, lines, element, name, variable, variables,
+                        indent):
+        if isinstance(element, DataType):
+            lines.append("{0}{1}, = {2}.unpack_from(buffer, offset)".format(
+                indent, variable, self._struct(element.format)))
+            lines.append("{0}offset += {1}".format(indent, element.size))
+        elif isinstance(element, Padding):
+            lines.append("{0}{1} = None".format(indent, variable))
+            lines.append("{0}offset += {1}".format(indent, element.size))
+        elif isinstance(element, Layout):
+            lines.append("{0}{1}, offset = {2}(buffer, offset)".format(
+                indent, variable, self._layout(element)[0]))
+        elif isinstance(element, Conditional):
+            lines.append("{0}if {1}:".format(
+                indent, variables[element.field]))
+            self._decode_element(
+                lines, element.element, name, variable, variables,
+                indent + "    ")
+            lines.append("{0}else:".format(indent))
+            lines.append("{0}    {1} = None".format(indent, variable))
+        elif isinstance(element, PrefixedString):
+            start = self._decode_count(
+                lines, element.length_type, element.max_length, name,
+                variable, indent)
+            lines.append("{0}{1}_end = {2} + {1}_n".format(
+                indent, variable, start))
+            self._check_end(lines, variable, indent)
+            lines.append("{0}{1} = str(view[{2}:{1}_end], {3!r})".format(
+                indent, variable, start, element.encoding))
+            lines.append("{0}offset = {1}_end".format(indent, variable))
+        elif isinstance(element.item, Layout):
+            self._decode_count(
+                lines, element.count_type, element.max_count, name, variable,
+                indent)
+            lines.append("{0}offset += {1}".format(
+                indent, element.count_type.size))
+            lines.append("{0}{1} = []".format(indent, variable))
+            lines.append("{0}for _ in range({1}_n):".format(indent, variable))
+            lines.append(
+                "{0}    {1}_item, offset = {2}(buffer, offset)".format(
+                    indent, variable, self._layout(element.item)[0]))
+            lines.append("{0}    {1}.append({1}_item)".format(
+                indent, variable))
+        else:
+            item = element.item
+            start = self._decode_count(
+                lines, element.count_type, element.max_count, name, variable,
+                indent)
+            lines.append("{0}{1}_end = {2} + {1}_n * {3}".format(
+                indent, variable, start, item.size))
+            self._check_end(lines, variable, indent)
+            if item == DataType.BOOL:
+                lines.append("{0}{1} = list(map(bool, view[{2}:{1}_end]))"
+                             .format(indent, variable, start))
+            else:
+                lines.append("{0}{1} = _array({2!r})".format(
+                    indent, variable, _TYPECODES[item]))
+                lines.append("{0}{1}.frombytes(view[{2}:{1}_end])".format(
+                    indent, variable, start))
+                if item.size > 1 and self._order != ByteOrder.NATIVE:
+                    lines.append("{0}{1}.byteswap()".format(indent, variable))
+                lines.append("{0}{1} = {1}.tolist()".format(indent, variable))
+            lines.append("{0}offset = {1}_end".format(indent, variable))
+
+    def _decode_count(self, lines, count_type, maximum, name, variable,
+                      indent):
+        lines.append("{0}{1}_n, = {2}.unpack_from(buffer, offset)".format(
+            indent, variable, self._struct(count_type.format)))
+        limit = _limit(count_type, maximum)
+        if limit < _BOUNDS[count_type][1]:
+            lines.append("{0}if {1}_n > {2}:".format(indent, variable, limit))
+            lines.append(
+                "{0}    raise _parse_limit_error({1!r}, {2}_n, {3})".format(
+                    indent, name, variable, limit))
+        return "offset + {0}".format(count_type.size)
+
+    def _check_end(self, lines, variable, indent):
+        lines.append("{0}if {1}_end > view.nbytes:".format(indent, variable))
+        lines.append("{0}    raise _struct_error".format(indent))
+
+    def _encode_run(self, lines, run):
+        if not run:
+            return
+        lines.append("    append({0}.pack({1}))".format(
+            self._struct(_run_format(run)), self._encode_arguments(run)))
+
+    def _encode_element(self, lines, element, name, value, indent):
+        if isinstance(element, DataType):
+            lines.append("{0}append({1}.pack({2}))".format(
+                indent, self._struct(element.format),
+                _encode_argument(element, value)))
+        elif isinstance(element, Padding):
+            lines.append("{0}append({1!r})".format(
+                indent, bytes(element.size)))
+        elif isinstance(element, Layout):
+            lines.append("{0}append({1}({2}))".format(
+                indent, self._layout(element)[1], value))
+        elif isinstance(element, Conditional):
+            lines.append("{0}if record[{1!r}]:".format(
+                indent, element.field))
+            self._encode_element(
+                lines, element.element, name, value, indent + "    ")
+        elif isinstance(element, PrefixedString):
+            temporary = self._temporary()
+            lines.append("{0}{1} = _encode_str({2}, {3!r})".format(
+                indent, temporary, value, element.encoding))
+            self._encode_count(
+                lines, element.length_type, element.max_length, name,
+                temporary, indent)
+            lines.append("{0}append({1})".format(indent, temporary))
+        else:
+            temporary = self._temporary()
+            lines.append("{0}{1} = {2}".format(indent, temporary, value))
+            self._encode_count(
+                lines, element.count_type, element.max_count, name, temporary,
+                indent)
+            if isinstance(element.item, Layout):
+                lines.append("{0}for {1}_item in {1}:".format(
+                    indent, temporary))
+                lines.append("{0}    append({1}({2}_item))".format(
+                    indent, self._layout(element.item)[1], temporary))
+            else:
+                items = temporary
+                if element.item == DataType.BOOL:
+                    items = "map(_check_bool, {0})".format(temporary)
+                lines.append("{0}append(_pack({1!r} % {2}_n, *{3}))".format(
+                    indent, self._prefix + "%d" + element.item.format,
+                    temporary, items))
+
+    def _encode_count(self, lines, count_type, maximum, name, temporary,
+                      indent):
+        limit = _limit(count_type, maximum)
+        lines.append("{0}{1}_n = len({1})".format(indent, temporary))
+        lines.append("{0}if {1}_n > {2}:".format(indent, temporary, limit))
+        lines.append(
+            "{0}    raise _dump_limit_error({1!r}, {2}_n, {3})".format(
+                indent, name, temporary, limit))
+        lines.append("{0}append({1}.pack({2}_n))".format(
+            indent, self._struct(count_type.format), temporary))
+
+    def _encode_arguments(self, fields):
+        return ", ".join(
+            _encode_argument(element, "record[{0!r}]".format(name))
+            for name, element in fields
+            if not isinstance(element, Padding))
+
+    def _struct(self, _format):
+        name = self._structs.get(_format)
+        if name is None:
+            name = "_s{0}".format(len(self._structs))
+            self._structs[_format] = name
+            self.namespace[name] = struct.Struct(self._prefix + _format)
+        return name
+
+    def _layout(self, layout):
+        names = self._layouts.get(layout)
+        if names is None:
+            index = len(self._layouts)
+            names = ("_decode{0}".format(index), "_encode{0}".format(index))
+            self._layouts[layout] = names
+            codec = layout._codec(self._order)
+            self.namespace[names[0]] = codec.decode
+            self.namespace[names[1]] = codec.encode
+        return names
+
+    def _temporary(self):
+        self._temporaries += 1
+        return "t{0}".format(self._temporaries)
+
+
+def _run_format(fields):
+    return "".join(_element_format(element) for _, element in fields)
+
+
+def _encode_argument(element, value):
+    # Struct packs any object as a bool, so bools are checked beforehand.
+    if element == DataType.BOOL:
+        return "_check_bool({0})".format(value)
+    return value
+
+
+def _check_bool(value):
+    if value is True or value is False:
+        return value
+    raise TypeError(
+        "Expected object of bool-like type, not '{0}'."
+        .format(type(value).__name__))
+
+
+def _offset_expression(const):
+    if const:
+        return "offset + {0}".format(const)
+    return "offset"
+
+
+def _negative_offset(offset):
+    return ValueError(
+        "Offset must not be negative, not {0!r}.".format(offset))
+
+
+def _parse_limit_error(name, length, limit):
+    return BinarySizeMismatch(
+        "Could not parse field '{0}': Length {1} exceeds the maximum of {2}."
+        .format(name, length, limit))
+
+
+def _dump_limit_error(name, length, limit):
+    return BinarySizeMismatch(
+        "Could not dump field '{0}': Length {1} exceeds the maximum of {2}."
+        .format(name, length, limit))
+
+
+def _raise_dump_error(layout, record, order, error):
+    _find_dump_error(layout, record, order)
+    raise BinaryError("Could not dump record {0!r}.".format(record)) from error
+
+
+def _find_dump_error(layout, record, order):
+    for name, element in layout.fields:
+        if isinstance(element, Padding):
+            continue
+        if isinstance(element, Conditional):
+            if not record[element.field]:
+                continue
+            element = element.element
+        try:
+            _check_value(element, record[name], order)
+        except (TypeError, BinaryError) as e:
+            raise type(e)(
+                "Could not dump field '{0}': {1}".format(name, e)) from e
+
+
+def _check_value(element, value, order):
+    if isinstance(element, DataType):
+        dump_func = _DUMP_FUNCS[element]
+        if element.size == 1:
+            dump_func(value)
+        else:
+            dump_func(value, order)
+    elif isinstance(element, Layout):
+        _find_dump_error(element, value, order)
+    elif isinstance(element, CountedArray):
+        for item in value:
+            _check_value(element.item, item, order)
+    elif isinstance(element, PrefixedString):
+        if not isinstance(value, str):
+            raise TypeError(
+                "Expected object of str type, not '{0}'."
+                .format(type(value).__name__))
+
+
+def _check_bytes_like(buffer):
+    try:
+        memoryview(buffer).release()
+    except TypeError:
+        raise TypeError(
+            "Expected object of bytes-like type, not '{0}'."
+            .format(type(buffer).__name__))
+
+
+def _writable_view(buffer):
+    view = _byte_view(buffer)
+    if view.readonly:
+        view.release()
+        raise TypeError(
+            "Expected object of writable bytes-like type, not '{0}'."
+            .format(type(buffer).__name__))
+    return view
+
+
+def _too_short(buffer):
+    return _Truncated(
+        "Byte array of length {0} ends before the end of the record."
+        .format(len(buffer)))
@@ -14,3 +14,34 @@ class ByteOrder(Enum):
 
     # Represents the native byte order of the system running the code.
     NATIVE = LITTLE if sys.byteorder == "little" else BIG
+
+    @classmethod
+    def _missing_(cls, value):
+        # Lets byte orders be looked up by name, for example ByteOrder("be").
+        if isinstance(value, str):
+            return _NAMES.get(value.lower())
+        return None
+
+
+def _byte_order(order):
+    if order is None:
+        return ByteOrder.NATIVE
+    if not isinstance(order, ByteOrder):
+        raise TypeError(
+            "Expected object of ByteOrder type, not '{0}'."
+            .format(type(order).__name__))
+    return order
+
+
+_NAMES = {
+    "little": ByteOrder.LITTLE,
+    "le": ByteOrder.LITTLE,
+    "<": ByteOrder.LITTLE,
+    "big": ByteOrder.BIG,
+    "be": ByteOrder.BIG,
+    ">": ByteOrder.BIG,
+    "network": ByteOrder.BIG,
+    "!": ByteOrder.BIG,
+    "native": ByteOrder.NATIVE,
+    "=": ByteOrder.NATIVE,
+}
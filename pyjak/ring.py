@@ -0,0 +1,309 @@
+import os
+import sys
+from itertools import islice
+from multiprocessing import resource_tracker, shared_memory
+from pyjak.convert import BinaryError
+
+
+class SharedRing:
+    """
+    A queue of records of a fixed size layout, held in a block of shared
+    memory so that records can be passed between processes without pickling.
+    Records are packed straight into the slots of the ring and parsed
+    straight from them.
+    One process may put records while another one gets them. The head and
+    tail of the ring are 8 byte integers on separate cache lines, each
+    written by one side only, so no lock is needed on platforms where
+    aligned 8 byte writes are atomic and ordered, such as x86-64.
+    Args:
+        name: The name of the shared memory block.
+        layout: The Layout of the records. Must be of fixed size.
+        capacity: The number of records the ring can hold. If given, a new
+            shared memory block is created. Otherwise an existing block is
+            attached.
+        order: The byte order of the records. Defaults to native order.
+    Raises:
+        TypeError: If order is not a ByteOrder.
+        ValueError: If the layout is not of fixed size, or capacity is not a
+            positive integer.
+        FileExistsError: If creating a block whose name is already taken.
+        FileNotFoundError: If attaching a block that does not exist.
+        BinaryError: If the attached block does not hold a ring of records of
+            the layout, or is too small for its capacity.
+    """
+
+    def __init__(self, name, layout, capacity=None, order=None):
+        record_size = layout.size
+        if record_size is None:
+            raise ValueError(
+                "Expected layout of fixed size, not {0!r}.".format(layout))
+        if capacity is not None and (
+                not isinstance(capacity, int) or capacity <= 0):
+            raise ValueError(
+                "Capacity must be positive, not {0!r}.".format(capacity))
+        # Resolved first, so that an invalid order leaves no block behind.
+        codec = layout._codec(order)
+        if capacity is None:
+            self._memory = _attach_memory(name)
+            if self._memory.size < _DATA_OFFSET:
+                self._memory.close()
+                raise BinaryError("Shared memory block does not hold a ring.")
+        else:
+            self._memory = shared_memory.SharedMemory(
+                name, create=True, size=_DATA_OFFSET + capacity * record_size)
+        self._control = self._memory.buf[:_DATA_OFFSET].cast("Q")
+        if capacity is None:
+            capacity = self._attach(record_size)
+        else:
+            self._control[_CAPACITY] = capacity
+            self._control[_RECORD_SIZE] = record_size
+            self._control[_HEAD] = 0
+            self._control[_TAIL] = 0
+            self._control[_MAGIC_INDEX] = _MAGIC
+        self._slots = self._memory.buf[
+            _DATA_OFFSET:_DATA_OFFSET + capacity * record_size]
+        self._layout = layout
+        self._codec = codec
+        self._capacity = capacity
+        self._record_size = record_size
+        self._order = order
+
+    def __len__(self):
+        return self._control[_HEAD] - self._control[_TAIL]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def name(self):
+        """
+        The name of the shared memory block.
+        """
+        return self._memory.name
+
+    @property
+    def capacity(self):
+        """
+        The number of records the ring can hold.
+        """
+        return self._capacity
+
+    def put(self, record):
+        """
+        Adds a single record to the ring. Only one process may put records.
+        Args:
+            record: A mapping of field names to values.
+        Raises:
+            Any exception raised by Layout.dump_into.
+        Returns:
+            True if the record was added, or False if the ring is full.
+        """
+        control = self._control
+        head = control[_HEAD]
+        if head - control[_TAIL] >= self._capacity:
+            return False
+        self._layout.dump_into(
+            record, self._slots, head % self._capacity * self._record_size,
+            self._order)
+        control[_HEAD] = head + 1
+        return True
+
+    def put_many(self, records):
+        """
+        Adds records to the ring until it is full, publishing them all at
+        once. Only one process may put records.
+        Args:
+            records: An iterable of mappings of field names to values.
+        Raises:
+            Any exception raised by Layout.dump_into. Records packed before
+            the failing one are not added.
+        Returns:
+            The number of records that were added.
+        """
+        control = self._control
+        head = control[_HEAD]
+        free = self._capacity - (head - control[_TAIL])
+        capacity = self._capacity
+        record_size = self._record_size
+        encode_into = self._codec.encode_into
+        slots = self._slots
+        count = 0
+        for record in islice(records, free):
+            offset = (head + count) % capacity * record_size
+            if encode_into is None:
+                self._layout.dump_into(record, slots, offset, self._order)
+            else:
+                try:
+                    encode_into(record, slots, offset)
+                except Exception:
+                    # Raises the error with the failing field named.
+                    self._layout.dump_into(record, slots, offset, self._order)
+                    raise
+            count += 1
+        control[_HEAD] = head + count
+        return count
+
+    def get(self):
+        """
+        Removes the oldest record from the ring. Only one process may get
+        records.
+        Raises:
+            BinaryError: If an unexpected conversion error occurs.
+        Returns:
+            A dict mapping field names to the values that were parsed, or None
+            if the ring is empty.
+        """
+        control = self._control
+        tail = control[_TAIL]
+        if tail == control[_HEAD]:
+            return None
+        record, _ = self._layout.parse_from(
+            self._slots, tail % self._capacity * self._record_size,
+            self._order)
+        control[_TAIL] = tail + 1
+        return record
+
+    def get_many(self, max_count=None):
+        """
+        Removes the oldest records from the ring at once. Only one process may
+        get records.
+        Args:
+            max_count: The maximum number of records to remove. Defaults to
+                every record in the ring.
+        Raises:
+            BinaryError: If an unexpected conversion error occurs.
+        Returns:
+            A list of dicts mapping field names to the values that were
+            parsed.
+        """
+        control = self._control
+        tail = control[_TAIL]
+        count = control[_HEAD] - tail
+        if max_count is not None:
+            count = min(count, max_count)
+        capacity = self._capacity
+        record_size = self._record_size
+        decode = self._codec.decode
+        slots = self._slots
+        try:
+            records = [
+                decode(slots, index % capacity * record_size)[0]
+                for index in range(tail, tail + count)]
+        except Exception:
+            # Raises the error as Layout.parse_from reports it.
+            for index in range(tail, tail + count):
+                self._layout.parse_from(
+                    slots, index % capacity * record_size, self._order)
+            raise
+        control[_TAIL] = tail + count
+        return records
+
+    def peek(self, max_count=None):
+        """
+        Returns a view of the oldest records in the ring without copying or
+        removing them. The view covers consecutive slots only, so it may hold
+        fewer records than the ring when they wrap around its end. Call
+        consume once done with the records, and release the view before
+        closing the ring.
+        Args:
+            max_count: The maximum number of records in the view. Defaults to
+                every record up to the end of the ring.
+        Returns:
+            A memoryview of the serialized records.
+        """
+        control = self._control
+        tail = control[_TAIL]
+        start = tail % self._capacity
+        count = min(control[_HEAD] - tail, self._capacity - start)
+        if max_count is not None:
+            count = min(count, max_count)
+        return self._slots[
+            start * self._record_size:(start + count) * self._record_size]
+
+    def consume(self, count):
+        """
+        Removes a given number of the oldest records from the ring, typically
+        after reading them through peek.
+        Args:
+            count: The number of records to remove.
+        Raises:
+            ValueError: If the ring holds fewer records than count.
+        """
+        control = self._control
+        tail = control[_TAIL]
+        if count < 0 or count > control[_HEAD] - tail:
+            raise ValueError(
+                "Cannot consume {0} records, the ring holds {1}."
+                .format(count, control[_HEAD] - tail))
+        control[_TAIL] = tail + count
+
+    def close(self):
+        """
+        Detaches the ring from the shared memory block. Every view returned
+        by peek must be released first.
+        """
+        self._slots.release()
+        self._control.release()
+        self._memory.close()
+
+    def unlink(self):
+        """
+        Destroys the shared memory block. Should be called once, by the
+        process that created the ring.
+        """
+        if _UNTRACK:
+            # The registration may have been dropped by a forked child that
+            # attached the block, and unlinking unregisters it again.
+            resource_tracker.register(self._memory._name, "shared_memory")
+        self._memory.unlink()
+
+    def _attach(self, record_size):
+        control = self._control
+        error = None
+        if control[_MAGIC_INDEX] != _MAGIC:
+            error = BinaryError("Shared memory block does not hold a ring.")
+        elif control[_RECORD_SIZE] != record_size:
+            error = BinaryError(
+                "Ring holds records of {0} bytes, expected {1}."
+                .format(control[_RECORD_SIZE], record_size))
+        elif (control[_CAPACITY] == 0 or _DATA_OFFSET +
+                control[_CAPACITY] * record_size > self._memory.size):
+            error = BinaryError(
+                "Ring capacity of {0} records does not fit its shared memory "
+                "block.".format(control[_CAPACITY]))
+        if error is not None:
+            control.release()
+            self._memory.close()
+            raise error
+        return control[_CAPACITY]
+
+
+def _attach_memory(name):
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    memory = shared_memory.SharedMemory(name)
+    if _UNTRACK:
+        # The resource tracker would unlink the block once this process
+        # exits, leaving the ring to the process that created it.
+        resource_tracker.unregister(memory._name, "shared_memory")
+    return memory
+
+
+# Whether attached blocks must be removed from the resource tracker, which is
+# only used on POSIX and is bypassed with track=False from Python 3.13.
+_UNTRACK = os.name == "posix" and sys.version_info < (3, 13)
+
+# The control block holds 8 byte integers. The head and tail are kept on
+# their own cache lines, as they are written by different processes.
+_MAGIC_INDEX = 0
+_CAPACITY = 1
+_RECORD_SIZE = 2
+_HEAD = 8
+_TAIL = 16
+_DATA_OFFSET = 192
+
+# "PJAKRING" when stored in little endian order.
+_MAGIC = 0x474e49524b414a50
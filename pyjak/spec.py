@@ -0,0 +1,150 @@
+import struct
+from collections import namedtuple
+from pyjak.convert import _DUMP_FUNCS, _PARSE_FUNCS, _format_with_order
+from pyjak.datatype import DataType
+from pyjak.order import ByteOrder
+
+
+def parse(_bytes, spec):
+    """
+    Parses a given byte array as a value of a given type spec.
+    Args:
+        _bytes: The byte array to be parsed.
+        spec: The type spec of the value. Either a DataType, parsed in native
+            order, or a string naming a data type followed by an optional
+            byte order, such as "int32", "u16be" or "f64<".
+    Raises:
+        TypeError: If byte array is not bytes-like, or spec is neither a str
+            nor a DataType.
+        ValueError: If spec is not a valid type spec.
+        BinarySizeMismatch: If length of byte array is not equal to the size
+            of the type.
+        BinaryError: If an unexpected conversion error occurs.
+    Returns:
+        The value that was parsed.
+    """
+    codec = _CODECS.get(spec)
+    if codec is None:
+        codec = _resolve(spec)
+    return codec.parse(_bytes)
+
+
+def dump(value, spec):
+    """
+    Serializes a given value as a given type spec.
+    Args:
+        value: The value to be serialized.
+        spec: The type spec of the value, as accepted by parse.
+    Raises:
+        TypeError: If the value is of the wrong type, or spec is neither a str
+            nor a DataType.
+        ValueError: If spec is not a valid type spec.
+        BinarySizeMismatch: If the value is too small or too big to be held
+            by the type.
+        BinaryError: If an unexpected conversion error occurs.
+    Returns:
+        A byte array containing the serialized value.
+    """
+    codec = _CODECS.get(spec)
+    if codec is None:
+        codec = _resolve(spec)
+    return codec.dump(value)
+
+
+def sizeof(spec):
+    """
+    Args:
+        spec: A type spec, as accepted by parse.
+    Raises:
+        TypeError: If spec is neither a str nor a DataType.
+        ValueError: If spec is not a valid type spec.
+    Returns:
+        The number of bytes of a value of the type spec.
+    """
+    codec = _CODECS.get(spec)
+    if codec is None:
+        codec = _resolve(spec)
+    return codec.size
+
+
+_Codec = namedtuple("_Codec", ["parse", "dump", "size"])
+
+
+def _resolve(spec):
+    if isinstance(spec, DataType):
+        _type, order = spec, ByteOrder.NATIVE
+    elif isinstance(spec, str):
+        _type, order = _split_spec(spec)
+    else:
+        raise TypeError(
+            "Expected object of str or DataType type, not '{0}'."
+            .format(type(spec).__name__))
+    codec = _CODECS_BY_TYPE.get((_type, order))
+    if codec is None:
+        codec = _build_codec(_type, order)
+        _CODECS_BY_TYPE[(_type, order)] = codec
+    _CODECS[spec] = codec
+    return codec
+
+
+def _split_spec(spec):
+    name = spec.strip().lower()
+    order = ByteOrder.NATIVE
+    for suffix in _ORDER_SUFFIXES:
+        if name.endswith(suffix) and name != suffix:
+            order = ByteOrder(suffix)
+            name = name[:-len(suffix)].rstrip("_- ")
+            break
+    _type = _TYPE_NAMES.get(name)
+    if _type is None:
+        raise ValueError("Unknown type spec {0!r}.".format(spec))
+    return _type, order
+
+
+def _build_codec(_type, order):
+    parse_func = _PARSE_FUNCS[_type]
+    dump_func = _DUMP_FUNCS[_type]
+    if _type.size == 1:
+        # The single byte functions are table driven and need no order.
+        return _Codec(parse_func, dump_func, 1)
+    value_struct = struct.Struct(_format_with_order(_type.format, order))
+    unpack = value_struct.unpack
+    pack = value_struct.pack
+
+    def parse_value(_bytes):
+        try:
+            return unpack(_bytes)[0]
+        except (struct.error, TypeError):
+            # Raises the error parse functions raise for this input.
+            return parse_func(_bytes, order)
+
+    def dump_value(value):
+        try:
+            return pack(value)
+        except (struct.error, OverflowError, TypeError):
+            # Raises the error dump functions raise for this value.
+            return dump_func(value, order)
+
+    return _Codec(parse_value, dump_value, _type.size)
+
+
+# Codecs keyed by the type specs they were resolved from, so that repeated
+# lookups of a spec take a single dict access.
+_CODECS = {}
+_CODECS_BY_TYPE = {}
+
+_ORDER_SUFFIXES = ("le", "be", "<", ">", "!", "=")
+
+_TYPE_NAMES = {_type.value: _type for _type in DataType}
+_TYPE_NAMES.update({
+    "i8": DataType.INT8,
+    "u8": DataType.UINT8,
+    "i16": DataType.INT16,
+    "u16": DataType.UINT16,
+    "i32": DataType.INT32,
+    "u32": DataType.UINT32,
+    "i64": DataType.INT64,
+    "u64": DataType.UINT64,
+    "f32": DataType.FLOAT32,
+    "f64": DataType.FLOAT64,
+})
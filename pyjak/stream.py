@@ -0,0 +1,502 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import struct
+import zlib
+from enum import Enum
+from pyjak.checksum import Checksum, _checksum
+from pyjak.convert import (
+    BinaryError, BinarySizeMismatch, ChecksumMismatch, _DUMP_FUNCS,
+    _byte_view, _format_with_order)
+from pyjak.datatype import DataType, _data_type
+from pyjak.layout import _Truncated
+from pyjak.order import _byte_order
+
+
+class Compression(Enum):
+    """
+    Enumeration of the compression formats of streams.
+    """
+    # Represents an uncompressed stream.
+    NONE = "none"
+
+    # Represents a zlib stream, as produced by zlib.compress.
+    ZLIB = "zlib"
+
+    # Represents a gzip file.
+    GZIP = "gzip"
+
+    # Represents an xz file.
+    LZMA = "lzma"
+
+    # Represents a bzip2 file.
+    BZ2 = "bz2"
+
+
+class BinaryReader:
+    """
+    Reads values and records from a binary file, decompressing it
+    incrementally if needed. Bytes are read in chunks into a single reusable
+    buffer and parsed straight from it, so the whole file is never held in
+    memory.
+    Args:
+        source: The path of the file, or a binary file object. File objects
+            are not closed by the reader.
+        compression: The Compression of the file. Defaults to NONE.
+        chunk_size: The number of bytes to read at a time.
+    Raises:
+        TypeError: If compression is not a Compression.
+    """
+
+    def __init__(self, source, compression=Compression.NONE,
+                 chunk_size=65536):
+        self._file, self._owned = _open_file(source, "rb", compression)
+        self._stream = _READERS[compression](self._file)
+        self._compressed = compression != Compression.NONE
+        self._chunk = bytearray(chunk_size)
+        self._chunk_view = memoryview(self._chunk)
+        self._buffer = bytearray()
+        self._position = 0
+        self._checksum_func = None
+        self._checksum_value = 0
+        self._checksum_start = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def read_bytes(self, size):
+        """
+        Reads a given number of bytes.
+        Args:
+            size: The number of bytes to read.
+        Raises:
+            BinarySizeMismatch: If the stream ends before size bytes.
+            BinaryError: If the stream could not be decompressed.
+        Returns:
+            The bytes that were read.
+        """
+        if not self._fill(size):
+            raise self._ended(size)
+        start = self._position
+        self._position = start + size
+        return bytes(self._buffer[start:self._position])
+
+    def read_value(self, _type, order=None):
+        """
+        Reads a single value of a given data type.
+        Args:
+            _type: The DataType of the value.
+            order: The byte order of the value. Defaults to native order.
+        Raises:
+            TypeError: If _type is not a DataType or order is not a
+                ByteOrder.
+            BinarySizeMismatch: If the stream ends before the value.
+            BinaryError: If the stream could not be decompressed.
+        Returns:
+            The value that was parsed.
+        """
+        value_struct = _STRUCTS.get((_type, order))
+        if value_struct is None:
+            value_struct = _value_struct(_type, order)
+        if not self._fill(value_struct.size):
+            raise self._ended(value_struct.size)
+        value, = value_struct.unpack_from(self._buffer, self._position)
+        self._position += value_struct.size
+        return value
+
+    def read_record(self, layout, order=None):
+        """
+        Reads a single record of a given layout.
+        Args:
+            layout: The Layout of the record.
+            order: The byte order of the record. Defaults to native order.
+        Raises:
+            BinarySizeMismatch: If the stream ends before the record.
+            BinaryError: If the record could not be parsed, or the stream
+                could not be decompressed.
+        Returns:
+            A dict mapping field names to the values that were parsed.
+        """
+        size = layout.size
+        if size is not None:
+            if not self._fill(size):
+                raise self._ended(size)
+            record, self._position = layout.parse_from(
+                self._buffer, self._position, order)
+            return record
+        while True:
+            try:
+                record, self._position = layout.parse_from(
+                    self._buffer, self._position, order)
+                return record
+            except _Truncated as e:
+                # The size of the record is unknown, so read until it fits.
+                available = len(self._buffer) - self._position
+                if not self._fill(available + 1):
+                    raise BinarySizeMismatch(
+                        "Stream ended {0} bytes into a record."
+                        .format(available)) from e
+
+    def iter_records(self, layout, order=None):
+        """
+        Iterates over the records of a given layout until the end of the
+        stream.
+        Args:
+            layout: The Layout of the records.
+            order: The byte order of the records. Defaults to native order.
+        Raises:
+            BinarySizeMismatch: If the stream ends in the middle of a record.
+            BinaryError: If a record could not be parsed, or the stream could
+                not be decompressed.
+        Returns:
+            An iterator of dicts mapping field names to the values that were
+            parsed.
+        """
+        while self._fill(1):
+            yield self.read_record(layout, order)
+
+    def begin_checksum(self, checksum=Checksum.CRC32):
+        """
+        Starts computing a checksum over the bytes read from now on. The
+        checksum is updated from the buffer as it is refilled, so the bytes
+        are not read a second time. Any checksum in progress is discarded.
+        Args:
+            checksum: The Checksum to compute. Defaults to CRC32.
+        Raises:
+            TypeError: If checksum is not a Checksum.
+        """
+        self._checksum_func, self._checksum_value = _checksum(checksum)
+        self._checksum_start = self._position
+
+    def end_checksum(self):
+        """
+        Stops computing the checksum begun by begin_checksum.
+        Raises:
+            ValueError: If no checksum has been begun.
+        Returns:
+            The checksum of the bytes read since begin_checksum, as an
+            unsigned 4 byte integer.
+        """
+        if self._checksum_func is None:
+            raise ValueError("No checksum has been begun.")
+        self._update_checksum()
+        self._checksum_func = None
+        return self._checksum_value
+
+    def verify_checksum(self, order=None):
+        """
+        Stops computing the checksum begun by begin_checksum, and compares it
+        to an unsigned 4 byte integer read right after the checksummed bytes.
+        Args:
+            order: The byte order of the stored checksum. Defaults to native
+                order.
+        Raises:
+            ValueError: If no checksum has been begun.
+            BinarySizeMismatch: If the stream ends before the checksum.
+            ChecksumMismatch: If the stored checksum does not match the
+                computed one.
+        """
+        computed = self.end_checksum()
+        stored = self.read_value(DataType.UINT32, order)
+        if stored != computed:
+            raise ChecksumMismatch(
+                "Checksum read is 0x{0:08x}, computed 0x{1:08x}."
+                .format(stored, computed))
+
+    def close(self):
+        """
+        Closes the reader, and the file if it was opened by the reader.
+        """
+        if self._stream is not self._file:
+            self._stream.close()
+        if self._owned:
+            self._file.close()
+
+    def _fill(self, size):
+        # Makes sure at least size unread bytes are buffered, and returns
+        # False if the stream ends before that.
+        buffer = self._buffer
+        if len(buffer) - self._position >= size:
+            return True
+        if self._checksum_func is not None:
+            self._update_checksum()
+        del buffer[:self._position]
+        self._position = 0
+        self._checksum_start = 0
+        while len(buffer) < size:
+            try:
+                read = self._stream.readinto(self._chunk)
+            except (EOFError, OSError, zlib.error, lzma.LZMAError) as e:
+                if not self._compressed or not _is_corrupt_data(e):
+                    raise
+                raise BinaryError(
+                    "Could not decompress stream: {0}".format(e)) from e
+            if not read:
+                return False
+            buffer += self._chunk_view[:read]
+        return True
+
+    def _update_checksum(self):
+        with memoryview(self._buffer) as view:
+            self._checksum_value = self._checksum_func(
+                view[self._checksum_start:self._position],
+                self._checksum_value)
+        self._checksum_start = self._position
+
+    def _ended(self, size):
+        return BinarySizeMismatch(
+            "Stream ended after {0} of {1} bytes."
+            .format(len(self._buffer) - self._position, size))
+
+
+class BinaryWriter:
+    """
+    Writes values and records to a binary file, compressing them
+    incrementally if needed. Bytes are collected in a buffer and passed on
+    in chunks.
+    Args:
+        target: The path of the file, or a binary file object. File objects
+            are not closed by the writer.
+        compression: The Compression of the file. Defaults to NONE.
+        chunk_size: The number of bytes to collect before passing them on.
+    Raises:
+        TypeError: If compression is not a Compression.
+    """
+
+    def __init__(self, target, compression=Compression.NONE,
+                 chunk_size=65536):
+        self._file, self._owned = _open_file(target, "wb", compression)
+        self._stream = _WRITERS[compression](self._file)
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._checksum_func = None
+        self._checksum_value = 0
+        self._checksum_start = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def write(self, dump_func, value, *args):
+        """
+        Serializes a given value and writes it.
+        Args:
+            dump_func: The pyjak dump function used to serialize the value,
+                for example dump_uint32.
+            value: The value to be serialized.
+            *args: Additional arguments to dump_func, such as the byte order.
+        Raises:
+            Any exception raised by dump_func.
+        """
+        self.write_bytes(dump_func(value, *args))
+
+    def write_bytes(self, _bytes):
+        """
+        Writes a given byte array.
+        Args:
+            _bytes: The byte array to be written.
+        Raises:
+            TypeError: If byte array is not bytes-like.
+        """
+        with _byte_view(_bytes) as view:
+            self._buffer += view
+        if len(self._buffer) >= self._chunk_size:
+            self.flush()
+
+    def write_value(self, value, _type, order=None):
+        """
+        Serializes a given value of a given data type and writes it.
+        Args:
+            value: The value to be serialized.
+            _type: The DataType of the value.
+            order: The byte order of the value. Defaults to native order.
+        Raises:
+            TypeError: If the value is of the wrong type, _type is not a
+                DataType or order is not a ByteOrder.
+            BinarySizeMismatch: If the value is too small or too big to be
+                held by _type.
+            BinaryError: If an unexpected conversion error occurs.
+        """
+        dump_func = _DUMP_FUNCS[_data_type(_type)]
+        if _type.size == 1:
+            self.write_bytes(dump_func(value))
+        else:
+            self.write_bytes(dump_func(value, _byte_order(order)))
+
+    def write_record(self, record, layout, order=None):
+        """
+        Serializes a given record of a given layout and writes it.
+        Args:
+            record: A mapping of field names to values.
+            layout: The Layout of the record.
+            order: The byte order of the record. Defaults to native order.
+        Raises:
+            Any exception raised by Layout.dump.
+        """
+        self.write_bytes(layout.dump(record, order))
+
+    def begin_checksum(self, checksum=Checksum.CRC32):
+        """
+        Starts computing a checksum over the bytes written from now on. The
+        checksum is updated from the buffer as it is passed on, so the bytes
+        are not serialized a second time. Any checksum in progress is
+        discarded.
+        Args:
+            checksum: The Checksum to compute. Defaults to CRC32.
+        Raises:
+            TypeError: If checksum is not a Checksum.
+        """
+        self._checksum_func, self._checksum_value = _checksum(checksum)
+        self._checksum_start = len(self._buffer)
+
+    def end_checksum(self):
+        """
+        Stops computing the checksum begun by begin_checksum.
+        Raises:
+            ValueError: If no checksum has been begun.
+        Returns:
+            The checksum of the bytes written since begin_checksum, as an
+            unsigned 4 byte integer.
+        """
+        if self._checksum_func is None:
+            raise ValueError("No checksum has been begun.")
+        self._update_checksum()
+        self._checksum_func = None
+        return self._checksum_value
+
+    def write_checksum(self, order=None):
+        """
+        Stops computing the checksum begun by begin_checksum, and writes it as
+        an unsigned 4 byte integer.
+        Args:
+            order: The byte order of the checksum. Defaults to native order.
+        Raises:
+            ValueError: If no checksum has been begun.
+        """
+        self.write_value(self.end_checksum(), DataType.UINT32, order)
+
+    def flush(self):
+        """
+        Passes the buffered bytes on to the file, or to the compressor.
+        """
+        if self._buffer:
+            if self._checksum_func is not None:
+                self._update_checksum()
+            self._stream.write(self._buffer)
+            self._buffer.clear()
+            self._checksum_start = 0
+
+    def close(self):
+        """
+        Writes out the buffered bytes, ends the compressed stream and closes
+        the writer, and the file if it was opened by the writer.
+        """
+        self.flush()
+        if self._stream is not self._file:
+            self._stream.close()
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def _update_checksum(self):
+        with memoryview(self._buffer) as view:
+            self._checksum_value = self._checksum_func(
+                view[self._checksum_start:], self._checksum_value)
+        self._checksum_start = len(self._buffer)
+
+
+class _ZlibReader(io.RawIOBase):
+    def __init__(self, file):
+        self._file = file
+        self._decompressor = zlib.decompressobj()
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        decompressor = self._decompressor
+        while not decompressor.eof:
+            data = decompressor.unconsumed_tail
+            if not data:
+                data = self._file.read(_INPUT_SIZE)
+                if not data:
+                    raise EOFError(
+                        "Compressed stream ended before the end-of-stream "
+                        "marker was reached")
+            # Output is limited to the size of b, the rest of the input is
+            # kept in unconsumed_tail.
+            output = decompressor.decompress(data, len(b))
+            if output:
+                b[:len(output)] = output
+                return len(output)
+        return 0
+
+
+class _ZlibWriter:
+    def __init__(self, file):
+        self._file = file
+        self._compressor = zlib.compressobj()
+
+    def write(self, data):
+        self._file.write(self._compressor.compress(data))
+
+    def close(self):
+        self._file.write(self._compressor.flush())
+
+
+def _is_corrupt_data(error):
+    if isinstance(error, _DECOMPRESSION_ERRORS):
+        return True
+    return error.errno is None
+
+
+def _open_file(source, mode, compression):
+    if not isinstance(compression, Compression):
+        raise TypeError(
+            "Expected object of Compression type, not '{0}'."
+            .format(type(compression).__name__))
+    if isinstance(source, (str, bytes, os.PathLike)):
+        return open(source, mode), True
+    return source, False
+
+
+def _value_struct(_type, order):
+    value_struct = struct.Struct(
+        _format_with_order(_data_type(_type).format, _byte_order(order)))
+    _STRUCTS[(_type, order)] = value_struct
+    return value_struct
+
+
+# Parsers of single values, keyed by data type and byte order.
+_STRUCTS = {}
+
+_INPUT_SIZE = 65536
+
+_READERS = {
+    Compression.NONE: lambda file: file,
+    Compression.ZLIB: _ZlibReader,
+    Compression.GZIP: lambda file: gzip.GzipFile(fileobj=file, mode="rb"),
+    Compression.LZMA: lambda file: lzma.LZMAFile(file, "rb"),
+    Compression.BZ2: lambda file: bz2.BZ2File(file, "rb"),
+}
+
+_WRITERS = {
+    Compression.NONE: lambda file: file,
+    Compression.ZLIB: _ZlibWriter,
+    Compression.GZIP: lambda file: gzip.GzipFile(fileobj=file, mode="wb"),
+    Compression.LZMA: lambda file: lzma.LZMAFile(file, "wb"),
+    Compression.BZ2: lambda file: bz2.BZ2File(file, "wb"),
+}
+
+# Decompressors report corrupt data with errors of their own, as well as with
+# OSError without an errno, while errors of the underlying file carry one.
+_DECOMPRESSION_ERRORS = (
+    EOFError, zlib.error, lzma.LZMAError, gzip.BadGzipFile)
@@ -0,0 +1,327 @@
+import array
+import mmap
+import pytest
+import re
+import struct
+from pyjak import (
+    BinarySizeMismatch, ByteOrder, DataType, OverflowMode, RangeReport,
+    byteswap, check_range, dump_array, parse_array, to_order)
+
+_INT32_VALUES = (1, -2, 2147483647, -2147483648)
+_INT32_LITTLE = struct.pack("<4i", *_INT32_VALUES)
+_INT32_BIG = struct.pack(">4i", *_INT32_VALUES)
+
+_FLOAT64_VALUES = (1.5, -1000.25)
+_FLOAT64_LITTLE = struct.pack("<2d", *_FLOAT64_VALUES)
+_FLOAT64_BIG = struct.pack(">2d", *_FLOAT64_VALUES)
+
+_UINT16_LITTLE = struct.pack("<3H", 1, 2, 65535)
+_UINT16_BIG = struct.pack(">3H", 1, 2, 65535)
+
+_INVALID = "invalid"
+_MISMATCH_REGEX = re.compile(
+    "Length of byte array is \d+, expected a multiple of \d.")
+_TYPE_ERROR_BYTES_REGEX = re.compile(
+    "Expected object of bytes-like type, not '\w+'.")
+_TYPE_ERROR_WRITABLE_REGEX = re.compile(
+    "Expected object of writable bytes-like type, not '\w+'.")
+_TYPE_ERROR_TYPE_REGEX = re.compile(
+    "Expected object of DataType type, not '\w+'.")
+_TYPE_ERROR_ORDER_REGEX = re.compile(
+    "Expected object of ByteOrder type, not '\w+'.")
+_TYPE_ERROR_OVERFLOW_REGEX = re.compile(
+    "Expected object of OverflowMode type, not '\w+'.")
+
+
+class TestByteswap:
+    def test_byteswap_bytearray_inplace(self):
+        buffer = bytearray(_INT32_LITTLE)
+        assert byteswap(buffer, DataType.INT32) is buffer
+        assert buffer == _INT32_BIG
+
+    def test_byteswap_memoryview_inplace(self):
+        buffer = bytearray(b"\x00\x00" + _FLOAT64_BIG)
+        view = memoryview(buffer)[2:]
+        byteswap(view, DataType.FLOAT64)
+        assert buffer == b"\x00\x00" + _FLOAT64_LITTLE
+
+    def test_byteswap_mmap_inplace(self):
+        buffer = mmap.mmap(-1, len(_UINT16_BIG))
+        buffer.write(_UINT16_BIG)
+        byteswap(buffer, DataType.UINT16)
+        assert buffer[:] == _UINT16_LITTLE
+        buffer.close()
+
+    def test_byteswap_copy(self):
+        swapped = byteswap(_INT32_BIG, DataType.INT32, inplace=False)
+        assert isinstance(swapped, bytearray)
+        assert swapped == _INT32_LITTLE
+
+    def test_byteswap_copy_leaves_buffer_untouched(self):
+        buffer = bytearray(_INT32_BIG)
+        byteswap(buffer, DataType.INT32, inplace=False)
+        assert buffer == _INT32_BIG
+
+    def test_byteswap_single_byte_types(self):
+        buffer = bytearray(b"\x01\x02\x03")
+        byteswap(buffer, DataType.INT8)
+        byteswap(buffer, DataType.BOOL)
+        assert buffer == b"\x01\x02\x03"
+
+    def test_byteswap_empty(self):
+        buffer = bytearray()
+        assert byteswap(buffer, DataType.INT64) == b""
+
+    def test_byteswap_raises_type_error_on_read_only(self):
+        with pytest.raises(TypeError, match=_TYPE_ERROR_WRITABLE_REGEX):
+            byteswap(_INT32_LITTLE, DataType.INT32)
+
+    def test_byteswap_raises_type_error_on_invalid_buffer(self):
+        with pytest.raises(TypeError, match=_TYPE_ERROR_BYTES_REGEX):
+            byteswap(_INVALID, DataType.INT32)
+
+    def test_byteswap_raises_type_error_on_invalid_type(self):
+        with pytest.raises(TypeError, match=_TYPE_ERROR_TYPE_REGEX):
+            byteswap(bytearray(4), _INVALID)
+
+    def test_byteswap_raises_mismatch_error_on_mismatch(self):
+        with pytest.raises(BinarySizeMismatch, match=_MISMATCH_REGEX):
+            byteswap(bytearray(10), DataType.INT32)
+
+
+class TestToOrder:
+    def test_to_order_big_to_little(self):
+        buffer = bytearray(_INT32_BIG)
+        to_order(buffer, DataType.INT32, ByteOrder.BIG, ByteOrder.LITTLE)
+        assert buffer == _INT32_LITTLE
+
+    def test_to_order_little_to_big(self):
+        buffer = bytearray(_FLOAT64_LITTLE)
+        to_order(buffer, DataType.FLOAT64, ByteOrder.LITTLE, ByteOrder.BIG)
+        assert buffer == _FLOAT64_BIG
+
+    def test_to_order_defaults_to_native(self):
+        buffer = bytearray(_INT32_BIG)
+        to_order(buffer, DataType.INT32, ByteOrder.BIG, None)
+        if ByteOrder.NATIVE == ByteOrder.LITTLE:
+            assert buffer == _INT32_LITTLE
+        else:
+            assert buffer == _INT32_BIG
+
+    def test_to_order_same_order_is_noop(self):
+        assert to_order(
+            _INT32_BIG, DataType.INT32, ByteOrder.BIG,
+            ByteOrder.BIG) is _INT32_BIG
+
+    def test_to_order_same_order_copy(self):
+        converted = to_order(
+            _INT32_BIG, DataType.INT32, ByteOrder.BIG, ByteOrder.BIG,
+            inplace=False)
+        assert isinstance(converted, bytearray)
+        assert converted == _INT32_BIG
+
+    def test_to_order_raises_type_error_on_invalid_order(self):
+        with pytest.raises(TypeError, match=_TYPE_ERROR_ORDER_REGEX):
+            to_order(bytearray(4), DataType.INT32, _INVALID, ByteOrder.BIG)
+
+    def test_to_order_raises_mismatch_error_on_mismatch(self):
+        with pytest.raises(BinarySizeMismatch, match=_MISMATCH_REGEX):
+            to_order(
+                bytearray(3), DataType.UINT16, ByteOrder.BIG, ByteOrder.BIG)
+
+
+class TestParseArray:
+    def test_parse_array_little(self):
+        assert parse_array(
+            _INT32_LITTLE, DataType.INT32, ByteOrder.LITTLE) == list(
+                _INT32_VALUES)
+
+    def test_parse_array_big(self):
+        assert parse_array(
+            _FLOAT64_BIG, DataType.FLOAT64, ByteOrder.BIG) == list(
+                _FLOAT64_VALUES)
+
+    def test_parse_array_bool(self):
+        assert parse_array(b"\x00\x02", DataType.BOOL) == [False, True]
+
+    def test_parse_array_raises_type_error_on_invalid_type(self):
+        with pytest.raises(TypeError, match=_TYPE_ERROR_BYTES_REGEX):
+            parse_array(_INVALID, DataType.INT32)
+
+    def test_parse_array_raises_mismatch_error_on_mismatch(self):
+        with pytest.raises(BinarySizeMismatch, match=_MISMATCH_REGEX):
+            parse_array(bytes(6), DataType.INT32)
+
+
+class TestDumpArray:
+    def test_dump_array_little(self):
+        assert dump_array(
+            _INT32_VALUES, DataType.INT32, ByteOrder.LITTLE) == _INT32_LITTLE
+
+    def test_dump_array_big(self):
+        assert dump_array(
+            iter(_FLOAT64_VALUES), DataType.FLOAT64,
+            ByteOrder.BIG) == _FLOAT64_BIG
+
+    def test_dump_array_float32_infinity(self):
+        assert dump_array(
+            [float("inf")], DataType.FLOAT32, ByteOrder.BIG) == (
+                b"\x7f\x80\x00\x00")
+
+    def test_dump_array_raises_mismatch_error_on_mismatch(self):
+        with pytest.raises(
+                BinarySizeMismatch, match="Could not dump value at index 1"):
+            dump_array([0, 65536], DataType.UINT16)
+        with pytest.raises(
+                BinarySizeMismatch, match="Could not dump value at index 0"):
+            dump_array([3.4e39], DataType.FLOAT32)
+
+    def test_dump_array_raises_type_error_on_invalid_type(self):
+        with pytest.raises(TypeError, match="Could not dump value at index 1"):
+            dump_array([True, 1], DataType.BOOL)
+        with pytest.raises(TypeError, match="Could not dump value at index 0"):
+            dump_array([_INVALID], DataType.INT64)
+
+    def test_dump_array_saturate(self):
+        assert dump_array(
+            [300, -5, 10], DataType.UINT8,
+            overflow=OverflowMode.SATURATE) == b"\xff\x00\x0a"
+        assert dump_array(
+            [2 ** 40, -2 ** 40], DataType.INT32, ByteOrder.BIG,
+            OverflowMode.SATURATE) == struct.pack(
+                ">2i", 2147483647, -2147483648)
+
+    def test_dump_array_saturate_float32(self):
+        assert dump_array(
+            [1e39, -1e39, float("inf")], DataType.FLOAT32, ByteOrder.BIG,
+            OverflowMode.SATURATE) == struct.pack(
+                ">3f", 3.4028234663852886e38, -3.4028234663852886e38,
+                float("inf"))
+
+    def test_dump_array_wrap(self):
+        assert dump_array(
+            [300, -1, 10], DataType.UINT8,
+            overflow=OverflowMode.WRAP) == b"\x2c\xff\x0a"
+        assert dump_array(
+            [200, -200], DataType.INT8,
+            overflow=OverflowMode.WRAP) == b"\xc8\x38"
+
+    def test_dump_array_saturate_raises_type_error_on_invalid_type(self):
+        with pytest.raises(TypeError, match="Could not dump value at index 1"):
+            dump_array([300, _INVALID], DataType.UINT8,
+                       overflow=OverflowMode.SATURATE)
+
+    def test_dump_array_raises_value_error_on_wrap_of_float(self):
+        with pytest.raises(ValueError, match="WRAP is not supported"):
+            dump_array([1.5], DataType.FLOAT64, overflow=OverflowMode.WRAP)
+
+    def test_dump_array_raises_type_error_on_invalid_overflow(self):
+        with pytest.raises(TypeError, match=_TYPE_ERROR_OVERFLOW_REGEX):
+            dump_array([1], DataType.INT8, overflow=_INVALID)
+
+    def test_dump_array_ndarray_overflow(self):
+        numpy = pytest.importorskip("numpy")
+        values = numpy.array([300, -5, 10])
+        assert dump_array(
+            values, DataType.UINT8,
+            overflow=OverflowMode.SATURATE) == b"\xff\x00\x0a"
+        assert dump_array(
+            values, DataType.UINT8,
+            overflow=OverflowMode.WRAP) == b"\x2c\xfb\x0a"
+        assert dump_array(
+            numpy.array([1e39, float("inf")]), DataType.FLOAT32,
+            ByteOrder.BIG, OverflowMode.SATURATE) == struct.pack(
+                ">2f", 3.4028234663852886e38, float("inf"))
+
+
+class TestCheckRange:
+    def test_check_range_in_range(self):
+        assert check_range([0, 255, 7], DataType.UINT8) == RangeReport(
+            None, 0, 0, 255)
+
+    def test_check_range_out_of_range(self):
+        report = check_range([1, 2, 300, -1, 5], DataType.UINT8)
+        assert report == RangeReport(2, 2, -1, 300)
+
+    def test_check_range_float32(self):
+        report = check_range(
+            [1.0, float("inf"), 3.4028235e38, 1e39, -1e39], DataType.FLOAT32)
+        assert report == RangeReport(3, 2, -1e39, float("inf"))
+
+    def test_check_range_float64(self):
+        assert check_range(
+            [1e308, -1e308], DataType.FLOAT64).first_index is None
+
+    def test_check_range_integers_reject_infinity(self):
+        assert check_range(
+            [float("inf")], DataType.INT64) == RangeReport(
+                0, 1, float("inf"), float("inf"))
+
+    def test_check_range_skips_nan_in_extremes(self):
+        values = array.array("d", [1e39, float("inf"), float("nan")])
+        assert check_range(values, DataType.FLOAT32) == RangeReport(
+            0, 1, 1e39, float("inf"))
+        assert check_range(
+            [float("nan"), 2.0, 1.0], DataType.FLOAT64) == RangeReport(
+                None, 0, 1.0, 2.0)
+        assert check_range(
+            [float("nan")], DataType.FLOAT32) == RangeReport(
+                None, 0, None, None)
+
+    def test_check_range_integers_reject_non_integers(self):
+        assert check_range([0.5], DataType.INT8) == RangeReport(
+            0, 1, 0.5, 0.5)
+        assert check_range([1, 2.0, True], DataType.INT64) == RangeReport(
+            1, 1, 1, 2.0)
+        assert check_range(
+            array.array("d", [1.0, float("nan")]),
+            DataType.UINT8) == RangeReport(0, 2, 1.0, 1.0)
+
+    def test_check_range_bools_reject_non_bools(self):
+        assert check_range([True, False], DataType.BOOL) == RangeReport(
+            None, 0, False, True)
+        assert check_range([0, 1], DataType.BOOL) == RangeReport(0, 2, 0, 1)
+        assert check_range([True, 0.5], DataType.BOOL) == RangeReport(
+            1, 1, 0.5, True)
+
+    def test_check_range_array(self):
+        values = array.array("q", [1, 2 ** 40, -2 ** 40])
+        assert check_range(values, DataType.INT32) == RangeReport(
+            1, 2, -2 ** 40, 2 ** 40)
+
+    def test_check_range_iterator(self):
+        assert check_range(iter([1, 70000]), DataType.UINT16) == RangeReport(
+            1, 1, 1, 70000)
+
+    def test_check_range_empty(self):
+        assert check_range([], DataType.INT8) == RangeReport(
+            None, 0, None, None)
+
+    def test_check_range_ndarray(self):
+        numpy = pytest.importorskip("numpy")
+        assert check_range(
+            numpy.array([1, 2, 300, -1, 5]), DataType.UINT8) == RangeReport(
+                2, 2, -1, 300)
+        assert check_range(
+            numpy.array([1.0, float("inf"), 1e39]),
+            DataType.FLOAT32) == RangeReport(2, 1, 1.0, float("inf"))
+        assert check_range(
+            numpy.array([1e39, float("inf"), float("nan")]),
+            DataType.FLOAT32) == RangeReport(0, 1, 1e39, float("inf"))
+        assert check_range(
+            numpy.array([0.5, 2.0]), DataType.INT8) == RangeReport(
+                0, 2, 0.5, 2.0)
+        assert check_range(
+            numpy.array([True, False]), DataType.BOOL) == RangeReport(
+                None, 0, False, True)
+        assert check_range(
+            numpy.array([0, 1]), DataType.BOOL) == RangeReport(0, 2, 0, 1)
+
+    def test_check_range_raises_type_error_on_invalid_value(self):
+        with pytest.raises(
+                TypeError, match="Could not check value at index 1"):
+            check_range([1, _INVALID], DataType.INT8)
+
+    def test_check_range_raises_type_error_on_invalid_type(self):
+        with pytest.raises(TypeError, match=_TYPE_ERROR_TYPE_REGEX):
+            check_range([1], _INVALID)
@@ -0,0 +1,108 @@
+import array
+import pytest
+import re
+import struct
+from pyjak import (
+    BinarySizeMismatch, ByteOrder, DataType, Layout, Padding, PrefixedString,
+    encode_columns)
+
+_LAYOUT = Layout([
+    ("id", DataType.UINT32),
+    (None, Padding(1)),
+    ("level", DataType.INT8),
+    ("ratio", DataType.FLOAT64),
+    ("active", DataType.BOOL),
+])
+_IDS = [1, 2, 4294967295]
+_LEVELS = array.array("b", [-128, 0, 127])
+_RATIOS = [0.5, -1.0, 1e300]
+_ACTIVE = [True, False, True]
+_COLUMNS = {"id": _IDS, "level": _LEVELS, "ratio": _RATIOS, "active": _ACTIVE}
+_ROWS = list(zip(_IDS, _LEVELS, _RATIOS, _ACTIVE))
+_BYTES_LITTLE = b"".join(struct.pack("<Ixbd?", *row) for row in _ROWS)
+_BYTES_BIG = b"".join(struct.pack(">Ixbd?", *row) for row in _ROWS)
+
+_MISMATCH_REGEX = re.compile(
+    "Could not dump field 'level' in row 2: Number 128 requires a " +
+    "different sign or more than 1 bytes to store.")
+_TYPE_ERROR_REGEX = re.compile(
+    "Could not dump field 'active' in row 1: Expected object of bool-like " +
+    "type, not 'int'.")
+_ROWS_MISMATCH_REGEX = re.compile(
+    "Column 'level' has 2 rows, expected 3.")
+
+
+class TestEncodeColumns:
+    def test_encode_columns_little(self):
+        assert encode_columns(
+            _COLUMNS, _LAYOUT, ByteOrder.LITTLE) == _BYTES_LITTLE
+
+    def test_encode_columns_big(self):
+        assert encode_columns(_COLUMNS, _LAYOUT, ByteOrder.BIG) == _BYTES_BIG
+
+    def test_encode_columns_sequence(self):
+        columns = [_IDS, _LEVELS, _RATIOS, _ACTIVE]
+        assert encode_columns(
+            columns, _LAYOUT, ByteOrder.LITTLE) == _BYTES_LITTLE
+
+    def test_encode_columns_matches_layout_dump(self):
+        records = [dict(zip(_COLUMNS, row)) for row in _ROWS]
+        assert encode_columns(_COLUMNS, _LAYOUT) == b"".join(
+            _LAYOUT.dump(record) for record in records)
+
+    def test_encode_columns_single_field(self):
+        layout = Layout([("value", DataType.INT16)])
+        assert encode_columns(
+            {"value": [1, -1]}, layout, ByteOrder.BIG) == (
+                b"\x00\x01\xff\xff")
+
+    def test_encode_columns_empty(self):
+        columns = {"id": [], "level": [], "ratio": [], "active": []}
+        assert encode_columns(columns, _LAYOUT) == b""
+
+    def test_encode_columns_raises_mismatch_error_on_mismatch(self):
+        columns = dict(_COLUMNS, level=[0, 0, 128])
+        with pytest.raises(BinarySizeMismatch, match=_MISMATCH_REGEX):
+            encode_columns(columns, _LAYOUT)
+
+    def test_encode_columns_raises_type_error_on_invalid_type(self):
+        columns = dict(_COLUMNS, active=[True, 1, False])
+        with pytest.raises(TypeError, match=_TYPE_ERROR_REGEX):
+            encode_columns(columns, _LAYOUT)
+
+    def test_encode_columns_raises_mismatch_error_on_row_count(self):
+        columns = dict(_COLUMNS, level=[0, 0])
+        with pytest.raises(BinarySizeMismatch, match=_ROWS_MISMATCH_REGEX):
+            encode_columns(columns, _LAYOUT)
+
+    def test_encode_columns_raises_value_error_on_column_count(self):
+        with pytest.raises(ValueError):
+            encode_columns([_IDS], _LAYOUT)
+
+    def test_encode_columns_raises_value_error_on_variable_layout(self):
+        layout = Layout([("name", PrefixedString(DataType.UINT8))])
+        with pytest.raises(ValueError):
+            encode_columns({"name": ["a"]}, layout)
+
+    def test_encode_columns_ndarray(self):
+        numpy = pytest.importorskip("numpy")
+        columns = {
+            "id": numpy.array(_IDS, dtype="u8"),
+            "level": numpy.array(_LEVELS, dtype="i2"),
+            "ratio": numpy.array(_RATIOS),
+            "active": numpy.array(_ACTIVE),
+        }
+        assert encode_columns(columns, _LAYOUT, ByteOrder.BIG) == _BYTES_BIG
+        columns["level"] = numpy.array([0, 0, 128])
+        with pytest.raises(BinarySizeMismatch, match=_MISMATCH_REGEX):
+            encode_columns(columns, _LAYOUT)
+
+    def test_encode_columns_object_ndarray(self):
+        numpy = pytest.importorskip("numpy")
+        columns = {
+            name: numpy.array(column, dtype=object)
+            for name, column in _COLUMNS.items()}
+        assert encode_columns(columns, _LAYOUT, ByteOrder.BIG) == _BYTES_BIG
+        columns["active"] = numpy.array([True, 1, False], dtype=object)
+        with pytest.raises(TypeError, match=_TYPE_ERROR_REGEX):
+            encode_columns(columns, _LAYOUT)
@@ -0,0 +1,102 @@
+import os
+import pytest
+import re
+import struct
+from pyjak import (
+    BinaryError, BinarySizeMismatch, ByteOrder, DataType, load_array,
+    save_array)
+
+_INT32_VALUES = [1, -2, 2147483647, -2147483648]
+_FLOAT64_VALUES = [1.5, -1000.25]
+
+_INVALID = "invalid"
+_TYPE_ERROR_TYPE_REGEX = re.compile(
+    "Expected object of DataType type, not '\w+'.")
+_ALIGNMENT_REGEX = re.compile("Alignment must be a power of two, not \d+.")
+
+
+@pytest.fixture
+def path(tmpdir):
+    return str(tmpdir.join("array.pjk"))
+
+
+class TestSaveArray:
+    def test_save_array_header(self, path):
+        save_array(path, _INT32_VALUES, DataType.INT32, ByteOrder.BIG)
+        with open(path, "rb") as file:
+            data = file.read()
+        assert data[:20] == b"PJAK\x01\x05\x02\x00" + struct.pack(
+            "<IQ", 64, 4)
+        assert data[20:64] == bytes(44)
+        assert data[64:] == struct.pack(">4i", *_INT32_VALUES)
+
+    def test_save_array_alignment(self, path):
+        save_array(path, _FLOAT64_VALUES, DataType.FLOAT64, alignment=8)
+        assert os.path.getsize(path) == 24 + 16
+
+    def test_save_array_raises_value_error_on_invalid_alignment(self, path):
+        with pytest.raises(ValueError, match=_ALIGNMENT_REGEX):
+            save_array(path, _INT32_VALUES, DataType.INT32, alignment=48)
+
+    def test_save_array_raises_type_error_on_invalid_type(self, path):
+        with pytest.raises(TypeError, match=_TYPE_ERROR_TYPE_REGEX):
+            save_array(path, _INT32_VALUES, _INVALID)
+
+    def test_save_array_raises_mismatch_error_on_mismatch(self, path):
+        with pytest.raises(
+                BinarySizeMismatch, match="Could not dump value at index 1"):
+            save_array(path, [0, 256], DataType.UINT8)
+
+
+class TestLoadArray:
+    def test_load_array_native(self, path):
+        save_array(path, _FLOAT64_VALUES, DataType.FLOAT64)
+        values = load_array(path)
+        assert values.readonly
+        assert values.format == "d"
+        assert values.tolist() == _FLOAT64_VALUES
+
+    def test_load_array_other_order(self, path):
+        order = (
+            ByteOrder.BIG if ByteOrder.NATIVE == ByteOrder.LITTLE
+            else ByteOrder.LITTLE)
+        save_array(path, _INT32_VALUES, DataType.INT32, order)
+        values = load_array(path)
+        assert values.readonly
+        assert values.tolist() == _INT32_VALUES
+
+    def test_load_array_without_mmap(self, path):
+        save_array(path, [True, False], DataType.BOOL, alignment=1)
+        assert load_array(path, mmap=False).tolist() == [True, False]
+
+    def test_load_array_empty(self, path):
+        save_array(path, [], DataType.UINT64)
+        assert load_array(path).tolist() == []
+
+    def test_load_array_raises_binary_error_on_invalid_magic(self, path):
+        with open(path, "wb") as file:
+            file.write(bytes(64))
+        with pytest.raises(BinaryError, match="not a pyjak array file"):
+            load_array(path)
+
+    def test_load_array_raises_binary_error_on_short_file(self, path):
+        with open(path, "wb") as file:
+            file.write(b"PJAK")
+        with pytest.raises(BinaryError, match="too small"):
+            load_array(path)
+
+    def test_load_array_raises_binary_error_on_invalid_version(self, path):
+        save_array(path, _INT32_VALUES, DataType.INT32)
+        with open(path, "r+b") as file:
+            file.seek(4)
+            file.write(b"\x02")
+        with pytest.raises(BinaryError, match="Unsupported array file"):
+            load_array(path)
+
+    def test_load_array_raises_mismatch_error_on_truncated_file(self, path):
+        save_array(path, _INT32_VALUES, DataType.INT32)
+        with open(path, "r+b") as file:
+            file.truncate(70)
+        with pytest.raises(
+                BinarySizeMismatch, match="Size of file is 70, expected 80."):
+            load_array(path)
@@ -1,3 +1,4 @@
+import array
 import pytest
 import re
 import struct
@@ -6,7 +7,9 @@ from pyjak import (
     parse_int64, parse_uint8, parse_uint16, parse_uint32, parse_uint64,
     parse_float32, parse_float64, parse_bool, dump_int8, dump_int16,
     dump_int32, dump_int64, dump_uint8, dump_uint16, dump_uint32, dump_uint64,
-    dump_float32, dump_float64, dump_bool, ByteOrder)
+    dump_float32, dump_float64, dump_bool, parse_int8_array,
+    parse_uint8_array, parse_bool_array, dump_int8_array, dump_uint8_array,
+    dump_bool_array, ByteOrder)
 
 _INT8_MIN = -128
 _INT8_MAX = 127
@@ -106,6 +109,12 @@ class ParseBase:
         assert self.parse_func(self.value_min_bytes) == self.value_min
         assert self.parse_func(self.value_max_bytes) == self.value_max
 
+    def test_parse_other_bytes_like_types(self):
+        assert self.parse_func(
+            bytearray(self.value_max_bytes)) == self.value_max
+        assert self.parse_func(
+            memoryview(self.value_max_bytes)) == self.value_max
+
     def test_parse_raises_type_error_on_none(self):
         with pytest.raises(TypeError, match=_TYPE_ERROR_PARSE_REGEX):
             self.parse_func(None)
@@ -274,6 +283,10 @@ class TestParseBool:
     def test_parse_bool_false(self):
         assert parse_bool(_BOOL_FALSE_BYTES) is False
 
+    def test_parse_bool_nonzero(self):
+        assert parse_bool(b"\xff") is True
+        assert parse_bool(memoryview(b"\x02")) is True
+
     def test_parse_bool_raises_type_error_on_none(self):
         with pytest.raises(TypeError, match=_TYPE_ERROR_PARSE_REGEX):
             parse_bool(None)
@@ -474,3 +487,71 @@ class TestDumpBool:
     def test_dump_bool_raises_type_error_on_invalid_type(self):
         with pytest.raises(TypeError, match=_TYPE_ERROR_DUMP_BOOL_REGEX):
             dump_bool(_INVALID)
+
+    def test_dump_bool_raises_type_error_on_int(self):
+        with pytest.raises(TypeError, match=_TYPE_ERROR_DUMP_BOOL_REGEX):
+            dump_bool(1)
+
+
+class TestParseArray8:
+    def test_parse_int8_array(self):
+        assert parse_int8_array(
+            _INT8_MIN_BYTES + _INT8_MAX_BYTES) == [_INT8_MIN, _INT8_MAX]
+
+    def test_parse_uint8_array(self):
+        assert parse_uint8_array(
+            bytearray(_UINT8_MIN_BYTES + _UINT8_MAX_BYTES)) == [
+                _UINT8_MIN, _UINT8_MAX]
+
+    def test_parse_bool_array(self):
+        assert parse_bool_array(b"\x00\x01\x02\xff") == [
+            False, True, True, True]
+
+    def test_parse_empty(self):
+        assert parse_int8_array(b"") == []
+        assert parse_bool_array(b"") == []
+
+    def test_parse_raises_type_error_on_invalid_type(self):
+        with pytest.raises(TypeError, match=_TYPE_ERROR_PARSE_REGEX):
+            parse_int8_array(_INVALID)
+        with pytest.raises(TypeError, match=_TYPE_ERROR_PARSE_REGEX):
+            parse_uint8_array(None)
+        with pytest.raises(TypeError, match=_TYPE_ERROR_PARSE_REGEX):
+            parse_bool_array(_INVALID)
+
+
+class TestDumpArray8:
+    def test_dump_int8_array(self):
+        assert dump_int8_array(
+            [_INT8_MIN, _INT8_MAX]) == _INT8_MIN_BYTES + _INT8_MAX_BYTES
+
+    def test_dump_uint8_array(self):
+        assert dump_uint8_array(
+            iter([_UINT8_MIN, _UINT8_MAX])) == (
+                _UINT8_MIN_BYTES + _UINT8_MAX_BYTES)
+
+    def test_dump_uint8_array_from_wider_array(self):
+        assert dump_uint8_array(array.array("H", [1, 2])) == b"\x01\x02"
+        assert dump_int8_array(array.array("q", [-1, 2])) == b"\xff\x02"
+
+    def test_dump_bool_array(self):
+        assert dump_bool_array([True, False]) == (
+            _BOOL_TRUE_BYTES + _BOOL_FALSE_BYTES)
+
+    def test_dump_raises_type_error_on_invalid_type(self):
+        with pytest.raises(TypeError, match=_TYPE_ERROR_DUMP_REGEX):
+            dump_int8_array([1, _INVALID])
+        with pytest.raises(TypeError, match=_TYPE_ERROR_DUMP_REGEX):
+            dump_uint8_array([1, None])
+        with pytest.raises(TypeError, match=_TYPE_ERROR_DUMP_REGEX):
+            dump_uint8_array(array.array("d", [1.0]))
+        with pytest.raises(TypeError, match=_TYPE_ERROR_DUMP_BOOL_REGEX):
+            dump_bool_array(iter([True, 1]))
+
+    def test_dump_raises_mismatch_error_on_mismatch(self):
+        with pytest.raises(BinarySizeMismatch, match=_MISMATCH_DUMP_REGEX):
+            dump_int8_array([0, _INT8_MAX + 1])
+        with pytest.raises(BinarySizeMismatch, match=_MISMATCH_DUMP_REGEX):
+            dump_uint8_array(iter([0, _UINT8_MIN - 1]))
+        with pytest.raises(BinarySizeMismatch, match=_MISMATCH_DUMP_REGEX):
+            dump_uint8_array(array.array("H", [_UINT8_MAX + 1]))
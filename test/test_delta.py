@@ -0,0 +1,98 @@
+import pytest
+import re
+from pyjak import (
+    BinaryError, BinarySizeMismatch, ByteOrder, SequenceEncoding,
+    decode_sequence, dump_uint8, encode_sequence)
+
+_TIMESTAMPS = [1500000000000 + i * 1000 + i % 3 for i in range(100)]
+_COUNTERS = [7, 7, 8, 12, 12, 13, 40, 41]
+_SIGNED = [-9223372036854775808, 0, 9223372036854775807]
+_SEQUENCES = [[], [5], [5, -5], _TIMESTAMPS, _COUNTERS]
+
+_INVALID = "invalid"
+_MISMATCH_REGEX = re.compile(
+    "Length of byte array is \d+, expected (at least )?\d+.")
+
+
+class TestSequence:
+    @pytest.mark.parametrize("encoding", list(SequenceEncoding))
+    @pytest.mark.parametrize("values", _SEQUENCES)
+    def test_roundtrip(self, encoding, values):
+        _bytes = encode_sequence(values, encoding, ByteOrder.BIG)
+        assert decode_sequence(_bytes, ByteOrder.BIG) == values
+
+    @pytest.mark.parametrize("encoding", list(SequenceEncoding))
+    def test_roundtrip_full_range(self, encoding):
+        values = list(reversed(_SIGNED)) + _SIGNED + [-1, 1]
+        _bytes = encode_sequence(values, encoding, ByteOrder.LITTLE)
+        assert decode_sequence(_bytes, ByteOrder.LITTLE) == values
+
+    @pytest.mark.parametrize("encoding", list(SequenceEncoding))
+    def test_roundtrip_long(self, encoding):
+        values = [(i * 7919) % 100003 - 50000 for i in range(150001)]
+        _bytes = encode_sequence(values, encoding)
+        assert decode_sequence(_bytes) == values
+
+    def test_roundtrip_wrapping_delta(self):
+        values = [9223372036854775807, -9223372036854775808]
+        assert decode_sequence(encode_sequence(values)) == values
+
+    def test_header(self):
+        _bytes = encode_sequence(
+            [10, 11, 12], SequenceEncoding.DELTA, ByteOrder.BIG)
+        assert _bytes == (
+            b"\x02\x00\x00\x00\x00\x03" +
+            b"\x00\x00\x00\x00\x00\x00\x00\x0a" +
+            b"\x00\x00\x00\x00\x00\x00\x00\x01")
+
+    def test_bit_packing(self):
+        _bytes = encode_sequence(
+            [0, 1, 2, 3], SequenceEncoding.FRAME_OF_REFERENCE)
+        assert _bytes[-2:] == b"\xe4\x00"
+
+    def test_delta_is_compact(self):
+        _bytes = encode_sequence(_TIMESTAMPS, SequenceEncoding.DELTA)
+        assert len(_bytes) < len(_TIMESTAMPS) * 2
+
+    def test_constant_delta_takes_no_space(self):
+        values = list(range(0, 3000, 3))
+        _bytes = encode_sequence(values, SequenceEncoding.DELTA)
+        assert len(_bytes) == 22
+        assert decode_sequence(_bytes) == values
+
+    def test_encode_raises_type_error_on_invalid_type(self):
+        with pytest.raises(TypeError, match="value at index 1"):
+            encode_sequence([1, _INVALID])
+        with pytest.raises(TypeError):
+            encode_sequence([1], _INVALID)
+
+    def test_encode_raises_mismatch_error_on_mismatch(self):
+        with pytest.raises(BinarySizeMismatch, match="value at index 0"):
+            encode_sequence([9223372036854775808])
+
+    def test_decode_raises_mismatch_error_on_mismatch(self):
+        _bytes = encode_sequence(_COUNTERS)
+        with pytest.raises(BinarySizeMismatch, match=_MISMATCH_REGEX):
+            decode_sequence(_bytes[:-1])
+        with pytest.raises(BinarySizeMismatch, match=_MISMATCH_REGEX):
+            decode_sequence(_bytes[:3])
+
+    def test_decode_raises_mismatch_error_on_max_count(self):
+        _bytes = encode_sequence(_COUNTERS)
+        with pytest.raises(BinarySizeMismatch):
+            decode_sequence(_bytes, max_count=len(_COUNTERS) - 1)
+
+    def test_decode_limits_count_by_default(self):
+        _bytes = encode_sequence([5] * 3, SequenceEncoding.DELTA)
+        _bytes = _bytes[:2] + b"\xff\xff\xff\xff" + _bytes[6:]
+        with pytest.raises(BinarySizeMismatch, match="exceeds the maximum"):
+            decode_sequence(_bytes)
+
+    def test_decode_raises_binary_error_on_unknown_encoding(self):
+        _bytes = dump_uint8(9) + encode_sequence(_COUNTERS)[1:]
+        with pytest.raises(BinaryError):
+            decode_sequence(_bytes)
+
+    def test_decode_raises_type_error_on_invalid_type(self):
+        with pytest.raises(TypeError):
+            decode_sequence(_INVALID)
@@ -0,0 +1,146 @@
+import os
+import pytest
+import re
+import socket
+import zlib
+from pyjak import (
+    BinarySizeMismatch, ByteOrder, Checksum, GatherWriter, dump_uint8,
+    dump_uint16, dump_uint32)
+
+_PAYLOAD = bytes(range(256)) * 64
+_HEADER = b"\x01\x00\x02\x00\x00\x40\x00"
+_MESSAGE = _HEADER + _PAYLOAD + b"\xff"
+
+_INVALID = "invalid"
+_TYPE_ERROR_REGEX = re.compile(
+    "Expected object of bytes-like type, not '\w+'.")
+
+
+def _build_writer(payload=_PAYLOAD):
+    writer = GatherWriter()
+    writer.write(dump_uint8, 1)
+    writer.write(dump_uint16, 2, ByteOrder.BIG)
+    writer.write(dump_uint32, len(payload), ByteOrder.BIG)
+    writer.write_payload(payload)
+    writer.write_bytes(b"\xff")
+    return writer
+
+
+def _read_exactly(read, size):
+    data = b""
+    while len(data) < size:
+        chunk = read(size - len(data))
+        assert chunk
+        data += chunk
+    return data
+
+
+class TestGatherWriter:
+    def test_len(self):
+        assert len(_build_writer()) == len(_MESSAGE)
+
+    def test_getvalue(self):
+        assert _build_writer().getvalue() == _MESSAGE
+
+    def test_payload_is_not_copied(self):
+        payload = bytearray(4)
+        writer = GatherWriter()
+        writer.write_payload(payload)
+        payload[0] = 1
+        assert writer.getvalue() == b"\x01\x00\x00\x00"
+        writer.clear()
+
+    def test_flush_fd(self):
+        read_fd, write_fd = os.pipe()
+        try:
+            writer = _build_writer(_PAYLOAD[:1000])
+            expected = writer.getvalue()
+            assert writer.flush_fd(write_fd) == len(expected)
+            assert len(writer) == 0
+            assert _read_exactly(
+                lambda n: os.read(read_fd, n), len(expected)) == expected
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_flush_socket(self):
+        left, right = socket.socketpair()
+        with left, right:
+            writer = _build_writer(_PAYLOAD[:1000])
+            expected = writer.getvalue()
+            assert writer.flush_socket(left) == len(expected)
+            assert _read_exactly(right.recv, len(expected)) == expected
+
+    def test_writer_is_reusable(self):
+        writer = _build_writer()
+        writer.flush_socket(_SinkSocket())
+        writer.write(dump_uint8, 7)
+        assert writer.getvalue() == b"\x07"
+
+    def test_flush_handles_partial_writes(self):
+        sink = _SinkSocket(max_sent=5)
+        writer = _build_writer()
+        assert writer.flush_socket(sink) == len(_MESSAGE)
+        assert sink.data == _MESSAGE
+        assert sink.calls > 1
+
+    def test_flush_keeps_unwritten_data_on_error(self):
+        sink = _SinkSocket(max_sent=3, fail_after=2)
+        writer = _build_writer()
+        with pytest.raises(OSError):
+            writer.flush_socket(sink)
+        assert len(writer) == len(_MESSAGE) - 6
+        writer.write_bytes(b"\x00")
+        assert sink.data + writer.getvalue() == _MESSAGE + b"\x00"
+
+    def test_flush_empty(self):
+        assert GatherWriter().flush_socket(_SinkSocket()) == 0
+
+    def test_write_raises_type_error_on_invalid_type(self):
+        writer = GatherWriter()
+        with pytest.raises(TypeError, match=_TYPE_ERROR_REGEX):
+            writer.write_bytes(_INVALID)
+        with pytest.raises(TypeError, match=_TYPE_ERROR_REGEX):
+            writer.write_payload(None)
+
+    def test_write_raises_dump_errors(self):
+        with pytest.raises(BinarySizeMismatch):
+            GatherWriter().write(dump_uint8, 256)
+
+    def test_write_checksum(self):
+        writer = GatherWriter()
+        writer.write_bytes(b"\x00")
+        writer.begin_checksum()
+        writer.write_bytes(_HEADER)
+        writer.write_payload(_PAYLOAD)
+        writer.write_checksum(ByteOrder.BIG)
+        assert writer.getvalue() == b"\x00" + _HEADER + _PAYLOAD + (
+            zlib.crc32(_HEADER + _PAYLOAD).to_bytes(4, "big"))
+
+    def test_end_checksum_adler32(self):
+        writer = GatherWriter()
+        writer.begin_checksum(Checksum.ADLER32)
+        writer.write_payload(_PAYLOAD)
+        assert writer.end_checksum() == zlib.adler32(_PAYLOAD)
+
+    def test_end_checksum_raises_value_error_without_begin(self):
+        with pytest.raises(ValueError, match="No checksum has been begun."):
+            GatherWriter().end_checksum()
+
+
+class _SinkSocket:
+    def __init__(self, max_sent=None, fail_after=None):
+        self.data = b""
+        self.calls = 0
+        self._max_sent = max_sent
+        self._fail_after = fail_after
+
+    def sendmsg(self, buffers):
+        if self.calls == self._fail_after:
+            raise OSError("Sink failure.")
+        self.calls += 1
+        data = b"".join(buffers)
+        if self._max_sent is not None:
+            data = data[:self._max_sent]
+        self.data += data
+        return len(data)
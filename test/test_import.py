@@ -0,0 +1,108 @@
+import os
+import pytest
+import re
+import struct
+import subprocess
+import sys
+import timeit
+import pyjak
+from pyjak import ByteOrder, dump, dump_uint32, parse, parse_uint32
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(pyjak.__file__)))
+
+# Modules the core conversion functions must not pull in at import.
+_HEAVY_MODULES = (
+    "re",
+    "multiprocessing",
+    "numpy",
+    "asyncio",
+    "gzip",
+    "lzma",
+    "bz2",
+    "pyjak.bulk",
+    "pyjak.layout",
+    "pyjak.stream",
+    "pyjak.ring",
+    "pyjak.container",
+)
+
+# Budgets are generous, so that slow or busy machines do not fail the tests,
+# while eagerly importing an optional subsystem still does.
+_IMPORT_BUDGET_US = 100000
+_CALL_OVERHEAD_RATIO = 20
+_SPEC_OVERHEAD_RATIO = 10
+
+_BYTES = b"\x00\x00\x01\x00"
+_UNKNOWN_ATTRIBUTE_REGEX = re.compile(
+    "module 'pyjak' has no attribute 'does_not_exist'")
+
+
+def _run(*args):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [_ROOT, env.get("PYTHONPATH")]))
+    return subprocess.run(
+        [sys.executable] + list(args), env=env, check=True,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True)
+
+
+def _best(func, *args):
+    timer = timeit.Timer(lambda: func(*args))
+    return min(timer.repeat(repeat=7, number=2000))
+
+
+class TestImport:
+    def test_import_skips_optional_subsystems(self):
+        result = _run("-c", "\n".join([
+            "import sys",
+            "before = set(sys.modules)",
+            "import pyjak",
+            "print(' '.join(sorted(set(sys.modules) - before)))",
+        ]))
+        loaded = set(result.stdout.split())
+        assert "pyjak.convert" in loaded
+        for name in _HEAVY_MODULES:
+            assert name not in loaded
+
+    def test_import_time_budget(self):
+        result = _run("-X", "importtime", "-c", "import pyjak")
+        cumulative = None
+        for line in result.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == "pyjak":
+                cumulative = int(parts[1])
+        assert cumulative is not None
+        assert cumulative < _IMPORT_BUDGET_US
+
+    def test_lazy_attributes(self):
+        assert pyjak.Layout is __import__("pyjak.layout").layout.Layout
+        assert pyjak.SharedRing.__module__ == "pyjak.ring"
+        assert callable(pyjak.dump_array)
+
+    def test_lazy_names_listed(self):
+        names = dir(pyjak)
+        for name in ("Layout", "BinaryReader", "SharedRing", "dump_array",
+                     "parse_uint32", "parse"):
+            assert name in names
+            assert name in pyjak.__all__
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError, match=_UNKNOWN_ATTRIBUTE_REGEX):
+            pyjak.does_not_exist
+
+
+class TestCallOverhead:
+    def test_parse_overhead(self):
+        unpack = struct.Struct(">I").unpack
+        baseline = _best(unpack, _BYTES)
+        assert (_best(parse_uint32, _BYTES, ByteOrder.BIG) <
+                baseline * _CALL_OVERHEAD_RATIO)
+        assert _best(parse, _BYTES, "u32be") < baseline * _SPEC_OVERHEAD_RATIO
+
+    def test_dump_overhead(self):
+        pack = struct.Struct(">I").pack
+        baseline = _best(pack, 256)
+        assert (_best(dump_uint32, 256, ByteOrder.BIG) <
+                baseline * _CALL_OVERHEAD_RATIO)
+        assert _best(dump, 256, "u32be") < baseline * _SPEC_OVERHEAD_RATIO
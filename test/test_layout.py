@@ -0,0 +1,350 @@
+import pytest
+import re
+import struct
+from pyjak import (
+    BinaryError, BinarySizeMismatch, ByteOrder, Conditional, CountedArray,
+    DataType, Layout, Padding, PrefixedString)
+
+_FIXED_LAYOUT = Layout([
+    ("id", DataType.UINT32),
+    (None, Padding(2)),
+    ("level", DataType.INT8),
+    ("ratio", DataType.FLOAT64),
+    ("active", DataType.BOOL),
+])
+_FIXED_RECORD = {"id": 7, "level": -3, "ratio": 0.5, "active": True}
+_FIXED_BYTES_LITTLE = struct.pack("<I2xbd?", 7, -3, 0.5, True)
+_FIXED_BYTES_BIG = struct.pack(">I2xbd?", 7, -3, 0.5, True)
+
+_CONDITIONAL_LAYOUT = Layout([
+    ("flags", DataType.UINT8),
+    ("extra", Conditional("flags", DataType.INT16)),
+    ("value", DataType.UINT16),
+])
+_CONDITIONAL_RECORD = {"flags": 1, "extra": -2, "value": 9}
+_CONDITIONAL_BYTES = struct.pack("<BhH", 1, -2, 9)
+_CONDITIONAL_ABSENT_RECORD = {"flags": 0, "extra": None, "value": 9}
+_CONDITIONAL_ABSENT_BYTES = struct.pack("<BH", 0, 9)
+
+_POINT_LAYOUT = Layout([("x", DataType.INT16), ("y", DataType.INT16)])
+_VARIABLE_LAYOUT = Layout([
+    ("name", PrefixedString(DataType.UINT8, 16)),
+    ("values", CountedArray(DataType.UINT16, DataType.INT32, 8)),
+    ("flags", CountedArray(DataType.UINT8, DataType.BOOL)),
+    ("origin", _POINT_LAYOUT),
+    ("path", CountedArray(DataType.UINT8, _POINT_LAYOUT, 4)),
+    ("end", DataType.UINT8),
+])
+_VARIABLE_RECORD = {
+    "name": "h\xe9llo",
+    "values": [1, -2, 2147483647],
+    "flags": [True, False],
+    "origin": {"x": 1, "y": -1},
+    "path": [{"x": 2, "y": 3}, {"x": 4, "y": 5}],
+    "end": 255,
+}
+_VARIABLE_BYTES_BIG = (
+    struct.pack(">B", 6) + "h\xe9llo".encode("utf-8") +
+    struct.pack(">H3i", 3, 1, -2, 2147483647) +
+    struct.pack(">B2?", 2, True, False) +
+    struct.pack(">2h", 1, -1) +
+    struct.pack(">B4h", 2, 2, 3, 4, 5) +
+    struct.pack(">B", 255))
+
+_INVALID = "invalid"
+_LIMIT_PARSE_REGEX = re.compile(
+    "Could not parse field '\w+': Length \d+ exceeds the maximum of \d+.")
+_LIMIT_DUMP_REGEX = re.compile(
+    "Could not dump field '\w+': Length \d+ exceeds the maximum of \d+.")
+_MISMATCH_PARSE_REGEX = re.compile(
+    "Length of byte array is \d+, expected \d+.")
+_TOO_SHORT_REGEX = re.compile(
+    "Byte array of length \d+ ends before the end of the record.")
+_MISMATCH_DUMP_REGEX = re.compile(
+    "Could not dump field 'level': Number 128 requires a different sign or " +
+    "more than 1 bytes to store.")
+_TYPE_ERROR_PARSE_REGEX = re.compile(
+    "Expected object of bytes-like type, not '\w+'.")
+_TYPE_ERROR_DUMP_REGEX = re.compile(
+    "Could not dump field 'id': Expected object of number-like type, " +
+    "not '\w+'.")
+_NEGATIVE_OFFSET_REGEX = re.compile("Offset must not be negative, not -\d+.")
+_TYPE_ERROR_DUMP_BOOL_REGEX = re.compile(
+    "Could not dump field '(active|flags)': Expected object of bool-like " +
+    "type, not '\w+'.")
+
+
+class TestLayout:
+    def test_size(self):
+        assert _FIXED_LAYOUT.size == len(_FIXED_BYTES_LITTLE)
+        assert _CONDITIONAL_LAYOUT.size is None
+
+    def test_equality(self):
+        assert _FIXED_LAYOUT == Layout(_FIXED_LAYOUT.fields)
+        assert hash(_FIXED_LAYOUT) == hash(Layout(_FIXED_LAYOUT.fields))
+        assert _FIXED_LAYOUT != _CONDITIONAL_LAYOUT
+
+    def test_raises_value_error_on_duplicate_name(self):
+        with pytest.raises(ValueError):
+            Layout([("a", DataType.INT8), ("a", DataType.INT8)])
+
+    def test_raises_value_error_on_unknown_condition(self):
+        with pytest.raises(ValueError):
+            Layout([("a", Conditional("b", DataType.INT8))])
+
+    def test_raises_value_error_on_padding_condition(self):
+        with pytest.raises(ValueError, match="holds no value"):
+            Layout([("p", Padding(1)), ("c", Conditional("p", DataType.INT8))])
+
+    def test_raises_value_error_on_unnamed_field(self):
+        with pytest.raises(ValueError):
+            Layout([(None, DataType.INT8)])
+
+    def test_raises_type_error_on_invalid_element(self):
+        with pytest.raises(TypeError):
+            Layout([("a", _INVALID)])
+
+
+class TestLayoutParse:
+    def test_parse_little(self):
+        assert _FIXED_LAYOUT.parse(
+            _FIXED_BYTES_LITTLE, ByteOrder.LITTLE) == _FIXED_RECORD
+
+    def test_parse_big(self):
+        assert _FIXED_LAYOUT.parse(
+            _FIXED_BYTES_BIG, ByteOrder.BIG) == _FIXED_RECORD
+
+    def test_parse_conditional_present(self):
+        assert _CONDITIONAL_LAYOUT.parse(
+            _CONDITIONAL_BYTES, ByteOrder.LITTLE) == _CONDITIONAL_RECORD
+
+    def test_parse_conditional_absent(self):
+        assert _CONDITIONAL_LAYOUT.parse(
+            _CONDITIONAL_ABSENT_BYTES,
+            ByteOrder.LITTLE) == _CONDITIONAL_ABSENT_RECORD
+
+    def test_parse_from(self):
+        buffer = bytearray(b"\xff" + _CONDITIONAL_BYTES + b"\xff")
+        record, end = _CONDITIONAL_LAYOUT.parse_from(
+            buffer, 1, ByteOrder.LITTLE)
+        assert record == _CONDITIONAL_RECORD
+        assert end == 1 + len(_CONDITIONAL_BYTES)
+
+    def test_parse_from_raises_value_error_on_negative_offset(self):
+        with pytest.raises(ValueError, match=_NEGATIVE_OFFSET_REGEX):
+            _POINT_LAYOUT.parse_from(b"\x01\x02\x03\x04\x05", -4)
+
+    def test_parse_from_memoryview(self):
+        record, end = _FIXED_LAYOUT.parse_from(
+            memoryview(_FIXED_BYTES_BIG), 0, ByteOrder.BIG)
+        assert record == _FIXED_RECORD
+
+    def test_parse_raises_mismatch_error_on_trailing_bytes(self):
+        with pytest.raises(BinarySizeMismatch, match=_MISMATCH_PARSE_REGEX):
+            _FIXED_LAYOUT.parse(_FIXED_BYTES_LITTLE + b"\x00")
+
+    def test_parse_raises_mismatch_error_on_short_bytes(self):
+        with pytest.raises(BinarySizeMismatch, match=_TOO_SHORT_REGEX):
+            _FIXED_LAYOUT.parse(_FIXED_BYTES_LITTLE[:-1])
+        with pytest.raises(BinarySizeMismatch, match=_TOO_SHORT_REGEX):
+            _CONDITIONAL_LAYOUT.parse(_CONDITIONAL_BYTES[:-1])
+
+    def test_parse_raises_mismatch_error_on_short_padding(self):
+        layout = Layout([("a", DataType.INT8), (None, Padding(3))])
+        with pytest.raises(BinarySizeMismatch, match=_TOO_SHORT_REGEX):
+            layout.parse_from(b"\x01\x00")
+
+    def test_parse_raises_type_error_on_invalid_type(self):
+        with pytest.raises(TypeError, match=_TYPE_ERROR_PARSE_REGEX):
+            _FIXED_LAYOUT.parse(_INVALID)
+
+
+class TestLayoutDump:
+    def test_dump_little(self):
+        assert _FIXED_LAYOUT.dump(
+            _FIXED_RECORD, ByteOrder.LITTLE) == _FIXED_BYTES_LITTLE
+
+    def test_dump_big(self):
+        assert _FIXED_LAYOUT.dump(
+            _FIXED_RECORD, ByteOrder.BIG) == _FIXED_BYTES_BIG
+
+    def test_dump_conditional_present(self):
+        assert _CONDITIONAL_LAYOUT.dump(
+            _CONDITIONAL_RECORD, ByteOrder.LITTLE) == _CONDITIONAL_BYTES
+
+    def test_dump_conditional_absent(self):
+        assert _CONDITIONAL_LAYOUT.dump(
+            _CONDITIONAL_ABSENT_RECORD,
+            ByteOrder.LITTLE) == _CONDITIONAL_ABSENT_BYTES
+
+    def test_dump_raises_mismatch_error_on_mismatch(self):
+        record = dict(_FIXED_RECORD, level=128)
+        with pytest.raises(BinarySizeMismatch, match=_MISMATCH_DUMP_REGEX):
+            _FIXED_LAYOUT.dump(record)
+
+    def test_dump_raises_type_error_on_invalid_type(self):
+        record = dict(_FIXED_RECORD, id=_INVALID)
+        with pytest.raises(TypeError, match=_TYPE_ERROR_DUMP_REGEX):
+            _FIXED_LAYOUT.dump(record)
+
+    def test_dump_raises_type_error_on_invalid_bool(self):
+        record = dict(_FIXED_RECORD, active=1)
+        with pytest.raises(TypeError, match=_TYPE_ERROR_DUMP_BOOL_REGEX):
+            _FIXED_LAYOUT.dump(record)
+        record = dict(_VARIABLE_RECORD, flags=[True, "no"])
+        with pytest.raises(TypeError, match=_TYPE_ERROR_DUMP_BOOL_REGEX):
+            _VARIABLE_LAYOUT.dump(record)
+
+    def test_dump_raises_key_error_on_missing_field(self):
+        with pytest.raises(KeyError):
+            _FIXED_LAYOUT.dump({"id": 1})
+
+
+class TestLayoutDumpInto:
+    def test_dump_into(self):
+        buffer = bytearray(len(_FIXED_BYTES_BIG) + 3)
+        assert _FIXED_LAYOUT.dump_into(
+            _FIXED_RECORD, buffer, 2, ByteOrder.BIG) == len(buffer) - 1
+        assert buffer == b"\x00\x00" + _FIXED_BYTES_BIG + b"\x00"
+
+    def test_dump_into_memoryview(self):
+        buffer = bytearray(len(_CONDITIONAL_BYTES))
+        with memoryview(buffer) as view:
+            _CONDITIONAL_LAYOUT.dump_into(
+                _CONDITIONAL_RECORD, view, 0, ByteOrder.LITTLE)
+        assert buffer == _CONDITIONAL_BYTES
+
+    def test_dump_into_variable(self):
+        buffer = bytearray(len(_VARIABLE_BYTES_BIG))
+        assert _VARIABLE_LAYOUT.dump_into(
+            _VARIABLE_RECORD, buffer, order=ByteOrder.BIG) == len(buffer)
+        assert buffer == _VARIABLE_BYTES_BIG
+
+    def test_dump_into_raises_value_error_on_negative_offset(self):
+        with pytest.raises(ValueError, match=_NEGATIVE_OFFSET_REGEX):
+            _FIXED_LAYOUT.dump_into(_FIXED_RECORD, bytearray(32), -2)
+
+    def test_dump_into_raises_mismatch_error_on_short_buffer(self):
+        with pytest.raises(BinarySizeMismatch, match=_TOO_SHORT_REGEX):
+            _FIXED_LAYOUT.dump_into(_FIXED_RECORD, bytearray(10))
+        with pytest.raises(BinarySizeMismatch, match=_TOO_SHORT_REGEX):
+            _VARIABLE_LAYOUT.dump_into(_VARIABLE_RECORD, bytearray(4))
+
+    def test_dump_into_raises_mismatch_error_on_mismatch(self):
+        record = dict(_FIXED_RECORD, level=128)
+        with pytest.raises(BinarySizeMismatch, match=_MISMATCH_DUMP_REGEX):
+            _FIXED_LAYOUT.dump_into(record, bytearray(32))
+
+    def test_dump_into_raises_type_error_on_invalid_bool(self):
+        record = dict(_FIXED_RECORD, active="no")
+        with pytest.raises(TypeError, match=_TYPE_ERROR_DUMP_BOOL_REGEX):
+            _FIXED_LAYOUT.dump_into(record, bytearray(32))
+
+    def test_dump_into_raises_type_error_on_read_only(self):
+        with pytest.raises(TypeError, match="writable bytes-like"):
+            _FIXED_LAYOUT.dump_into(_FIXED_RECORD, bytes(32))
+
+
+class TestLayoutSource:
+    def test_fixed_layout_uses_single_struct(self):
+        source = _FIXED_LAYOUT.source(ByteOrder.LITTLE)
+        assert source.count("unpack_from") == 1
+        assert source.count(".pack(") == 1
+
+    def test_source_is_cached(self):
+        layout = Layout(_CONDITIONAL_LAYOUT.fields)
+        assert layout.source() is layout.source()
+
+
+class TestLayoutVariable:
+    def test_size(self):
+        assert _POINT_LAYOUT.size == 4
+        assert _VARIABLE_LAYOUT.size is None
+        assert Layout([("a", _POINT_LAYOUT), ("b", DataType.INT8)]).size == 5
+
+    def test_parse(self):
+        assert _VARIABLE_LAYOUT.parse(
+            _VARIABLE_BYTES_BIG, ByteOrder.BIG) == _VARIABLE_RECORD
+
+    def test_dump(self):
+        assert _VARIABLE_LAYOUT.dump(
+            _VARIABLE_RECORD, ByteOrder.BIG) == _VARIABLE_BYTES_BIG
+
+    def test_roundtrip_little(self):
+        _bytes = _VARIABLE_LAYOUT.dump(_VARIABLE_RECORD, ByteOrder.LITTLE)
+        assert _VARIABLE_LAYOUT.parse(
+            _bytes, ByteOrder.LITTLE) == _VARIABLE_RECORD
+
+    def test_roundtrip_empty(self):
+        record = dict(
+            _VARIABLE_RECORD, name="", values=[], flags=[], path=[])
+        assert _VARIABLE_LAYOUT.parse(
+            _VARIABLE_LAYOUT.dump(record)) == record
+
+    def test_parse_nested_fixed_layout(self):
+        layout = Layout([("a", _POINT_LAYOUT), ("b", DataType.INT8)])
+        _bytes = struct.pack("<2hb", 1, 2, 3)
+        assert layout.parse(_bytes, ByteOrder.LITTLE) == {
+            "a": {"x": 1, "y": 2}, "b": 3}
+
+    def test_parse_conditional_string(self):
+        layout = Layout([
+            ("has_name", DataType.BOOL),
+            ("name", Conditional("has_name", PrefixedString(DataType.UINT8))),
+        ])
+        assert layout.parse(b"\x01\x02hi") == {
+            "has_name": True, "name": "hi"}
+        assert layout.parse(b"\x00") == {"has_name": False, "name": None}
+
+    def test_parse_raises_mismatch_error_on_maximum(self):
+        _bytes = bytearray(_VARIABLE_BYTES_BIG)
+        _bytes[0] = 17
+        with pytest.raises(BinarySizeMismatch, match=_LIMIT_PARSE_REGEX):
+            _VARIABLE_LAYOUT.parse(_bytes, ByteOrder.BIG)
+
+    def test_parse_raises_mismatch_error_on_short_array(self):
+        with pytest.raises(BinarySizeMismatch, match=_TOO_SHORT_REGEX):
+            _VARIABLE_LAYOUT.parse(_VARIABLE_BYTES_BIG[:12], ByteOrder.BIG)
+
+    def test_parse_raises_mismatch_error_on_short_string(self):
+        with pytest.raises(BinarySizeMismatch, match=_TOO_SHORT_REGEX):
+            _VARIABLE_LAYOUT.parse(_VARIABLE_BYTES_BIG[:4], ByteOrder.BIG)
+
+    def test_parse_raises_binary_error_on_invalid_string(self):
+        layout = Layout([("name", PrefixedString(DataType.UINT8))])
+        with pytest.raises(BinaryError):
+            layout.parse(b"\x01\xff")
+
+    def test_dump_raises_mismatch_error_on_maximum(self):
+        record = dict(_VARIABLE_RECORD, name="x" * 17)
+        with pytest.raises(BinarySizeMismatch, match=_LIMIT_DUMP_REGEX):
+            _VARIABLE_LAYOUT.dump(record)
+        record = dict(_VARIABLE_RECORD, flags=[True] * 256)
+        with pytest.raises(BinarySizeMismatch, match=_LIMIT_DUMP_REGEX):
+            _VARIABLE_LAYOUT.dump(record)
+
+    def test_dump_raises_mismatch_error_on_array_item(self):
+        record = dict(_VARIABLE_RECORD, values=[0, 2147483648])
+        with pytest.raises(BinarySizeMismatch, match="field 'values'"):
+            _VARIABLE_LAYOUT.dump(record)
+
+    def test_dump_raises_mismatch_error_on_nested_field(self):
+        record = dict(_VARIABLE_RECORD, origin={"x": 0, "y": 32768})
+        with pytest.raises(
+                BinarySizeMismatch, match="field 'origin': .* field 'y'"):
+            _VARIABLE_LAYOUT.dump(record)
+
+    def test_dump_raises_type_error_on_invalid_string(self):
+        record = dict(_VARIABLE_RECORD, name=1)
+        with pytest.raises(TypeError, match="field 'name'"):
+            _VARIABLE_LAYOUT.dump(record)
+
+    def test_raises_value_error_on_invalid_count_type(self):
+        with pytest.raises(ValueError):
+            Layout([("a", CountedArray(DataType.FLOAT32, DataType.INT8))])
+        with pytest.raises(ValueError):
+            Layout([("a", PrefixedString(DataType.UINT8, -1))])
+
+    def test_array_is_parsed_in_bulk(self):
+        source = _VARIABLE_LAYOUT.source(ByteOrder.BIG)
+        assert "frombytes" in source
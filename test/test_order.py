@@ -1,5 +1,6 @@
+import pytest
 import sys
-from pyjak import ByteOrder
+from pyjak import ByteOrder, dump_int32, parse_uint16
 
 
 class TestByteOrder:
@@ -10,3 +11,25 @@ class TestByteOrder:
         else:
             assert ByteOrder.NATIVE != ByteOrder.LITTLE
             assert ByteOrder.NATIVE == ByteOrder.BIG
+
+    def test_lookup_by_name(self):
+        assert ByteOrder("little") == ByteOrder("le") == ByteOrder.LITTLE
+        assert ByteOrder("<") == ByteOrder.LITTLE
+        assert ByteOrder("BIG") == ByteOrder("be") == ByteOrder.BIG
+        assert ByteOrder(">") == ByteOrder("!") == ByteOrder.BIG
+        assert ByteOrder("network") == ByteOrder.BIG
+        assert ByteOrder("native") == ByteOrder("=") == ByteOrder.NATIVE
+
+    def test_lookup_raises_value_error_on_invalid_name(self):
+        with pytest.raises(ValueError):
+            ByteOrder("middle")
+
+    def test_conversion_accepts_looked_up_order(self):
+        assert parse_uint16(b"\x01\x00", ByteOrder("le")) == 1
+        assert dump_int32(1, ByteOrder("be")) == b"\x00\x00\x00\x01"
+
+    def test_conversion_raises_type_error_on_name(self):
+        with pytest.raises(TypeError, match="Expected object of ByteOrder"):
+            parse_uint16(b"\x01\x00", "le")
+        with pytest.raises(TypeError, match="Expected object of ByteOrder"):
+            dump_int32(1, "be")
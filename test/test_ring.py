@@ -0,0 +1,179 @@
+import multiprocessing
+import os
+import pytest
+import subprocess
+import sys
+import time
+from multiprocessing import shared_memory
+import pyjak
+from pyjak import (
+    BinaryError, BinarySizeMismatch, ByteOrder, DataType, Layout,
+    PrefixedString, SharedRing)
+
+_SAMPLE = Layout([
+    ("seq", DataType.UINT64), ("value", DataType.FLOAT64),
+    ("valid", DataType.BOOL)])
+_SAMPLES = [
+    {"seq": i, "value": i / 4, "valid": i % 2 == 0} for i in range(10)]
+_OTHER = Layout([("seq", DataType.UINT32)])
+_INVALID = "invalid"
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(pyjak.__file__)))
+_ATTACH_SCRIPT = """
+import sys
+from pyjak import ByteOrder, DataType, Layout, SharedRing
+layout = Layout([
+    ("seq", DataType.UINT64), ("value", DataType.FLOAT64),
+    ("valid", DataType.BOOL)])
+with SharedRing(sys.argv[1], layout, order=ByteOrder.BIG) as ring:
+    print(ring.get()["seq"])
+"""
+
+
+@pytest.fixture
+def ring():
+    ring = SharedRing(
+        "pyjak-test-{0}".format(os.getpid()), _SAMPLE, 4, ByteOrder.BIG)
+    yield ring
+    ring.close()
+    ring.unlink()
+
+
+def _forward(name, target, count):
+    # Runs in a child process, passing records on from one ring to another.
+    with SharedRing(name, _SAMPLE, order=ByteOrder.BIG) as source:
+        with SharedRing(target, _SAMPLE, order=ByteOrder.BIG) as output:
+            forwarded = 0
+            while forwarded < count:
+                for record in source.get_many():
+                    record["value"] *= 2
+                    while not output.put(record):
+                        time.sleep(0.001)
+                    forwarded += 1
+
+
+class TestSharedRing:
+    def test_put_get(self, ring):
+        assert ring.put(_SAMPLES[0])
+        assert len(ring) == 1
+        assert ring.get() == _SAMPLES[0]
+        assert ring.get() is None
+
+    def test_put_returns_false_when_full(self, ring):
+        for sample in _SAMPLES[:4]:
+            assert ring.put(sample)
+        assert not ring.put(_SAMPLES[4])
+        assert len(ring) == ring.capacity == 4
+
+    def test_put_many_get_many_wraps_around(self, ring):
+        assert ring.put_many(_SAMPLES[:3]) == 3
+        assert ring.get_many(2) == _SAMPLES[:2]
+        assert ring.put_many(iter(_SAMPLES[3:])) == 3
+        assert ring.get_many() == _SAMPLES[2:6]
+
+    def test_attach(self, ring):
+        with SharedRing(ring.name, _SAMPLE, order=ByteOrder.BIG) as attached:
+            assert attached.capacity == 4
+            ring.put(_SAMPLES[1])
+            assert attached.get() == _SAMPLES[1]
+        assert len(ring) == 0
+
+    def test_attach_from_independent_process(self, ring):
+        # A separately started interpreter has a resource tracker of its own,
+        # which must not unlink the block when the interpreter exits.
+        ring.put_many(_SAMPLES[:2])
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [_ROOT, env.get("PYTHONPATH")]))
+        for expected in ("0", "1"):
+            result = subprocess.run(
+                [sys.executable, "-c", _ATTACH_SCRIPT, ring.name], env=env,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                universal_newlines=True, timeout=60)
+            assert result.returncode == 0, result.stderr
+            assert result.stdout.strip() == expected
+            assert "leaked" not in result.stderr
+        with SharedRing(ring.name, _SAMPLE, order=ByteOrder.BIG) as attached:
+            assert attached.capacity == 4
+
+    def test_peek_consume(self, ring):
+        ring.put_many(_SAMPLES[:3])
+        ring.get()
+        ring.put_many(_SAMPLES[3:5])
+        view = ring.peek()
+        assert view.tobytes() == b"".join(
+            _SAMPLE.dump(sample, ByteOrder.BIG) for sample in _SAMPLES[1:4])
+        view.release()
+        ring.consume(3)
+        assert ring.get_many() == [_SAMPLES[4]]
+
+    def test_peek_max_count(self, ring):
+        ring.put_many(_SAMPLES)
+        with ring.peek(1) as view:
+            assert len(view) == _SAMPLE.size
+
+    def test_consume_raises_value_error_on_too_many(self, ring):
+        ring.put(_SAMPLES[0])
+        with pytest.raises(ValueError, match="the ring holds 1"):
+            ring.consume(2)
+
+    def test_put_raises_mismatch_error_on_mismatch(self, ring):
+        with pytest.raises(BinarySizeMismatch, match="field 'seq'"):
+            ring.put({"seq": -1, "value": 0.0, "valid": True})
+        assert len(ring) == 0
+
+    def test_attach_raises_binary_error_on_other_layout(self, ring):
+        with pytest.raises(BinaryError, match="records of 17 bytes"):
+            SharedRing(ring.name, _OTHER)
+
+    def test_raises_value_error_on_variable_layout(self):
+        layout = Layout([("name", PrefixedString(DataType.UINT8))])
+        with pytest.raises(ValueError, match="Expected layout of fixed size"):
+            SharedRing("pyjak-test-variable", layout, 4)
+
+    def test_raises_value_error_on_invalid_capacity(self):
+        with pytest.raises(ValueError, match="Capacity must be positive"):
+            SharedRing("pyjak-test-capacity", _SAMPLE, 0)
+        with pytest.raises(ValueError, match="Capacity must be positive"):
+            SharedRing("pyjak-test-capacity", _SAMPLE, 2.5)
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory("pyjak-test-capacity")
+
+    def test_invalid_order_leaves_no_block(self):
+        name = "pyjak-test-order-{0}".format(os.getpid())
+        with pytest.raises(TypeError, match="Expected object of ByteOrder"):
+            SharedRing(name, _SAMPLE, 4, _INVALID)
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name)
+
+    def test_attach_raises_binary_error_on_truncated_block(self, ring):
+        with SharedRing(ring.name, _SAMPLE, order=ByteOrder.BIG) as attached:
+            attached._control[1] = 1000
+        with pytest.raises(BinaryError, match="does not fit"):
+            SharedRing(ring.name, _SAMPLE, order=ByteOrder.BIG)
+
+    def test_between_processes(self, ring):
+        name = "pyjak-test-output-{0}".format(os.getpid())
+        with SharedRing(name, _SAMPLE, 4, ByteOrder.BIG) as output:
+            count = 200
+            process = multiprocessing.Process(
+                target=_forward, args=(ring.name, name, count))
+            process.start()
+            try:
+                received = []
+                pending = ({
+                    "seq": i, "value": i / 4, "valid": i % 2 == 0}
+                    for i in range(count))
+                sent = 0
+                deadline = time.monotonic() + 30
+                while len(received) < count:
+                    assert time.monotonic() < deadline
+                    sent += ring.put_many(pending)
+                    received.extend(output.get_many())
+                process.join(30)
+                assert process.exitcode == 0
+            finally:
+                if process.is_alive():
+                    process.terminate()
+                output.unlink()
+        assert [record["seq"] for record in received] == list(range(count))
+        assert received[7]["value"] == 3.5
@@ -0,0 +1,85 @@
+import pytest
+import re
+import struct
+from pyjak import BinarySizeMismatch, DataType, dump, parse, sizeof
+
+_INVALID = "invalid"
+_UNKNOWN_SPEC_REGEX = re.compile("Unknown type spec '\w+'.")
+_TYPE_ERROR_SPEC_REGEX = re.compile(
+    "Expected object of str or DataType type, not '\w+'.")
+_TYPE_ERROR_BYTES_REGEX = re.compile(
+    "Expected object of bytes-like type, not '\w+'.")
+_TYPE_ERROR_NUMBER_REGEX = re.compile(
+    "Expected object of number-like type, not '\w+'.")
+_MISMATCH_REGEX = re.compile("Length of byte array is \d+, expected \d+.")
+
+
+class TestParse:
+    def test_parse_long_names(self):
+        assert parse(b"\x00\x00\x01\x00", "int32be") == 256
+        assert parse(b"\x00\x00\x01\x00", "uint32le") == 65536
+        assert parse(struct.pack("<d", 1.5), "float64_le") == 1.5
+
+    def test_parse_short_names(self):
+        assert parse(b"\xff\xfe", "u16be") == 65534
+        assert parse(b"\xff\xfe", "i16<") == -257
+        assert parse(struct.pack(">f", 0.25), "f32!") == 0.25
+        assert parse(b"\x80", "i8") == -128
+
+    def test_parse_defaults_to_native(self):
+        assert parse(struct.pack("=q", -5), "int64") == -5
+        assert parse(struct.pack("=Q", 5), " U64 ") == 5
+
+    def test_parse_data_type(self):
+        assert parse(struct.pack("=H", 9), DataType.UINT16) == 9
+        assert parse(b"\x02", DataType.BOOL) is True
+
+    def test_parse_memoryview(self):
+        assert parse(memoryview(b"\x01\x00"), "u16le") == 1
+
+    def test_parse_raises_value_error_on_unknown_spec(self):
+        with pytest.raises(ValueError, match=_UNKNOWN_SPEC_REGEX):
+            parse(b"\x00", "int7")
+        with pytest.raises(ValueError, match=_UNKNOWN_SPEC_REGEX):
+            parse(b"\x00", "be")
+
+    def test_parse_raises_type_error_on_invalid_spec(self):
+        with pytest.raises(TypeError, match=_TYPE_ERROR_SPEC_REGEX):
+            parse(b"\x00", 4)
+
+    def test_parse_raises_type_error_on_invalid_bytes(self):
+        with pytest.raises(TypeError, match=_TYPE_ERROR_BYTES_REGEX):
+            parse(_INVALID, "u16be")
+
+    def test_parse_raises_mismatch_error_on_mismatch(self):
+        with pytest.raises(BinarySizeMismatch, match=_MISMATCH_REGEX):
+            parse(b"\x00\x00\x00", "u32be")
+
+
+class TestDump:
+    def test_dump(self):
+        assert dump(258, "uint16be") == b"\x01\x02"
+        assert dump(258, "u16le") == b"\x02\x01"
+        assert dump(-1, "i8") == b"\xff"
+        assert dump(True, "bool") == b"\x01"
+        assert dump(0.25, DataType.FLOAT64) == struct.pack("=d", 0.25)
+
+    def test_dump_raises_mismatch_error_on_mismatch(self):
+        with pytest.raises(BinarySizeMismatch):
+            dump(65536, "u16be")
+        with pytest.raises(BinarySizeMismatch):
+            dump(3.4e39, "f32")
+
+    def test_dump_raises_type_error_on_invalid_type(self):
+        with pytest.raises(TypeError, match=_TYPE_ERROR_NUMBER_REGEX):
+            dump(_INVALID, "i64be")
+        with pytest.raises(TypeError):
+            dump(1, "bool")
+
+
+class TestSizeof:
+    def test_sizeof(self):
+        assert sizeof("u8") == 1
+        assert sizeof("int16be") == 2
+        assert sizeof("f32<") == 4
+        assert sizeof(DataType.UINT64) == 8
@@ -0,0 +1,237 @@
+import bz2
+import errno
+import gzip
+import io
+import lzma
+import pytest
+import re
+import struct
+import zlib
+from pyjak import (
+    BinaryError, BinaryReader, BinarySizeMismatch, BinaryWriter, ByteOrder,
+    Checksum, ChecksumMismatch, Compression, DataType, Layout,
+    PrefixedString, dump_uint16)
+
+_POINT = Layout([("x", DataType.INT32), ("y", DataType.FLOAT64)])
+_POINTS = [{"x": i, "y": i / 2} for i in range(1000)]
+_POINTS_BIG = b"".join(struct.pack(">id", p["x"], p["y"]) for p in _POINTS)
+
+_NAME = Layout([
+    ("id", DataType.UINT16), ("name", PrefixedString(DataType.UINT8))])
+_NAMES = [{"id": i, "name": "name {0}".format(i)} for i in range(300)]
+
+_COMPRESS = {
+    Compression.NONE: bytes,
+    Compression.ZLIB: zlib.compress,
+    Compression.GZIP: gzip.compress,
+    Compression.LZMA: lzma.compress,
+    Compression.BZ2: bz2.compress,
+}
+_DECOMPRESS = {
+    Compression.NONE: bytes,
+    Compression.ZLIB: zlib.decompress,
+    Compression.GZIP: gzip.decompress,
+    Compression.LZMA: lzma.decompress,
+    Compression.BZ2: bz2.decompress,
+}
+
+_FRAMED = b"".join(
+    _POINTS_BIG[start:start + 1200] + zlib.crc32(
+        _POINTS_BIG[start:start + 1200]).to_bytes(4, "big")
+    for start in range(0, len(_POINTS_BIG), 1200))
+
+_INVALID = "invalid"
+_TYPE_ERROR_CHECKSUM_REGEX = re.compile(
+    "Expected object of Checksum type, not '\w+'.")
+_TYPE_ERROR_COMPRESSION_REGEX = re.compile(
+    "Expected object of Compression type, not '\w+'.")
+_ENDED_REGEX = re.compile("Stream ended after \d+ of \d+ bytes.")
+
+
+class _FailingFile(io.RawIOBase):
+    # A file whose reads fail like a broken disk.
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        raise OSError(errno.EIO, "Input/output error")
+
+
+@pytest.mark.parametrize("compression", list(Compression))
+class TestBinaryReaderCompression:
+    def test_iter_records(self, compression):
+        source = io.BytesIO(_COMPRESS[compression](_POINTS_BIG))
+        reader = BinaryReader(source, compression, chunk_size=100)
+        assert list(reader.iter_records(_POINT, ByteOrder.BIG)) == _POINTS
+
+    def test_iter_records_variable(self, compression):
+        data = b"".join(_NAME.dump(name) for name in _NAMES)
+        source = io.BytesIO(_COMPRESS[compression](data))
+        reader = BinaryReader(source, compression, chunk_size=7)
+        assert list(reader.iter_records(_NAME)) == _NAMES
+
+
+@pytest.mark.parametrize("compression", list(Compression))
+class TestBinaryWriterCompression:
+    def test_write_record(self, compression):
+        target = io.BytesIO()
+        with BinaryWriter(target, compression, chunk_size=100) as writer:
+            for point in _POINTS:
+                writer.write_record(point, _POINT, ByteOrder.BIG)
+        assert _DECOMPRESS[compression](target.getvalue()) == _POINTS_BIG
+
+
+class TestBinaryReader:
+    def test_read_value(self):
+        reader = BinaryReader(io.BytesIO(b"\x01\x02\x03\xff"))
+        assert reader.read_value(DataType.UINT16, ByteOrder.BIG) == 258
+        assert reader.read_value(DataType.UINT8) == 3
+        assert reader.read_value(DataType.INT8) == -1
+
+    def test_read_bytes(self):
+        reader = BinaryReader(io.BytesIO(b"abcdef"), chunk_size=4)
+        assert reader.read_bytes(2) == b"ab"
+        assert reader.read_bytes(4) == b"cdef"
+
+    def test_read_from_path(self, tmpdir):
+        path = str(tmpdir.join("points.gz"))
+        with open(path, "wb") as file:
+            file.write(gzip.compress(_POINTS_BIG))
+        with BinaryReader(path, Compression.GZIP) as reader:
+            assert reader.read_record(_POINT, ByteOrder.BIG) == _POINTS[0]
+
+    def test_read_leaves_file_object_open(self):
+        source = io.BytesIO(b"\x00")
+        BinaryReader(source).close()
+        assert not source.closed
+
+    def test_read_value_raises_mismatch_error_on_end(self):
+        reader = BinaryReader(io.BytesIO(b"\x00\x00\x00"))
+        with pytest.raises(BinarySizeMismatch, match=_ENDED_REGEX):
+            reader.read_value(DataType.INT32)
+
+    def test_read_record_raises_mismatch_error_on_end(self):
+        data = _NAME.dump(_NAMES[0])
+        reader = BinaryReader(io.BytesIO(data[:-1]))
+        with pytest.raises(BinarySizeMismatch, match="Stream ended"):
+            reader.read_record(_NAME)
+
+    def test_iter_records_raises_mismatch_error_on_partial_record(self):
+        reader = BinaryReader(io.BytesIO(_POINTS_BIG[:20]))
+        with pytest.raises(BinarySizeMismatch, match=_ENDED_REGEX):
+            list(reader.iter_records(_POINT, ByteOrder.BIG))
+
+    def test_read_record_raises_mismatch_error_on_limit(self):
+        layout = Layout([("name", PrefixedString(DataType.UINT8, 4))])
+        reader = BinaryReader(io.BytesIO(b"\x05hello"))
+        with pytest.raises(BinarySizeMismatch, match="exceeds the maximum"):
+            reader.read_record(layout)
+
+    def test_read_raises_binary_error_on_truncated_stream(self):
+        data = zlib.compress(_POINTS_BIG)[:-10]
+        reader = BinaryReader(io.BytesIO(data), Compression.ZLIB)
+        with pytest.raises(BinaryError, match="Could not decompress"):
+            list(reader.iter_records(_POINT))
+
+    def test_read_raises_binary_error_on_invalid_stream(self):
+        for compression in (Compression.ZLIB, Compression.GZIP,
+                            Compression.LZMA, Compression.BZ2):
+            reader = BinaryReader(io.BytesIO(_POINTS_BIG * 3), compression)
+            with pytest.raises(BinaryError, match="Could not decompress"):
+                reader.read_bytes(1)
+
+    def test_read_passes_on_io_errors(self):
+        for compression in Compression:
+            reader = BinaryReader(_FailingFile(), compression)
+            with pytest.raises(OSError) as info:
+                reader.read_bytes(1)
+            assert info.value.errno == errno.EIO
+
+    def test_reader_raises_type_error_on_invalid_compression(self):
+        with pytest.raises(TypeError, match=_TYPE_ERROR_COMPRESSION_REGEX):
+            BinaryReader(io.BytesIO(), _INVALID)
+
+
+class TestBinaryReaderChecksum:
+    def test_verify_checksum(self):
+        reader = BinaryReader(io.BytesIO(_FRAMED), chunk_size=1000)
+        points = []
+        for _ in range(len(_POINTS) // 100):
+            reader.begin_checksum()
+            points.extend(
+                reader.read_record(_POINT, ByteOrder.BIG) for _ in range(100))
+            reader.verify_checksum(ByteOrder.BIG)
+        assert points == _POINTS
+
+    def test_end_checksum_adler32(self):
+        reader = BinaryReader(io.BytesIO(_POINTS_BIG), chunk_size=7)
+        reader.read_bytes(3)
+        reader.begin_checksum(Checksum.ADLER32)
+        reader.read_bytes(1000)
+        assert reader.end_checksum() == zlib.adler32(_POINTS_BIG[3:1003])
+
+    def test_verify_checksum_raises_mismatch_on_corruption(self):
+        framed = bytearray(_FRAMED)
+        framed[10] ^= 1
+        reader = BinaryReader(io.BytesIO(framed))
+        reader.begin_checksum()
+        reader.read_bytes(1200)
+        with pytest.raises(ChecksumMismatch, match="Checksum read is 0x"):
+            reader.verify_checksum(ByteOrder.BIG)
+
+    def test_end_checksum_raises_value_error_without_begin(self):
+        reader = BinaryReader(io.BytesIO())
+        with pytest.raises(ValueError, match="No checksum has been begun."):
+            reader.end_checksum()
+
+    def test_begin_checksum_raises_type_error_on_invalid_checksum(self):
+        reader = BinaryReader(io.BytesIO())
+        with pytest.raises(TypeError, match=_TYPE_ERROR_CHECKSUM_REGEX):
+            reader.begin_checksum(_INVALID)
+
+
+class TestBinaryWriterChecksum:
+    def test_write_checksum(self):
+        target = io.BytesIO()
+        with BinaryWriter(target, chunk_size=500) as writer:
+            for start in range(0, len(_POINTS), 100):
+                writer.begin_checksum()
+                for point in _POINTS[start:start + 100]:
+                    writer.write_record(point, _POINT, ByteOrder.BIG)
+                writer.write_checksum(ByteOrder.BIG)
+        assert target.getvalue() == _FRAMED
+
+    def test_end_checksum_adler32(self):
+        writer = BinaryWriter(io.BytesIO(), chunk_size=10)
+        writer.write_bytes(b"skipped")
+        writer.begin_checksum(Checksum.ADLER32)
+        writer.write_bytes(_POINTS_BIG)
+        assert writer.end_checksum() == zlib.adler32(_POINTS_BIG)
+
+
+class TestBinaryWriter:
+    def test_write_value(self):
+        target = io.BytesIO()
+        with BinaryWriter(target) as writer:
+            writer.write_value(258, DataType.UINT16, ByteOrder.BIG)
+            writer.write_value(-1, DataType.INT8)
+            writer.write(dump_uint16, 1, ByteOrder.LITTLE)
+            writer.write_bytes(b"end")
+        assert target.getvalue() == b"\x01\x02\xff\x01\x00end"
+        assert not target.closed
+
+    def test_write_to_path(self, tmpdir):
+        path = str(tmpdir.join("points.xz"))
+        with BinaryWriter(path, Compression.LZMA) as writer:
+            writer.write_bytes(_POINTS_BIG)
+        with open(path, "rb") as file:
+            assert lzma.decompress(file.read()) == _POINTS_BIG
+
+    def test_write_value_raises_mismatch_error_on_mismatch(self):
+        writer = BinaryWriter(io.BytesIO())
+        with pytest.raises(BinarySizeMismatch):
+            writer.write_value(256, DataType.UINT8)
+
+    def test_writer_raises_type_error_on_invalid_compression(self):
+        with pytest.raises(TypeError, match=_TYPE_ERROR_COMPRESSION_REGEX):
+            BinaryWriter(io.BytesIO(), _INVALID)